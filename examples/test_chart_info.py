@@ -9,20 +9,31 @@ Tests:
 4. Combined moon phase and chart info
 """
 
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
 from starlight import ChartBuilder, draw_chart
 
 
-def test_moon_positions():
+def _calculate_einstein_chart():
+    """Every section draws the same chart (a notable avoids geocoding issues)."""
+    return ChartBuilder.from_notable("Albert Einstein").calculate()
+
+
+@pytest.fixture(scope="session")
+def einstein_chart():
+    """Calculate the shared chart once per pytest session."""
+    return _calculate_einstein_chart()
+
+
+def test_moon_positions(einstein_chart):
     """Test moon phase in different positions."""
     print("Testing moon phase positions...")
 
-    # Use a notable chart to avoid geocoding issues
-    chart = ChartBuilder.from_notable("Albert Einstein").calculate()
-
     # Test 1: Moon in center (default)
     draw_chart(
-        chart,
+        einstein_chart,
         filename="examples/chart_examples/moon_center.svg",
         moon_phase=True,
         moon_phase_position="center",
@@ -32,7 +43,7 @@ def test_moon_positions():
 
     # Test 2: Moon in top-right with label
     draw_chart(
-        chart,
+        einstein_chart,
         filename="examples/chart_examples/moon_top_right_labeled.svg",
         moon_phase=True,
         moon_phase_position="top-right",
@@ -42,7 +53,7 @@ def test_moon_positions():
 
     # Test 3: Moon in bottom-left with label
     draw_chart(
-        chart,
+        einstein_chart,
         filename="examples/chart_examples/moon_bottom_left_labeled.svg",
         moon_phase=True,
         moon_phase_position="bottom-left",
@@ -51,15 +62,13 @@ def test_moon_positions():
     print("✓ Generated: moon_bottom_left_labeled.svg")
 
 
-def test_chart_info():
+def test_chart_info(einstein_chart):
     """Test chart info display."""
     print("\nTesting chart info display...")
 
-    chart = ChartBuilder.from_notable("Albert Einstein").calculate()
-
     # Test 4: Chart info in top-left
     draw_chart(
-        chart,
+        einstein_chart,
         filename="examples/chart_examples/chart_info_top_left.svg",
         moon_phase=False,
         chart_info=True,
@@ -69,7 +78,7 @@ def test_chart_info():
 
     # Test 5: Chart info in top-right
     draw_chart(
-        chart,
+        einstein_chart,
         filename="examples/chart_examples/chart_info_top_right.svg",
         moon_phase=False,
         chart_info=True,
@@ -78,15 +87,13 @@ def test_chart_info():
     print("✓ Generated: chart_info_top_right.svg")
 
 
-def test_combined():
+def test_combined(einstein_chart):
     """Test combined moon phase and chart info."""
     print("\nTesting combined features...")
 
-    chart = ChartBuilder.from_notable("Albert Einstein").calculate()
-
     # Test 6: Moon in bottom-right, chart info in top-left
     draw_chart(
-        chart,
+        einstein_chart,
         filename="examples/chart_examples/combined_moon_and_info.svg",
         moon_phase=True,
         moon_phase_position="bottom-right",
@@ -98,7 +105,7 @@ def test_combined():
 
     # Test 7: Moon in top-right, chart info in top-left (showing full aspect lines)
     draw_chart(
-        chart,
+        einstein_chart,
         filename="examples/chart_examples/moon_corner_full_aspects.svg",
         moon_phase=True,
         moon_phase_position="top-right",
@@ -110,15 +117,13 @@ def test_combined():
     print("✓ Generated: moon_corner_full_aspects.svg (with dark theme)")
 
 
-def test_notable():
+def test_notable(einstein_chart):
     """Test with a notable chart."""
     print("\nTesting with notable (Albert Einstein)...")
 
-    chart = ChartBuilder.from_notable("Albert Einstein").calculate()
-
     # Test 8: Full-featured chart with notable
     draw_chart(
-        chart,
+        einstein_chart,
         filename="examples/chart_examples/einstein_full_featured.svg",
         moon_phase=True,
         moon_phase_position="bottom-right",
@@ -136,10 +141,15 @@ if __name__ == "__main__":
     print("Chart Info & Moon Phase Positioning Test Suite")
     print("=" * 60)
 
-    test_moon_positions()
-    test_chart_info()
-    test_combined()
-    test_notable()
+    # Calculate the shared chart once here and pickle it to the workers
+    chart = _calculate_einstein_chart()
+
+    # The sections draw independent charts, so render them in parallel
+    # worker processes (their progress lines may interleave)
+    sections = [test_moon_positions, test_chart_info, test_combined, test_notable]
+    with ProcessPoolExecutor() as executor:
+        for future in [executor.submit(section, chart) for section in sections]:
+            future.result()
 
     print("\n" + "=" * 60)
     print("All tests completed! Check examples/chart_examples/ for results.")
@@ -72,6 +72,9 @@ class Comparison:
     their interactions.
     """
 
+    # Counterpart of CalculatedChart.__starlight_kind__ (not a dataclass field)
+    __starlight_kind__ = "comparison"
+
     # Chart identification
     comparison_type: ComparisonType
 
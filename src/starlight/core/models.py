@@ -330,6 +330,10 @@ class CalculatedChart:
     you need to analyze or visualize the chart.
     """
 
+    # Lets the visualization layer tell charts and comparisons apart without
+    # importing starlight.core.comparison (not a dataclass field)
+    __starlight_kind__ = "chart"
+
     # Input parameters
     datetime: ChartDateTime
     location: ChartLocation
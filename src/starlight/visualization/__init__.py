@@ -2,7 +2,12 @@
 
 from .builder import ChartDrawBuilder
 from .core import ChartRenderer
-from .drawing import draw_chart, draw_comparison_chart
+from .drawing import (
+    draw_chart,
+    draw_charts_batch,
+    draw_comparison_chart,
+    make_chart_renderer,
+)
 from .extended_canvas import AspectarianLayer, HouseCuspTableLayer, PositionTableLayer
 from .layers import (
     AngleLayer,
@@ -24,6 +29,7 @@ from .palettes import (
     get_aspect_palette_colors,
     get_aspect_palette_description,
     get_palette_colors,
+    get_palette_colors_rgb,
     get_palette_description,
     get_planet_glyph_color,
     get_planet_glyph_palette_description,
@@ -54,6 +60,8 @@ __all__ = [
     "ChartDrawBuilder",
     "draw_chart",
     "draw_comparison_chart",
+    "make_chart_renderer",
+    "draw_charts_batch",
     # Layers
     "ZodiacLayer",
     "HouseCuspLayer",
@@ -74,6 +82,7 @@ __all__ = [
     "AspectPalette",
     "PlanetGlyphPalette",
     "get_palette_colors",
+    "get_palette_colors_rgb",
     "get_palette_description",
     "get_aspect_palette_colors",
     "get_aspect_palette_description",
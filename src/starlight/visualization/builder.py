@@ -5,14 +5,41 @@ Provides a convenient, discoverable API for creating chart visualizations
 with presets and easy customization.
 """
 
-from typing import Any
+from __future__ import annotations
 
-from starlight.core.comparison import Comparison
-from starlight.core.models import CalculatedChart
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from starlight.core.comparison import Comparison
+    from starlight.core.models import CalculatedChart
 
 # Sentinel value to indicate "use theme's default colorful palette"
 _USE_THEME_DEFAULT_PALETTE = object()
 
+# Stand-in for the sentinel in serialized specs (the sentinel itself is not
+# JSON-serializable and loses its identity when pickled)
+_THEME_DEFAULT_PALETTE_SPEC = "__theme_default__"
+
+# Default moon phase settings; builders copy this and override fields.
+# "display" is True, or "chart1" to show only the inner chart's moon on
+# comparisons; position/size/label_size None = auto-detect
+_DEFAULT_MOON_PHASE_CONFIG: dict[str, Any] = {
+    "display": True,
+    "position": None,
+    "show_label": True,
+    "size": None,
+    "label_size": None,
+}
+
+
+def _freeze(value: Any) -> Any:
+    """Convert option values (lists, dicts) into hashable equivalents."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, list | tuple | set):
+        return tuple(_freeze(v) for v in value)
+    return value
+
 
 class ChartDrawBuilder:
     """
@@ -37,6 +64,20 @@ class ChartDrawBuilder:
         comparison.draw("synastry.svg").preset_synastry().save()
     """
 
+    # Options passed straight through to both draw functions; each key is
+    # stored on the builder as an attribute of the same name with a leading "_"
+    _BASE_OPTION_KEYS: tuple[str, ...] = (
+        "filename",
+        "size",
+        "theme",
+        "zodiac_palette",
+        "aspect_palette",
+        "planet_glyph_palette",
+        "color_sign_info",
+        "chart_info",
+        "aspect_counts",
+    )
+
     def __init__(self, chart: CalculatedChart | Comparison):
         """
         Initialize the builder.
@@ -45,7 +86,10 @@ class ChartDrawBuilder:
             chart: The chart or comparison to visualize
         """
         self._chart = chart
-        self._is_comparison = isinstance(chart, Comparison)
+        # Duck-typed so single-chart rendering never imports core.comparison
+        self._is_comparison = (
+            getattr(chart, "__starlight_kind__", None) == "comparison"
+        )
 
         # Core settings
         self._filename = "chart.svg"
@@ -58,12 +102,10 @@ class ChartDrawBuilder:
         self._planet_glyph_palette: str | None = None
         self._color_sign_info = False
 
-        # Moon phase
-        self._moon_phase = True
-        self._moon_phase_position = None  # Auto-detect based on aspects
-        self._moon_phase_show_label = True
-        self._moon_phase_size: int | None = None
-        self._moon_phase_label_size: str | None = None
+        # Moon phase (None = disabled)
+        self._moon_phase_config: dict[str, Any] | None = dict(
+            _DEFAULT_MOON_PHASE_CONFIG
+        )
 
         # Corner elements
         self._chart_info = False
@@ -90,7 +132,7 @@ class ChartDrawBuilder:
         # House systems (default: None = use chart's default, can be list of names or "all")
         self._house_systems: list[str] | str | None = None
 
-    def with_filename(self, filename: str) -> "ChartDrawBuilder":
+    def with_filename(self, filename: str) -> ChartDrawBuilder:
         """
         Set the output filename.
 
@@ -103,7 +145,7 @@ class ChartDrawBuilder:
         self._filename = filename
         return self
 
-    def with_size(self, size: int) -> "ChartDrawBuilder":
+    def with_size(self, size: int) -> ChartDrawBuilder:
         """
         Set the chart size in pixels.
 
@@ -116,7 +158,7 @@ class ChartDrawBuilder:
         self._size = size
         return self
 
-    def with_theme(self, theme: str) -> "ChartDrawBuilder":
+    def with_theme(self, theme: str) -> ChartDrawBuilder:
         """
         Set the chart theme.
 
@@ -129,7 +171,7 @@ class ChartDrawBuilder:
         self._theme = theme
         return self
 
-    def with_zodiac_palette(self, palette: str | None = None) -> "ChartDrawBuilder":
+    def with_zodiac_palette(self, palette: str | None = None) -> ChartDrawBuilder:
         """
         Set the zodiac ring color palette.
 
@@ -153,7 +195,7 @@ class ChartDrawBuilder:
             self._zodiac_palette = palette
         return self
 
-    def with_aspect_palette(self, palette: str) -> "ChartDrawBuilder":
+    def with_aspect_palette(self, palette: str) -> ChartDrawBuilder:
         """
         Set the aspect line color palette.
 
@@ -166,7 +208,7 @@ class ChartDrawBuilder:
         self._aspect_palette = palette
         return self
 
-    def with_planet_glyph_palette(self, palette: str) -> "ChartDrawBuilder":
+    def with_planet_glyph_palette(self, palette: str) -> ChartDrawBuilder:
         """
         Set the planet glyph color palette.
 
@@ -179,7 +221,7 @@ class ChartDrawBuilder:
         self._planet_glyph_palette = palette
         return self
 
-    def with_adaptive_colors(self, sign_info: bool = True) -> "ChartDrawBuilder":
+    def with_adaptive_colors(self, sign_info: bool = True) -> ChartDrawBuilder:
         """
         Enable adaptive coloring for sign glyphs in planet info stack.
 
@@ -196,7 +238,7 @@ class ChartDrawBuilder:
         self._color_sign_info = sign_info
         return self
 
-    def with_house_systems(self, systems: str | list[str]) -> "ChartDrawBuilder":
+    def with_house_systems(self, systems: str | list[str]) -> ChartDrawBuilder:
         """
         Configure multiple house systems to overlay on the chart.
 
@@ -228,7 +270,7 @@ class ChartDrawBuilder:
         show_label: bool = True,
         size: int | None = None,
         label_size: str | None = None,
-    ) -> "ChartDrawBuilder":
+    ) -> ChartDrawBuilder:
         """
         Configure moon phase display.
 
@@ -241,43 +283,36 @@ class ChartDrawBuilder:
         Returns:
             Self for chaining
         """
-        self._moon_phase = True
-        self._moon_phase_position = position
-        self._moon_phase_show_label = show_label
-
-        # Auto-size based on position if not specified
-        if size is not None:
-            self._moon_phase_size = size
-        elif position == "center":
-            self._moon_phase_size = 60
-        else:
-            self._moon_phase_size = 32
-
-        # Auto-size label based on position if not specified
-        if label_size is not None:
-            self._moon_phase_label_size = label_size
-        elif position == "center":
-            self._moon_phase_label_size = "14px"
-        else:
-            self._moon_phase_label_size = "11px"
-
+        # Auto-size moon and label based on position if not specified
+        if size is None:
+            size = 60 if position == "center" else 32
+        if label_size is None:
+            label_size = "14px" if position == "center" else "11px"
+
+        self._moon_phase_config = {
+            **_DEFAULT_MOON_PHASE_CONFIG,
+            "position": position,
+            "show_label": show_label,
+            "size": size,
+            "label_size": label_size,
+        }
         return self
 
-    def without_moon_phase(self) -> "ChartDrawBuilder":
+    def without_moon_phase(self) -> ChartDrawBuilder:
         """
         Disable moon phase display.
 
         Returns:
             Self for chaining
         """
-        self._moon_phase = False
+        self._moon_phase_config = None
         return self
 
     def with_chart_info(
         self,
         position: str = "top-left",
         fields: list[str] | None = None,
-    ) -> "ChartDrawBuilder":
+    ) -> ChartDrawBuilder:
         """
         Add chart information box.
 
@@ -293,7 +328,7 @@ class ChartDrawBuilder:
         self._chart_info_fields = fields
         return self
 
-    def with_aspect_counts(self, position: str = "top-right") -> "ChartDrawBuilder":
+    def with_aspect_counts(self, position: str = "top-right") -> ChartDrawBuilder:
         """
         Add aspect counts summary.
 
@@ -309,7 +344,7 @@ class ChartDrawBuilder:
 
     def with_element_modality_table(
         self, position: str = "bottom-left"
-    ) -> "ChartDrawBuilder":
+    ) -> ChartDrawBuilder:
         """
         Add element × modality cross-table.
 
@@ -323,7 +358,7 @@ class ChartDrawBuilder:
         self._element_modality_table_position = position
         return self
 
-    def with_chart_shape(self, position: str = "bottom-right") -> "ChartDrawBuilder":
+    def with_chart_shape(self, position: str = "bottom-right") -> ChartDrawBuilder:
         """
         Add chart shape detection display.
 
@@ -345,7 +380,7 @@ class ChartDrawBuilder:
         show_house_cusps: bool = False,
         aspectarian_mode: str = "cross_chart",
         show_object_types: list[str] | None = None,
-    ) -> "ChartDrawBuilder":
+    ) -> ChartDrawBuilder:
         """
         Add extended canvas with position table and/or aspectarian grid.
 
@@ -400,7 +435,7 @@ class ChartDrawBuilder:
         self._table_object_types = show_object_types
         return self
 
-    def without_tables(self) -> "ChartDrawBuilder":
+    def without_tables(self) -> ChartDrawBuilder:
         """
         Disable extended canvas tables.
 
@@ -416,37 +451,36 @@ class ChartDrawBuilder:
 
     # === Preset Methods ===
 
-    def preset_minimal(self) -> "ChartDrawBuilder":
+    def preset_minimal(self) -> ChartDrawBuilder:
         """
         Minimal preset: Just the core chart with no decorations.
 
         Returns:
             Self for chaining
         """
-        self._moon_phase = False
+        self._moon_phase_config = None
         self._chart_info = False
         self._aspect_counts = False
         self._element_modality_table = False
         self._chart_shape = False
         return self
 
-    def preset_standard(self) -> "ChartDrawBuilder":
+    def preset_standard(self) -> ChartDrawBuilder:
         """
         Standard preset: Core chart with moon phase in center.
 
         Returns:
             Self for chaining
         """
-        self._moon_phase = True
-        self._moon_phase_position = None  # Auto-detect based on aspects
-        self._moon_phase_show_label = True
+        # Moon position auto-detected based on aspects
+        self._moon_phase_config = dict(_DEFAULT_MOON_PHASE_CONFIG)
         self._chart_info = False
         self._aspect_counts = False
         self._element_modality_table = False
         self._chart_shape = False
         return self
 
-    def preset_detailed(self) -> "ChartDrawBuilder":
+    def preset_detailed(self) -> ChartDrawBuilder:
         """
         Detailed preset: Chart with info boxes and moon phase.
 
@@ -461,9 +495,8 @@ class ChartDrawBuilder:
         Returns:
             Self for chaining
         """
-        self._moon_phase = True
-        self._moon_phase_position = None  # Auto-detect based on aspects
-        self._moon_phase_show_label = True
+        # Moon position auto-detected based on aspects
+        self._moon_phase_config = dict(_DEFAULT_MOON_PHASE_CONFIG)
 
         self._chart_info = True
         self._chart_info_position = "top-left"
@@ -480,7 +513,7 @@ class ChartDrawBuilder:
 
         return self
 
-    def preset_synastry(self) -> "ChartDrawBuilder":
+    def preset_synastry(self) -> ChartDrawBuilder:
         """
         Synastry preset: Optimized for relationship comparison charts.
 
@@ -496,9 +529,11 @@ class ChartDrawBuilder:
         if self._is_comparison:
             # Bi-wheel comparison chart
             # Moon in corner (show chart1's moon by default)
-            self._moon_phase = "chart1"
-            self._moon_phase_position = "bottom-right"
-            self._moon_phase_show_label = True
+            self._moon_phase_config = {
+                **_DEFAULT_MOON_PHASE_CONFIG,
+                "display": "chart1",
+                "position": "bottom-right",
+            }
 
             # Chart info for comparison metadata
             self._chart_info = True
@@ -517,9 +552,10 @@ class ChartDrawBuilder:
         else:
             # Standard natal chart synastry preset
             # Moon in corner to make room for annotations
-            self._moon_phase = True
-            self._moon_phase_position = "top-left"
-            self._moon_phase_show_label = True
+            self._moon_phase_config = {
+                **_DEFAULT_MOON_PHASE_CONFIG,
+                "position": "top-left",
+            }
 
             self._chart_info = True
             self._chart_info_position = "top-right"
@@ -531,6 +567,58 @@ class ChartDrawBuilder:
 
     # === Execute ===
 
+    def to_spec(self) -> dict[str, Any]:
+        """
+        Export the builder configuration as a plain, JSON-serializable dict.
+
+        The chart itself is not included, so the spec is cheap to pickle or
+        send to worker processes that already hold (or can look up) the chart.
+
+        Returns:
+            Mapping of option name to value (attribute names without the "_")
+
+        Example:
+            spec = chart.draw("a.svg").preset_detailed().to_spec()
+            # ... in a worker process:
+            ChartDrawBuilder.from_spec(chart, spec).with_filename("b.svg").save()
+        """
+        spec = {
+            name[1:]: value
+            for name, value in vars(self).items()
+            if name not in ("_chart", "_is_comparison")
+        }
+        if spec["zodiac_palette"] is _USE_THEME_DEFAULT_PALETTE:
+            spec["zodiac_palette"] = _THEME_DEFAULT_PALETTE_SPEC
+        return spec
+
+    @classmethod
+    def from_spec(
+        cls, chart: CalculatedChart | Comparison, spec: dict[str, Any]
+    ) -> ChartDrawBuilder:
+        """
+        Recreate a builder for a chart from a spec produced by to_spec().
+
+        Args:
+            chart: The chart or comparison to visualize
+            spec: Configuration dict as returned by to_spec()
+
+        Returns:
+            A configured builder, ready for further chaining or save()
+
+        Raises:
+            ValueError: If the spec contains unknown option names
+        """
+        builder = cls(chart)
+
+        unknown = set(spec) - builder.to_spec().keys()
+        if unknown:
+            raise ValueError(f"Unknown builder spec options: {sorted(unknown)}")
+
+        vars(builder).update({f"_{name}": value for name, value in spec.items()})
+        if builder._zodiac_palette == _THEME_DEFAULT_PALETTE_SPEC:
+            builder._zodiac_palette = _USE_THEME_DEFAULT_PALETTE
+        return builder
+
     def save(self) -> str:
         """
         Build and save the chart visualization.
@@ -544,76 +632,138 @@ class ChartDrawBuilder:
         # Import here to avoid circular dependency
         from starlight.visualization.drawing import draw_chart, draw_comparison_chart
 
-        # Build options dictionary (common to both chart types)
-        options = {
-            "filename": self._filename,
-            "size": self._size,
-            "theme": self._theme,
-            "zodiac_palette": self._zodiac_palette,
-            "aspect_palette": self._aspect_palette,
-            "planet_glyph_palette": self._planet_glyph_palette,
-            "color_sign_info": self._color_sign_info,
-            "moon_phase": self._moon_phase,
-            "moon_phase_position": self._moon_phase_position,
-            "chart_info": self._chart_info,
-            "aspect_counts": self._aspect_counts,
-        }
+        options = self._build_options()
 
-        # Add moon phase options if enabled
-        if self._moon_phase:
-            options["moon_phase_label"] = self._moon_phase_show_label
-            # NOTE: draw_chart doesn't currently support moon_phase_size or label_size customization
-            # These would need to be added to drawing.py first
+        # Branch based on chart type
+        if self._is_comparison:
+            # Comparison chart (bi-wheel)
+            filename = draw_comparison_chart(self._chart, **options)
+        else:
+            # Standard natal chart
+            filename = draw_chart(self._chart, **options)
 
-        # Add chart info options if enabled
-        if self._chart_info:
-            options["chart_info_position"] = self._chart_info_position
-            if self._chart_info_fields:
-                options["chart_info_fields"] = self._chart_info_fields
+        return filename
 
-        # Add aspect counts position if enabled
-        if self._aspect_counts:
-            options["aspect_counts_position"] = self._aspect_counts_position
+    def cache_key(self) -> tuple:
+        """
+        Return a hashable key identifying this chart + configuration.
+
+        Two builders with equal keys produce identical SVG output, so callers
+        can use the key to memoize renders. The output filename is
+        deliberately excluded, so the same render can be reused under a
+        different name. The chart is identified by id(), so hold a reference
+        to it for as long as the key is in use.
+
+        Returns:
+            Tuple of the chart identity and the frozen draw options
+        """
+        options = self._build_options()
+        del options["filename"]
+        return (id(self._chart), _freeze(options))
+
+    def _build_options(self) -> dict[str, Any]:
+        """
+        Translate the builder state into draw_chart/draw_comparison_chart kwargs.
+
+        Returns:
+            Keyword arguments for the draw function matching the chart type
+        """
+        # Options common to both chart types. The comprehension iterates a
+        # fixed-length tuple, so the dict is sized once up front.
+        base_options = {key: getattr(self, "_" + key) for key in self._BASE_OPTION_KEYS}
+
+        # Conditional fragments are built up front and merged once below,
+        # so the final options dict is allocated at its full size.
+        # NOTE: draw_chart doesn't currently support moon_phase_size or label_size
+        # customization. These would need to be added to drawing.py first.
+        moon_config = self._moon_phase_config
+        moon_phase_options = (
+            {"moon_phase": False}
+            if moon_config is None
+            else {
+                "moon_phase": moon_config["display"],
+                "moon_phase_position": moon_config["position"],
+                "moon_phase_label": moon_config["show_label"],
+            }
+        )
+        chart_info_options = (
+            {
+                "chart_info_position": self._chart_info_position,
+                **(
+                    {"chart_info_fields": self._chart_info_fields}
+                    if self._chart_info_fields
+                    else {}
+                ),
+            }
+            if self._chart_info
+            else {}
+        )
+        aspect_counts_options = (
+            {"aspect_counts_position": self._aspect_counts_position}
+            if self._aspect_counts
+            else {}
+        )
+        table_types_options = (
+            {"table_object_types": self._table_object_types}
+            if self._table_object_types is not None
+            else {}
+        )
 
-        # Branch based on chart type
         if self._is_comparison:
             # Comparison chart (bi-wheel)
-            # Add extended canvas if configured
-            if self._extended_canvas:
-                options["extended_canvas"] = self._extended_canvas
-                options["show_position_table"] = self._show_position_table
-                options["show_aspectarian"] = self._show_aspectarian
-                options["aspectarian_mode"] = self._aspectarian_mode
-                if self._table_object_types is not None:
-                    options["table_object_types"] = self._table_object_types
-
-            # Call draw_comparison_chart
-            return draw_comparison_chart(self._chart, **options)
+            extended_options = (
+                {
+                    "extended_canvas": self._extended_canvas,
+                    "show_position_table": self._show_position_table,
+                    "show_aspectarian": self._show_aspectarian,
+                    "aspectarian_mode": self._aspectarian_mode,
+                    **table_types_options,
+                }
+                if self._extended_canvas
+                else {}
+            )
+            return {
+                **base_options,
+                **moon_phase_options,
+                **chart_info_options,
+                **aspect_counts_options,
+                **extended_options,
+            }
 
         else:
             # Standard natal chart
-            # Add element/modality table position if enabled
-            options["element_modality_table"] = self._element_modality_table
-            if self._element_modality_table:
-                options["element_modality_position"] = self._element_modality_table_position
-
-            # Add chart shape position if enabled
-            options["chart_shape"] = self._chart_shape
-            if self._chart_shape:
-                options["chart_shape_position"] = self._chart_shape_position
-
-            # Add extended canvas if configured
-            if self._extended_canvas:
-                options["extended_canvas"] = self._extended_canvas
-                options["show_position_table"] = self._show_position_table
-                options["show_aspectarian"] = self._show_aspectarian
-                options["show_house_cusps"] = self._show_house_cusps
-                if self._table_object_types is not None:
-                    options["table_object_types"] = self._table_object_types
-
-            # Add house systems if configured
-            if self._house_systems is not None:
-                options["house_systems"] = self._house_systems
-
-            # Call draw_chart with all options
-            return draw_chart(self._chart, **options)
+            extended_options = (
+                {
+                    "extended_canvas": self._extended_canvas,
+                    "show_position_table": self._show_position_table,
+                    "show_aspectarian": self._show_aspectarian,
+                    "show_house_cusps": self._show_house_cusps,
+                    **table_types_options,
+                }
+                if self._extended_canvas
+                else {}
+            )
+            return {
+                **base_options,
+                **moon_phase_options,
+                **chart_info_options,
+                **aspect_counts_options,
+                "element_modality_table": self._element_modality_table,
+                **(
+                    {"element_modality_position": self._element_modality_table_position}
+                    if self._element_modality_table
+                    else {}
+                ),
+                "chart_shape": self._chart_shape,
+                **(
+                    {"chart_shape_position": self._chart_shape_position}
+                    if self._chart_shape
+                    else {}
+                ),
+                **extended_options,
+                **(
+                    {"house_systems": self._house_systems}
+                    if self._house_systems is not None
+                    else {}
+                ),
+            }
@@ -21,6 +21,8 @@ from starlight.core.registry import (
     get_object_info,
 )
 
+from .svg_writer import circle_path
+
 # Legacy glyph dictionaries - kept for backwards compatibility
 # Prefer using the registry via get_glyph() helper function
 PLANET_GLYPHS = {
@@ -183,8 +185,11 @@ class ChartRenderer:
         self.rotation = rotation
 
         # Initialize offsets (set by extended canvas mode in drawing.py)
-        self.x_offset = 0
-        self.y_offset = 0
+        self.set_offset(0, 0)
+
+        # (cos, sin) per SVG angle, shared by every layer that maps the same
+        # longitude (planet glyph, tick, aspect endpoint, ...)
+        self._unit_vectors: dict[float, tuple[float, float]] = {}
 
         # Store palette configurations
         self.zodiac_palette = zodiac_palette
@@ -248,6 +253,42 @@ class ChartRenderer:
                 else:
                     self.style[key] = value
 
+        # Colors for the extended-canvas tables (position table, house cusps,
+        # aspectarian), adapted to the final theme once
+        planet_style = self.style.get("planets", {})
+        self.extended_style = {
+            "text_color": planet_style.get("info_color", "#333333"),
+            "header_color": planet_style.get("glyph_color", "#222222"),
+            "grid_color": self.style.get("zodiac", {}).get("line_color", "#CCCCCC"),
+        }
+
+    def set_offset(self, x_offset: float, y_offset: float) -> None:
+        """
+        Position the chart on the canvas (used by extended canvas layouts).
+
+        Also precomputes `center_xy`, the chart center in canvas
+        coordinates, so layers and polar_to_cartesian don't re-add the
+        offsets on every call.
+        """
+        self._offset_xy = (x_offset, y_offset)
+        self.center_xy = (x_offset + self.center, y_offset + self.center)
+
+    @property
+    def x_offset(self) -> float:
+        return self._offset_xy[0]
+
+    @x_offset.setter
+    def x_offset(self, value: float) -> None:
+        self.set_offset(value, self._offset_xy[1])
+
+    @property
+    def y_offset(self) -> float:
+        return self._offset_xy[1]
+
+    @y_offset.setter
+    def y_offset(self, value: float) -> None:
+        self.set_offset(self._offset_xy[0], value)
+
     def _get_default_style(self) -> dict[str, Any]:
         """Provides the base styling configuration."""
         return {
@@ -328,18 +369,53 @@ class ChartRenderer:
         Converts an astrological degree (0 degrees Aries) and radius to an (x,y) coordinate.
         Accounts for extended canvas offsets when present.
         """
-        svg_angle_rad = math.radians(self.astrological_to_svg_angle(astro_deg))
+        svg_angle = self.astrological_to_svg_angle(astro_deg)
+        unit = self._unit_vectors.get(svg_angle)
+        if unit is None:
+            svg_angle_rad = math.radians(svg_angle)
+            unit = (math.cos(svg_angle_rad), math.sin(svg_angle_rad))
+            self._unit_vectors[svg_angle] = unit
 
         # SVG Y is inverted (positive is down)
-        # Add offsets for extended canvas positioning
-        x = self.x_offset + self.center + radius * math.cos(svg_angle_rad)
-        y = self.y_offset + self.center - radius * math.sin(svg_angle_rad)
+        # center_xy already includes the extended canvas offsets
+        cx, cy = self.center_xy
+        x = cx + radius * unit[0]
+        y = cy - radius * unit[1]
 
         return x, y
 
-    def create_svg_drawing(self, filename: str) -> svgwrite.Drawing:
-        """Creates the main SVG object and draws the background."""
-        dwg = svgwrite.Drawing(
+    def apply_padding(self, factor: float) -> None:
+        """
+        Scales every radius by `factor` (e.g. 0.95 to shrink the wheel by 5%).
+
+        The radii dict is updated in place, so anything holding a reference
+        to it sees the padded values.
+        """
+        self.radii.update({key: value * factor for key, value in self.radii.items()})
+
+    def has_border(self) -> bool:
+        """
+        Whether the style draws visible border circles.
+
+        A zero border_width or a "none"/"transparent" border_color (e.g. set
+        through style_config) turns the borders off entirely.
+        """
+        return self.style.get("border_width", 0) > 0 and self.style.get(
+            "border_color"
+        ) not in (None, "none", "transparent")
+
+    def create_svg_drawing(
+        self, filename: str, drawing_factory: Any = svgwrite.Drawing
+    ) -> svgwrite.Drawing:
+        """
+        Creates the main SVG object and draws the background.
+
+        Args:
+            filename: Output filename for the drawing.
+            drawing_factory: Drawing class to instantiate. Defaults to
+                svgwrite.Drawing; the draw_* functions pass FastSVGWriter.
+        """
+        dwg = drawing_factory(
             filename=filename,
             size=(f"{self.size}px", f"{self.size}px"),
             viewBox=f"0 0 {self.size} {self.size}",
@@ -355,22 +431,18 @@ class ChartRenderer:
             )
         )
 
-        # Add outer circle border
-        dwg.add(
-            dwg.circle(
-                center=(self.center, self.center),
-                r=self.radii["outer_border"],
-                fill="none",
-                stroke=self.style["border_color"],
-                stroke_width=self.style["border_width"],
-            )
-        )
+        if not self.has_border():
+            return dwg
 
-        # Add border circle at aspect ring inner radius
+        # The outer border and the aspect ring border share their stroke, so
+        # both circles go into a single <path>
+        borders = " ".join(
+            circle_path(self.center, self.center, self.radii[key])
+            for key in ("outer_border", "aspect_ring_inner")
+        )
         dwg.add(
-            dwg.circle(
-                center=(self.center, self.center),
-                r=self.radii["aspect_ring_inner"],
+            dwg.path(
+                d=borders,
                 fill="none",
                 stroke=self.style["border_color"],
                 stroke_width=self.style["border_width"],
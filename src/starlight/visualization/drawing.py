@@ -6,11 +6,26 @@ It uses the ChartRenderer and Layer classes from .core and .layers
 to assemble and render chart drawings.
 """
 
-from starlight.core.models import CalculatedChart, ObjectType
-
+import inspect
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+from enum import Enum
+from functools import lru_cache
+from itertools import repeat
+from typing import Any, NamedTuple
+
+from starlight.core.models import CalculatedChart, CelestialPosition, ObjectType
+
+from . import svg_writer
 from .builder import _USE_THEME_DEFAULT_PALETTE
 from .core import ChartRenderer, IRenderLayer
-from .extended_canvas import AspectarianLayer, HouseCuspTableLayer, PositionTableLayer
+from .extended_canvas import (
+    AspectarianLayer,
+    HouseCuspTableLayer,
+    PositionTableLayer,
+    _filter_objects_for_tables,
+)
 from .layers import (
     AngleLayer,
     AspectCountsLayer,
@@ -25,7 +40,87 @@ from .layers import (
 )
 from .moon_phase import MoonPhaseLayer
 from .palettes import ZodiacPalette
-from .themes import ChartTheme, get_theme_default_palette, get_theme_style
+from .svg_writer import FastSVGWriter, attr_value
+from .themes import (
+    ChartTheme,
+    get_theme_default_aspect_palette,
+    get_theme_default_palette,
+    get_theme_default_planet_palette,
+    get_theme_style,
+)
+
+# Object types drawn on the planet rings (includes nodes and points)
+_DRAWABLE_OBJECT_TYPES = frozenset(
+    {ObjectType.PLANET, ObjectType.ASTEROID, ObjectType.NODE, ObjectType.POINT}
+)
+
+# Radius scale applied when auto_padding kicks in (more than two corners
+# occupied): shrinks the wheel by 5% to leave room for the corner elements
+AUTO_PADDING_FACTOR = 0.95
+
+# Colors cycled through for overlay house systems (after the first)
+_OVERLAY_COLORS = ("#E74C3C", "#3498DB", "#2ECC71", "#F39C12", "#9B59B6")
+
+# Style shared by every overlay house system; only the color varies
+_OVERLAY_HOUSE_STYLE = {
+    "line_width": 0.5,
+    "line_dash": "5,5",
+    "fill_alternate": False,  # Don't fill for overlay systems
+}
+
+
+def _overlay_style(color: str) -> dict[str, Any]:
+    """Return a fresh HouseCuspLayer style override for an overlay system."""
+    return {**_OVERLAY_HOUSE_STYLE, "line_color": color, "number_color": color}
+
+
+# Extended-canvas mode -> (dw, dh, dx) in units of the caller's extra width
+# and height: how much the canvas grows and how far the chart shifts right
+_EXT_CANVAS_DELTAS = {
+    "right": (1, 0, 0),  # Add space on right
+    "left": (1, 0, 1),  # Add space on left, shift chart to right
+    "below": (0, 1, 0),  # Add space below
+}
+
+
+class _TableLayout(NamedTuple):
+    """
+    Where draw_chart puts the extended-canvas tables for one mode.
+
+    Each table origin is (x, y) in pixels; the chart size is added to x
+    and/or y according to size_dx/size_dy (1 when the tables sit beyond the
+    chart on that axis, 0 when the origin is absolute).
+    """
+
+    size_dx: int
+    size_dy: int
+    position_table: tuple[int, int]
+    house_cusps: tuple[int, int]
+    aspectarian: tuple[int, int]
+
+    def place(self, origin: tuple[int, int], size: int) -> tuple[int, int]:
+        """Return a table origin in canvas coordinates."""
+        return origin[0] + self.size_dx * size, origin[1] + self.size_dy * size
+
+
+# Table placement per extended-canvas mode (30px margins; the aspectarian
+# goes below the position table, house cusps to its right)
+_EXTENDED_CANVAS_LAYOUTS = {
+    "right": _TableLayout(1, 0, (30, 30), (230, 30), (30, 300)),
+    "left": _TableLayout(0, 0, (30, 30), (230, 30), (30, 300)),
+    # Below the chart everything sits in one row
+    "below": _TableLayout(0, 1, (30, 30), (580, 30), (350, 30)),
+}
+
+# Pre-serialized chrome for extended canvases (attributes in the sorted order
+# FastSVGWriter uses; values go through svg_writer.attr_value)
+_BACKGROUND_RECT_TPL = (
+    '<rect fill="{fill}" height="{h}px" width="{w}px" x="0" y="0" />'
+)
+_BORDER_CIRCLE_TPL = (
+    '<circle cx="{cx}" cy="{cy}" fill="none" r="{r}" stroke="{stroke}" '
+    'stroke-width="{sw}" />'
+)
 
 # Configurable radii adjustments for bi-wheel comparison charts
 # These values are offsets from the base chart radii
@@ -56,6 +151,184 @@ COMPARISON_RADII_ADJUSTMENTS = {
 }
 
 
+def drawable_positions(chart: CalculatedChart) -> tuple[CelestialPosition, ...]:
+    """
+    Positions drawn on the planet rings, cached on the chart.
+
+    Charts are immutable, so the filtered tuple is computed on the first draw
+    and stored in the instance __dict__ (not a dataclass field, so it doesn't
+    affect equality or repr). Redrawing the same chart with other themes or
+    palettes skips the filter.
+    """
+    cached = chart.__dict__.get("_drawable_positions")
+    if cached is None:
+        cached = tuple(
+            p for p in chart.positions if p.object_type in _DRAWABLE_OBJECT_TYPES
+        )
+        chart.__dict__["_drawable_positions"] = cached
+    return cached
+
+
+@lru_cache(maxsize=32)
+def resolve_theme_defaults(
+    theme: ChartTheme | str,
+) -> tuple[ZodiacPalette, str, str, str]:
+    """
+    Resolve a theme's default palettes (cached per theme).
+
+    Args:
+        theme: Theme enum or theme name
+
+    Returns:
+        Tuple of (default zodiac palette, zodiac ring color,
+        default aspect palette name, default planet glyph palette name)
+    """
+    theme_enum = ChartTheme(theme)
+    return (
+        get_theme_default_palette(theme_enum),
+        get_theme_style(theme_enum)["zodiac"]["ring_color"],
+        get_theme_default_aspect_palette(theme_enum).value,
+        get_theme_default_planet_palette(theme_enum).value,
+    )
+
+
+def to_palette_str(palette: Enum | str) -> str:
+    """Return a palette (or theme) enum's value, passing strings through."""
+    return palette.value if isinstance(palette, Enum) else palette
+
+
+@lru_cache(maxsize=64)
+def _extended_chrome_svg(
+    canvas_width: int,
+    canvas_height: int,
+    background_color: str,
+    center_xy: tuple[float, float],
+    border: tuple[float, str, float] | None,
+    coord_precision: int,
+) -> str:
+    """
+    Serialized background rect and outer border circle of an extended canvas.
+
+    Cached on every value it depends on, so batches of same-sized, same-theme
+    charts reuse one string.
+
+    Args:
+        canvas_width: Canvas width in pixels
+        canvas_height: Canvas height in pixels
+        background_color: Background fill
+        center_xy: Chart center in canvas coordinates
+        border: (radius, color, width) of the outer border, or None for none
+        coord_precision: svg_writer.COORD_PRECISION at call time; only part of
+            the cache key, so changing the precision re-serializes the chrome
+    """
+    chrome = _BACKGROUND_RECT_TPL.format(
+        w=canvas_width, h=canvas_height, fill=attr_value(background_color)
+    )
+    if border is not None:
+        radius, color, width = border
+        chrome += _BORDER_CIRCLE_TPL.format(
+            cx=attr_value(center_xy[0]),
+            cy=attr_value(center_xy[1]),
+            r=attr_value(radius),
+            stroke=attr_value(color),
+            sw=attr_value(width),
+        )
+    return chrome
+
+
+def _create_extended_drawing(
+    renderer: ChartRenderer, filename: str, canvas_width: int, canvas_height: int
+) -> FastSVGWriter:
+    """
+    Create an extended-canvas drawing with background and outer chart border.
+
+    The border is centered on the chart using the renderer's x/y offsets.
+    Only the outer border is drawn here; the aspect_ring_inner circle is drawn
+    by the ZodiacLayer with proper offset handling.
+    """
+    dwg = FastSVGWriter(
+        filename=filename,
+        size=(f"{canvas_width}px", f"{canvas_height}px"),
+        viewBox=f"0 0 {canvas_width} {canvas_height}",
+        profile="full",
+    )
+
+    # Add background and outer chart border at offset position
+    border = (
+        (
+            renderer.radii["outer_border"],
+            renderer.style["border_color"],
+            renderer.style["border_width"],
+        )
+        if renderer.has_border()
+        else None
+    )
+    dwg.write(
+        _extended_chrome_svg(
+            canvas_width,
+            canvas_height,
+            renderer.style["background_color"],
+            renderer.center_xy,
+            border,
+            svg_writer.COORD_PRECISION,
+        )
+    )
+
+    return dwg
+
+
+def _setup_chart_canvas(
+    renderer: ChartRenderer,
+    filename: str,
+    extended_canvas: str | None,
+    *,
+    extra_width: int,
+    extra_height: int,
+) -> tuple[FastSVGWriter, int, int]:
+    """
+    Create the SVG drawing for a chart and position the chart on it.
+
+    Shared by draw_chart and draw_comparison_chart. Sizes the canvas for the
+    extended-canvas mode, stores the chart offset on the renderer (all layers
+    position themselves from it), and draws the background and border chrome.
+
+    Args:
+        renderer: Renderer whose radii and style are already final
+        filename: Output filename
+        extended_canvas: "right", "left", "below", or None
+        extra_width: Width added for tables in "right"/"left" mode
+        extra_height: Height added for tables in "below" mode
+
+    Returns:
+        Tuple of (drawing, canvas_width, canvas_height)
+    """
+    canvas_width = canvas_height = renderer.size
+
+    if not extended_canvas:
+        renderer.set_offset(0, 0)
+        return (
+            renderer.create_svg_drawing(filename, FastSVGWriter),
+            canvas_width,
+            canvas_height,
+        )
+
+    deltas = _EXT_CANVAS_DELTAS.get(extended_canvas)
+    if deltas is None:
+        raise ValueError(
+            f"Invalid extended_canvas: {extended_canvas}. Must be 'right', 'left', or 'below'"
+        )
+    dw, dh, dx = deltas
+    canvas_width += dw * extra_width
+    canvas_height += dh * extra_height
+
+    # Store offset in renderer BEFORE rendering layers
+    # This ensures all layers use the correct offset for positioning
+    renderer.set_offset(dx * extra_width, 0)
+
+    dwg = _create_extended_drawing(renderer, filename, canvas_width, canvas_height)
+    return dwg, canvas_width, canvas_height
+
+
 def draw_chart(
     chart: CalculatedChart,
     filename: str = "chart.svg",
@@ -165,32 +438,27 @@ def draw_chart(
 
     # Determine theme and palette
     if theme:
-        theme_enum = ChartTheme(theme) if isinstance(theme, str) else theme
+        default_zodiac, ring_color, default_aspect, default_planet = (
+            resolve_theme_defaults(theme)
+        )
 
         # ZODIAC PALETTE LOGIC (NEW BEHAVIOR - subtle by default)
         if zodiac_palette is None:
             # Case 1: User didn't call .with_zodiac_palette()
             # Use single color from theme's zodiac ring color (subtle)
-            theme_style = get_theme_style(theme_enum)
-            ring_color = theme_style["zodiac"]["ring_color"]
-            # Create dynamic single-color palette
             zodiac_palette = f"single_color:{ring_color}"
         elif zodiac_palette is _USE_THEME_DEFAULT_PALETTE:
             # Case 2: User called .with_zodiac_palette() with no args
             # Use colorful theme default palette
-            zodiac_palette = get_theme_default_palette(theme_enum)
+            zodiac_palette = default_zodiac
         # else: Case 3: zodiac_palette is a string palette name, use it as-is
 
         # Aspect palette logic (UNCHANGED)
         if aspect_palette is None:
-            from .themes import get_theme_default_aspect_palette
-
-            aspect_palette = get_theme_default_aspect_palette(theme_enum).value
+            aspect_palette = default_aspect
         # Planet glyph palette logic (UNCHANGED)
         if planet_glyph_palette is None:
-            from .themes import get_theme_default_planet_palette
-
-            planet_glyph_palette = get_theme_default_planet_palette(theme_enum).value
+            planet_glyph_palette = default_planet
     else:
         # No theme specified, use classic defaults
         if zodiac_palette is None:
@@ -203,31 +471,7 @@ def draw_chart(
         # else: zodiac_palette is a string palette name, use it as-is
 
     # Convert zodiac_palette to string if it's an enum
-    if hasattr(zodiac_palette, "value"):
-        zodiac_palette_str = zodiac_palette.value
-    else:
-        zodiac_palette_str = zodiac_palette
-
-    # Calculate canvas dimensions and chart offset for extended canvas
-    canvas_width = size
-    canvas_height = size
-    chart_x_offset = 0
-    chart_y_offset = 0
-
-    if extended_canvas:
-        if extended_canvas == "right":
-            canvas_width = size + 450  # Add space on right
-            chart_x_offset = 0
-        elif extended_canvas == "left":
-            canvas_width = size + 450  # Add space on left
-            chart_x_offset = 450  # Shift chart to right
-        elif extended_canvas == "below":
-            canvas_height = size + 400  # Add space below
-            chart_y_offset = 0
-        else:
-            raise ValueError(
-                f"Invalid extended_canvas: {extended_canvas}. Must be 'right', 'left', or 'below'"
-            )
+    zodiac_palette_str = to_palette_str(zodiac_palette)
 
     # Create main renderer "canvas" with the rotation
     renderer = ChartRenderer(
@@ -243,77 +487,24 @@ def draw_chart(
 
     # Count corner layers early to determine if padding is needed
     # This must happen BEFORE creating SVG so borders are drawn with correct radii
-    corner_layers_count = 0
-    if chart_info:
-        corner_layers_count += 1
-    if aspect_counts:
-        corner_layers_count += 1
-    if element_modality_table:
-        corner_layers_count += 1
-    if chart_shape:
-        corner_layers_count += 1
+    corner_layers_count = sum(
+        map(bool, (chart_info, aspect_counts, element_modality_table, chart_shape))
+    )
 
     # Apply padding if auto_padding is enabled and >2 corners are occupied
     # Must be done before creating SVG so borders use adjusted radii
     if auto_padding and corner_layers_count > 2:
         # Add subtle padding by slightly reducing radii (keeps chart centered)
-        padding_factor = 0.95  # Reduce by 5%
-        for key in renderer.radii:
-            renderer.radii[key] *= padding_factor
-
-    # Create SVG drawing
-    if extended_canvas:
-        import svgwrite
-
-        dwg = svgwrite.Drawing(
-            filename=filename,
-            size=(f"{canvas_width}px", f"{canvas_height}px"),
-            viewBox=f"0 0 {canvas_width} {canvas_height}",
-            profile="full",
-        )
-
-        # Add background
-        dwg.add(
-            dwg.rect(
-                insert=(0, 0),
-                size=(f"{canvas_width}px", f"{canvas_height}px"),
-                fill=renderer.style["background_color"],
-            )
-        )
-
-        # Add outer chart border at offset position
-        # NOTE: We only draw the outer border here. The aspect_ring_inner circle
-        # will be drawn by the ZodiacLayer with proper offset handling.
-        dwg.add(
-            dwg.circle(
-                center=(
-                    chart_x_offset + renderer.center,
-                    chart_y_offset + renderer.center,
-                ),
-                r=renderer.radii["outer_border"],
-                fill="none",
-                stroke=renderer.style["border_color"],
-                stroke_width=renderer.style["border_width"],
-            )
-        )
+        renderer.apply_padding(AUTO_PADDING_FACTOR)
 
-        # Store offset in renderer BEFORE rendering layers
-        # This ensures all layers use the correct offset for positioning
-        renderer.x_offset = chart_x_offset
-        renderer.y_offset = chart_y_offset
-    else:
-        # Standard canvas - use renderer's method
-        dwg = renderer.create_svg_drawing(filename)
-        renderer.x_offset = 0
-        renderer.y_offset = 0
+    # Create SVG drawing (background, border, and chart offset on the renderer)
+    dwg, _, _ = _setup_chart_canvas(
+        renderer, filename, extended_canvas, extra_width=450, extra_height=400
+    )
 
     # Get the list of planets to draw (includes nodes and points)
-    planets_to_draw = [
-        p
-        for p in chart.positions
-        if p.object_type
-        in (ObjectType.PLANET, ObjectType.ASTEROID, ObjectType.NODE, ObjectType.POINT)
-    ]
+    planets_to_draw = drawable_positions(chart)
+    has_aspects = bool(chart.aspects)
 
     # Determine which house systems to render
     house_system_names = []
@@ -330,100 +521,91 @@ def draw_chart(
         # List of house systems
         house_system_names = house_systems
 
-    # Assemble the layers in draw order (background to foreground)
-    layers: list[IRenderLayer] = [
-        ZodiacLayer(palette=zodiac_palette),
-    ]
-
     # Add house cusp layers (first with default style, rest with distinct styles)
+    house_layers: list[IRenderLayer] = []
     for i, system_name in enumerate(house_system_names):
+        if system_name not in chart.house_systems:
+            # Nothing to draw; warn here instead of building an empty layer
+            print(f"Warning: House system '{system_name}' not found in chart data.")
+            continue
         if i == 0:
             # First system uses default style
-            layers.append(HouseCuspLayer(house_system_name=system_name))
+            house_layers.append(HouseCuspLayer(house_system_name=system_name))
         else:
             # Additional systems use distinct styles
             # Cycle through colors for multiple overlays
-            overlay_colors = ["#E74C3C", "#3498DB", "#2ECC71", "#F39C12", "#9B59B6"]
-            color = overlay_colors[(i - 1) % len(overlay_colors)]
+            color = _OVERLAY_COLORS[(i - 1) % len(_OVERLAY_COLORS)]
 
-            layers.append(
+            house_layers.append(
                 HouseCuspLayer(
                     house_system_name=system_name,
-                    style_override={
-                        "line_color": color,
-                        "line_width": 0.5,
-                        "line_dash": "5,5",
-                        "number_color": color,
-                        "fill_alternate": False,  # Don't fill for overlay systems
-                    },
+                    style_override=_overlay_style(color),
                 )
             )
 
-    # Add remaining layers
-    layers.extend(
-        [
-            AspectLayer(),
-            PlanetLayer(planet_set=planets_to_draw, radius_key="planet_ring"),
-            AngleLayer(),
-        ]
-    )
+    # Assemble the layers in draw order (background to foreground)
+    background_layers: list[IRenderLayer] = [
+        ZodiacLayer(palette=zodiac_palette),
+        *house_layers,
+    ]
 
-    # Add moon phase layer if requested
+    # The aspect ring background is always drawn, so AspectLayer stays even
+    # when there are no aspects. The moon phase sits on top of it.
+    middle_layers: list[IRenderLayer] = [AspectLayer()]
     if moon_phase:
-        moon_layer = MoonPhaseLayer(
-            position=moon_phase_position,
-            show_label=moon_phase_label,
-        )
-        layers.insert(3, moon_layer)  # Insert before PlanetLayer
-
-    # Add corner layers (auto_padding already applied earlier if needed)
-    corner_positions = set()
-
-    # Add chart info layer if requested
-    if chart_info:
-        info_layer = ChartInfoLayer(
-            position=chart_info_position,
-            fields=chart_info_fields,
-            house_systems=house_system_names,  # Pass actual systems being rendered
+        middle_layers.append(
+            MoonPhaseLayer(
+                position=moon_phase_position,
+                show_label=moon_phase_label,
+            )
         )
-        layers.append(info_layer)
-        corner_positions.add(chart_info_position)
 
-    # Add aspect counts layer if requested
-    if aspect_counts:
-        counts_layer = AspectCountsLayer(
-            position=aspect_counts_position,
-        )
-        layers.append(counts_layer)
-        corner_positions.add(aspect_counts_position)
+    foreground_layers: list[IRenderLayer] = [
+        PlanetLayer(planet_set=planets_to_draw, radius_key="planet_ring"),
+    ]
+    if chart.get_angles():
+        foreground_layers.append(AngleLayer())
+
+    # Skip chart shape if the auto-positioned moon phase will be in the same
+    # corner (bottom-right when aspects are present)
+    moon_will_be_in_bottom_right = (
+        moon_phase
+        and moon_phase_position is None  # Auto-detect enabled
+        and has_aspects  # Has aspects = moon goes to bottom-right
+        and chart_shape_position == "bottom-right"  # Chart shape also there
+    )
 
-    # Add element/modality table layer if requested
-    if element_modality_table:
-        table_layer = ElementModalityTableLayer(
-            position=element_modality_position,
-        )
-        layers.append(table_layer)
-        corner_positions.add(element_modality_position)
-
-    # Add chart shape layer if requested (with collision detection)
-    if chart_shape:
-        # Check for collision with auto-positioned moon phase
-        # Skip chart shape if moon phase will be in same corner (bottom-right when aspects present)
-        moon_will_be_in_bottom_right = (
-            moon_phase
-            and moon_phase_position is None  # Auto-detect enabled
-            and chart.aspects
-            and len(chart.aspects) > 0  # Has aspects = moon goes to bottom-right
-            and chart_shape_position
-            == "bottom-right"  # Chart shape also in bottom-right
-        )
+    # Add corner layers (auto_padding already applied earlier if needed)
+    # Each entry: (requested, layer class, corner, extra constructor args)
+    corner_specs = (
+        (
+            chart_info,
+            ChartInfoLayer,
+            chart_info_position,
+            # Pass actual systems being rendered
+            {"fields": chart_info_fields, "house_systems": house_system_names},
+        ),
+        (aspect_counts, AspectCountsLayer, aspect_counts_position, {}),
+        (
+            element_modality_table,
+            ElementModalityTableLayer,
+            element_modality_position,
+            {},
+        ),
+        (
+            chart_shape and not moon_will_be_in_bottom_right,
+            ChartShapeLayer,
+            chart_shape_position,
+            {},
+        ),
+    )
+    corner_layers: list[IRenderLayer] = [
+        layer_class(position=position, **extra)
+        for requested, layer_class, position, extra in corner_specs
+        if requested
+    ]
 
-        if not moon_will_be_in_bottom_right:
-            shape_layer = ChartShapeLayer(
-                position=chart_shape_position,
-            )
-            layers.append(shape_layer)
-            corner_positions.add(chart_shape_position)
+    layers = background_layers + middle_layers + foreground_layers + corner_layers
 
     # Tell each layer to render itself
     for layer in layers:
@@ -432,40 +614,13 @@ def draw_chart(
     # Add extended canvas layers if requested
     if extended_canvas and (show_position_table or show_aspectarian or show_house_cusps):
         # Calculate positions for extended layers based on mode
-        if extended_canvas == "right":
-            table_x = size + 30  # 30px margin from chart
-            table_y = 30
-            aspectarian_x = size + 30
-            aspectarian_y = 300  # Below position table
-            house_cusp_x = size + 230  # To the right of position table
-            house_cusp_y = 30
-        elif extended_canvas == "left":
-            table_x = 30
-            table_y = 30
-            aspectarian_x = 30
-            aspectarian_y = 300
-            house_cusp_x = 230  # To the right of position table
-            house_cusp_y = 30
-        elif extended_canvas == "below":
-            table_x = 30
-            table_y = size + 30
-            aspectarian_x = 350  # To the right of position table
-            aspectarian_y = size + 30
-            house_cusp_x = 580  # To the right of aspectarian
-            house_cusp_y = size + 30
-        else:
-            table_x = table_y = aspectarian_x = aspectarian_y = house_cusp_x = house_cusp_y = 0
-
-        # Adapt extended layer colors to theme
-        extended_style = {
-            "text_color": renderer.style.get("planets", {}).get(
-                "info_color", "#333333"
-            ),
-            "header_color": renderer.style.get("planets", {}).get(
-                "glyph_color", "#222222"
-            ),
-            "grid_color": renderer.style.get("zodiac", {}).get("line_color", "#CCCCCC"),
-        }
+        layout = _EXTENDED_CANVAS_LAYOUTS[extended_canvas]
+        table_x, table_y = layout.place(layout.position_table, size)
+        house_cusp_x, house_cusp_y = layout.place(layout.house_cusps, size)
+        aspectarian_x, aspectarian_y = layout.place(layout.aspectarian, size)
+
+        # Extended layer colors are adapted to the theme by the renderer
+        extended_style = renderer.extended_style
 
         # Add position table
         if show_position_table:
@@ -502,12 +657,115 @@ def draw_chart(
     return filename
 
 
+# draw_chart keyword options that make_chart_renderer can bind
+_DRAW_CHART_OPTIONS = frozenset(
+    name
+    for name in inspect.signature(draw_chart).parameters
+    if name not in ("chart", "filename")
+)
+
+
+def make_chart_renderer(**options: Any) -> Callable[..., str]:
+    """
+    Bind a set of draw_chart options once for rendering many charts.
+
+    Option names, the extended_canvas mode and the theme are validated here,
+    and the theme's default palettes are resolved (and cached) up front, so
+    a bad batch configuration fails before the first chart is drawn and
+    each call only does the per-chart work.
+
+    Args:
+        **options: Any draw_chart keyword argument except chart and filename
+
+    Returns:
+        A function ``render(chart, filename="chart.svg") -> filename``
+
+    Raises:
+        TypeError: If an option is not a draw_chart argument
+        ValueError: If extended_canvas or theme is invalid
+
+    Example:
+        >>> render = make_chart_renderer(theme="dark", chart_info=True)
+        >>> for name, chart in charts.items():
+        ...     render(chart, f"{name}.svg")
+    """
+    unknown = sorted(set(options) - _DRAW_CHART_OPTIONS)
+    if unknown:
+        raise TypeError(f"Unknown draw_chart options: {', '.join(unknown)}")
+
+    extended_canvas = options.get("extended_canvas")
+    if extended_canvas and extended_canvas not in _EXT_CANVAS_DELTAS:
+        raise ValueError(
+            f"Invalid extended_canvas: {extended_canvas}. Must be 'right', 'left', or 'below'"
+        )
+
+    if options.get("theme"):
+        resolve_theme_defaults(options["theme"])
+
+    bound_options = dict(options)
+
+    def render(chart: CalculatedChart, filename: str = "chart.svg") -> str:
+        return draw_chart(chart, filename, **bound_options)
+
+    return render
+
+
+def _draw_one(chart: CalculatedChart, filename: str, options: dict[str, Any]) -> str:
+    """Worker for draw_charts_batch (module-level so it can be pickled)."""
+    return draw_chart(chart, filename, **options)
+
+
+def draw_charts_batch(
+    charts: list[CalculatedChart],
+    filenames: list[str],
+    *,
+    max_workers: int | None = None,
+    **options: Any,
+) -> list[str]:
+    """
+    Draw many charts with the same options in parallel worker processes.
+
+    Layer rendering is pure Python, so processes (not threads) are used to
+    spread it across cores. Charts are pickled to the workers; everything a
+    CalculatedChart holds is plain data, so this works for any chart from
+    ChartBuilder.
+
+    Args:
+        charts: Charts to draw
+        filenames: Output filename for each chart (same length as charts)
+        max_workers: Worker process count (defaults to the CPU count)
+        **options: draw_chart keyword arguments applied to every chart
+
+    Returns:
+        The saved filenames, in input order
+
+    Raises:
+        ValueError: If charts and filenames differ in length, or an option
+            value is invalid
+        TypeError: If an option is not a draw_chart argument
+
+    Example:
+        >>> filenames = [f"chart_{i}.svg" for i in range(len(charts))]
+        >>> draw_charts_batch(charts, filenames, theme="dark")
+    """
+    if len(charts) != len(filenames):
+        raise ValueError(f"Got {len(charts)} charts but {len(filenames)} filenames")
+
+    # Validate the shared options once, before starting any workers
+    make_chart_renderer(**options)
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_draw_one, charts, filenames, repeat(options)))
+
+
 def draw_chart_with_multiple_houses(
     chart: CalculatedChart,
     filename: str = "multi_house_chart.svg",
     size: int = 600,
     theme: ChartTheme | str | None = None,
     zodiac_palette: ZodiacPalette | str | None = None,
+    aspect_palette: str | None = None,
+    planet_glyph_palette: str | None = None,
     style_config: dict | None = None,
 ) -> str:
     """
@@ -520,6 +778,8 @@ def draw_chart_with_multiple_houses(
         size: The pixel dimensions of the (square) chart.
         theme: Visual theme (classic, dark, midnight, neon, sepia, pastel, celestial).
         zodiac_palette: Color palette for zodiac wheel (grey, rainbow, elemental, cardinality).
+        aspect_palette: Color palette for aspect lines (defaults to the theme's).
+        planet_glyph_palette: Color palette for planet glyphs (defaults to the theme's).
         style_config: Optional style overrides for fine-tuning.
 
     Returns:
@@ -530,37 +790,35 @@ def draw_chart_with_multiple_houses(
 
     # Determine theme and palette
     if theme:
-        theme_enum = ChartTheme(theme) if isinstance(theme, str) else theme
+        default_zodiac, _ring_color, default_aspect, default_planet = (
+            resolve_theme_defaults(theme)
+        )
         # If no zodiac palette specified, use theme's default
         if zodiac_palette is None:
-            zodiac_palette = get_theme_default_palette(theme_enum)
+            zodiac_palette = default_zodiac
         # If no aspect palette specified, use theme's default
         if aspect_palette is None:
-            from .themes import get_theme_default_aspect_palette
-
-            aspect_palette = get_theme_default_aspect_palette(theme_enum).value
+            aspect_palette = default_aspect
         # If no planet glyph palette specified, use theme's default
         if planet_glyph_palette is None:
-            from .themes import get_theme_default_planet_palette
-
-            planet_glyph_palette = get_theme_default_planet_palette(theme_enum).value
+            planet_glyph_palette = default_planet
     else:
         # No theme specified, use classic defaults
         if zodiac_palette is None:
             zodiac_palette = ZodiacPalette.GREY
 
     renderer = ChartRenderer(
-        size=size, rotation=rotation_angle, theme=theme, style_config=style_config
+        size=size,
+        rotation=rotation_angle,
+        theme=theme,
+        style_config=style_config,
+        aspect_palette=aspect_palette,
+        planet_glyph_palette=planet_glyph_palette,
     )
-    dwg = renderer.create_svg_drawing(filename)
+    dwg = renderer.create_svg_drawing(filename, FastSVGWriter)
 
     # Get the list of planets to draw (includes nodes and points)
-    planets_to_draw = [
-        p
-        for p in chart.positions
-        if p.object_type
-        in (ObjectType.PLANET, ObjectType.ASTEROID, ObjectType.NODE, ObjectType.POINT)
-    ]
+    planets_to_draw = drawable_positions(chart)
 
     # Get the names of the first two house systems
     system_names = list(chart.house_systems.keys())
@@ -684,57 +942,24 @@ def draw_comparison_chart(
 
     # Determine theme and palette
     if theme:
-        theme_enum = ChartTheme(theme) if isinstance(theme, str) else theme
+        default_zodiac, _ring_color, default_aspect, default_planet = (
+            resolve_theme_defaults(theme)
+        )
         if zodiac_palette is None:
-            zodiac_palette = get_theme_default_palette(theme_enum)
+            zodiac_palette = default_zodiac
         if aspect_palette is None:
-            from .themes import get_theme_default_aspect_palette
-
-            aspect_palette = get_theme_default_aspect_palette(theme_enum).value
+            aspect_palette = default_aspect
         if planet_glyph_palette is None:
-            from .themes import get_theme_default_planet_palette
-
-            planet_glyph_palette = get_theme_default_planet_palette(theme_enum).value
+            planet_glyph_palette = default_planet
     else:
         if zodiac_palette is None:
             zodiac_palette = ZodiacPalette.GREY
 
     # Convert zodiac_palette to string if it's an enum
-    if hasattr(zodiac_palette, "value"):
-        zodiac_palette_str = zodiac_palette.value
-    else:
-        zodiac_palette_str = zodiac_palette
+    zodiac_palette_str = to_palette_str(zodiac_palette)
 
-    # Calculate canvas dimensions for extended canvas
     # Base chart size - expand based on configurable multiplier for biwheel
     chart_size = int(size * COMPARISON_RADII_ADJUSTMENTS["chart_size_multiplier"]) if extended_canvas else size
-    canvas_width = chart_size
-    canvas_height = chart_size
-    chart_x_offset = 0
-    chart_y_offset = 0
-
-    if extended_canvas:
-        # Calculate space needed for tables
-        # Position tables: 2 tables side-by-side (each ~5 cols × 55px = 275px per table)
-        # 40px gap between tables = 275 + 40 + 275 = 590px
-        # House cusp tables: 2 tables side-by-side (each 3 cols × 55px = 165px per table)
-        # = 165 + 40 + 165 = 370px
-        # Aspectarian: ~300px wide
-        # Use the max width + margins
-        extended_width = 650  # Enough for two position tables side-by-side
-
-        if extended_canvas == "right":
-            canvas_width = chart_size + extended_width
-        elif extended_canvas == "left":
-            canvas_width = chart_size + extended_width
-            chart_x_offset = extended_width
-        elif extended_canvas == "below":
-            # For below mode, need height for position tables + house tables + aspectarian
-            canvas_height = chart_size + 550  # Increased height for stacked layout
-        else:
-            raise ValueError(
-                f"Invalid extended_canvas: {extended_canvas}. Must be 'right', 'left', or 'below'"
-            )
 
     # Create renderer with bi-wheel radii adjustments
     renderer = ChartRenderer(
@@ -773,70 +998,47 @@ def draw_comparison_chart(
 
     # Apply padding if needed
     if auto_padding and corner_layers_count > 2:
-        padding_factor = 0.95
-        for key in renderer.radii:
-            renderer.radii[key] *= padding_factor
-
-    # Create SVG drawing
-    if extended_canvas:
-        import svgwrite
-
-        dwg = svgwrite.Drawing(
-            filename=filename,
-            size=(f"{canvas_width}px", f"{canvas_height}px"),
-            viewBox=f"0 0 {canvas_width} {canvas_height}",
-            profile="full",
-        )
+        renderer.apply_padding(AUTO_PADDING_FACTOR)
+
+    # Create SVG drawing. Comparison tables need more room than natal ones:
+    # position tables are two side-by-side tables (each ~5 cols x 55px = 275px,
+    # plus a 40px gap = 590px), house cusp tables 2 x 165px + 40px = 370px, and
+    # the aspectarian ~300px, so reserve 650px beside or 550px below the chart.
+    dwg, canvas_width, canvas_height = _setup_chart_canvas(
+        renderer, filename, extended_canvas, extra_width=650, extra_height=550
+    )
 
-        # Add background
-        dwg.add(
-            dwg.rect(
-                insert=(0, 0),
-                size=(f"{canvas_width}px", f"{canvas_height}px"),
-                fill=renderer.style["background_color"],
-            )
-        )
+    # Get planets to draw from both charts
+    chart1_planets = drawable_positions(comparison.chart1)
+    chart2_planets = drawable_positions(comparison.chart2)
+
+    # Add moon phase layer(s) (drawn between the house cusps and the aspects)
+    # TODO: Implement dual moon phase rendering for "both"/True
+    # For now every truthy value ("both", True, "chart1") shows chart1's moon
+    moon_layers: list[IRenderLayer] = (
+        [MoonPhaseLayer(position=moon_phase_position, show_label=moon_phase_label)]
+        if moon_phase
+        else []
+    )
 
-        # Add outer chart border at offset position
-        # NOTE: We only draw the outer border here. The aspect_ring_inner circle
-        # will be drawn by the ZodiacLayer with proper offset handling.
-        dwg.add(
-            dwg.circle(
-                center=(
-                    chart_x_offset + renderer.center,
-                    chart_y_offset + renderer.center,
-                ),
-                r=renderer.radii["outer_border"],
-                fill="none",
-                stroke=renderer.style["border_color"],
-                stroke_width=renderer.style["border_width"],
-            )
-        )
+    # Add corner layers
+    corner_layers: list[IRenderLayer] = []
+    if chart_info:
+        # Custom fields for comparison charts
+        if chart_info_fields is None:
+            chart_info_fields = ["name", "location", "datetime", "timezone"]
 
-        # Store offset in renderer BEFORE rendering layers
-        # This ensures all layers use the correct offset for positioning
-        renderer.x_offset = chart_x_offset
-        renderer.y_offset = chart_y_offset
-    else:
-        dwg = renderer.create_svg_drawing(filename)
-        renderer.x_offset = 0
-        renderer.y_offset = 0
+        info_layer = ChartInfoLayer(
+            position=chart_info_position,
+            fields=chart_info_fields,
+        )
+        corner_layers.append(info_layer)
 
-    # Get planets to draw from both charts
-    chart1_planets = [
-        p
-        for p in comparison.chart1.positions
-        if p.object_type
-        in (ObjectType.PLANET, ObjectType.ASTEROID, ObjectType.NODE, ObjectType.POINT)
-    ]
-    chart2_planets = [
-        p
-        for p in comparison.chart2.positions
-        if p.object_type
-        in (ObjectType.PLANET, ObjectType.ASTEROID, ObjectType.NODE, ObjectType.POINT)
-    ]
+    if aspect_counts:
+        counts_layer = AspectCountsLayer(position=aspect_counts_position)
+        corner_layers.append(counts_layer)
 
-    # Assemble layers for bi-wheel
+    # Assemble layers for bi-wheel in draw order
     layers: list[IRenderLayer] = [
         ZodiacLayer(palette=zodiac_palette),
         # Chart1 (inner) house cusps - more prominent
@@ -854,6 +1056,7 @@ def draw_comparison_chart(
                 ),
             },
         ),
+        *moon_layers,
         # Cross-chart aspects only (in central ring)
         AspectLayer(),  # Will draw comparison.cross_aspects
         # Inner wheel planets (chart1)
@@ -870,55 +1073,22 @@ def draw_comparison_chart(
         ),
         # Angles from chart1
         AngleLayer(),
+        *corner_layers,
     ]
 
-    # Add moon phase layer(s)
-    if moon_phase:
-        if moon_phase == "both" or moon_phase is True:
-            # TODO: Implement dual moon phase rendering
-            # For now, just show chart1's moon
-            moon_layer = MoonPhaseLayer(
-                position=moon_phase_position,
-                show_label=moon_phase_label,
-            )
-            layers.insert(3, moon_layer)
-        else:  # "chart1" or any other truthy value
-            moon_layer = MoonPhaseLayer(
-                position=moon_phase_position,
-                show_label=moon_phase_label,
-            )
-            layers.insert(3, moon_layer)
-
-    # Add corner layers
-    if chart_info:
-        # Custom fields for comparison charts
-        if chart_info_fields is None:
-            chart_info_fields = ["name", "location", "datetime", "timezone"]
-
-        info_layer = ChartInfoLayer(
-            position=chart_info_position,
-            fields=chart_info_fields,
-        )
-        layers.append(info_layer)
-
-    if aspect_counts:
-        counts_layer = AspectCountsLayer(position=aspect_counts_position)
-        layers.append(counts_layer)
-
-    # Render all layers
+    # Pair each layer with the chart it renders from
     # Note: AspectLayer will need to be modified to handle Comparison objects
-    # For now, we'll render using comparison.chart1 but with cross_aspects
-    for layer in layers:
-        if isinstance(layer, AspectLayer):
-            # Create a temporary chart-like object with cross_aspects
-            # This is a workaround - ideally AspectLayer should handle Comparison
-            from dataclasses import replace
+    # For now, it gets a copy of chart1 carrying the cross_aspects
+    # This is a workaround - ideally AspectLayer should handle Comparison
+    aspect_chart = replace(comparison.chart1, aspects=comparison.cross_aspects)
+    layers_with_refs = [
+        (layer, aspect_chart if isinstance(layer, AspectLayer) else comparison.chart1)
+        for layer in layers
+    ]
 
-            temp_chart = replace(comparison.chart1, aspects=comparison.cross_aspects)
-            layer.render(renderer, dwg, temp_chart)
-        else:
-            # Most layers use chart1 as reference
-            layer.render(renderer, dwg, comparison.chart1)
+    # Render all layers
+    for layer, ref_chart in layers_with_refs:
+        layer.render(renderer, dwg, ref_chart)
 
     # Add extended canvas layers if requested
     if extended_canvas and (show_position_table or show_aspectarian or show_house_cusps):
@@ -926,7 +1096,6 @@ def draw_comparison_chart(
         # Position table dimensions
         if show_position_table:
             # Get filtered positions to calculate actual table height
-            from starlight.visualization.extended_canvas import _filter_objects_for_tables
             chart1_positions = _filter_objects_for_tables(comparison.chart1.positions, table_object_types)
             chart2_positions = _filter_objects_for_tables(comparison.chart2.positions, table_object_types)
             max_positions = max(len(chart1_positions), len(chart2_positions))
@@ -970,8 +1139,7 @@ def draw_comparison_chart(
                 num_objects = max(len(chart1_positions), len(chart2_positions))
             else:
                 # Fallback: count planets from comparison
-                num_objects = len([p for p in comparison.chart1.positions
-                                 if p.object_type in [ObjectType.PLANET, ObjectType.ASTEROID, ObjectType.NODE, ObjectType.POINT]])
+                num_objects = len(drawable_positions(comparison.chart1))
 
             # Aspectarian grid size calculation
             cell_size = 20  # DEFAULT_STYLE from AspectarianLayer
@@ -997,34 +1165,19 @@ def draw_comparison_chart(
             aspectarian_x = chart_size + padding
             aspectarian_y = house_cusp_y + house_table_height + vertical_gap
 
-            # Calculate required extended width and height
-            extended_width = max(total_position_width, total_house_width, aspectarian_size) + (padding * 2)
+            # Calculate required height
             required_height = aspectarian_y + aspectarian_size + padding
 
             # Update canvas dimensions if needed
             if required_height > canvas_height:
                 canvas_height = required_height
                 # Need to recreate the SVG with new dimensions
-                dwg = svgwrite.Drawing(
-                    filename=filename,
-                    size=(f"{canvas_width}px", f"{canvas_height}px"),
-                    viewBox=f"0 0 {canvas_width} {canvas_height}",
-                    profile="full",
+                dwg = _create_extended_drawing(
+                    renderer, filename, canvas_width, canvas_height
                 )
-                # Redraw background
-                dwg.add(dwg.rect(insert=(0, 0), size=(f"{canvas_width}px", f"{canvas_height}px"),
-                               fill=renderer.style["background_color"]))
-                # Redraw outer border
-                dwg.add(dwg.circle(center=(chart_x_offset + renderer.center, chart_y_offset + renderer.center),
-                                  r=renderer.radii["outer_border"], fill="none",
-                                  stroke=renderer.style["border_color"], stroke_width=renderer.style["border_width"]))
                 # Re-render all layers
-                for layer in layers:
-                    if isinstance(layer, AspectLayer):
-                        temp_chart = replace(comparison.chart1, aspects=comparison.cross_aspects)
-                        layer.render(renderer, dwg, temp_chart)
-                    else:
-                        layer.render(renderer, dwg, comparison.chart1)
+                for layer, ref_chart in layers_with_refs:
+                    layer.render(renderer, dwg, ref_chart)
 
         elif extended_canvas == "left":
             # Position table at top
@@ -1039,31 +1192,18 @@ def draw_comparison_chart(
             aspectarian_x = padding
             aspectarian_y = house_cusp_y + house_table_height + vertical_gap
 
-            # Calculate required extended width and height
-            extended_width = max(total_position_width, total_house_width, aspectarian_size) + (padding * 2)
+            # Calculate required height
             required_height = aspectarian_y + aspectarian_size + padding
 
             # Update canvas dimensions if needed
             if required_height > canvas_height:
                 canvas_height = required_height
                 # Recreate SVG with new dimensions
-                dwg = svgwrite.Drawing(
-                    filename=filename,
-                    size=(f"{canvas_width}px", f"{canvas_height}px"),
-                    viewBox=f"0 0 {canvas_width} {canvas_height}",
-                    profile="full",
+                dwg = _create_extended_drawing(
+                    renderer, filename, canvas_width, canvas_height
                 )
-                dwg.add(dwg.rect(insert=(0, 0), size=(f"{canvas_width}px", f"{canvas_height}px"),
-                               fill=renderer.style["background_color"]))
-                dwg.add(dwg.circle(center=(chart_x_offset + renderer.center, chart_y_offset + renderer.center),
-                                  r=renderer.radii["outer_border"], fill="none",
-                                  stroke=renderer.style["border_color"], stroke_width=renderer.style["border_width"]))
-                for layer in layers:
-                    if isinstance(layer, AspectLayer):
-                        temp_chart = replace(comparison.chart1, aspects=comparison.cross_aspects)
-                        layer.render(renderer, dwg, temp_chart)
-                    else:
-                        layer.render(renderer, dwg, comparison.chart1)
+                for layer, ref_chart in layers_with_refs:
+                    layer.render(renderer, dwg, ref_chart)
 
         elif extended_canvas == "below":
             # Position table at top left
@@ -1100,34 +1240,16 @@ def draw_comparison_chart(
 
             # Recreate SVG with new dimensions if needed
             if needs_resize:
-                dwg = svgwrite.Drawing(
-                    filename=filename,
-                    size=(f"{canvas_width}px", f"{canvas_height}px"),
-                    viewBox=f"0 0 {canvas_width} {canvas_height}",
-                    profile="full",
+                dwg = _create_extended_drawing(
+                    renderer, filename, canvas_width, canvas_height
                 )
-                dwg.add(dwg.rect(insert=(0, 0), size=(f"{canvas_width}px", f"{canvas_height}px"),
-                               fill=renderer.style["background_color"]))
-                dwg.add(dwg.circle(center=(chart_x_offset + renderer.center, chart_y_offset + renderer.center),
-                                  r=renderer.radii["outer_border"], fill="none",
-                                  stroke=renderer.style["border_color"], stroke_width=renderer.style["border_width"]))
-                for layer in layers:
-                    if isinstance(layer, AspectLayer):
-                        temp_chart = replace(comparison.chart1, aspects=comparison.cross_aspects)
-                        layer.render(renderer, dwg, temp_chart)
-                    else:
-                        layer.render(renderer, dwg, comparison.chart1)
+                for layer, ref_chart in layers_with_refs:
+                    layer.render(renderer, dwg, ref_chart)
         else:
             table_x = table_y = house_cusp_x = house_cusp_y = aspectarian_x = aspectarian_y = 0
 
-        # Adapt colors to theme
-        extended_style = {
-            "text_color": renderer.style.get("planets", {}).get("info_color", "#333333"),
-            "header_color": renderer.style.get("planets", {}).get(
-                "glyph_color", "#222222"
-            ),
-            "grid_color": renderer.style.get("zodiac", {}).get("line_color", "#CCCCCC"),
-        }
+        # Extended layer colors are adapted to the theme by the renderer
+        extended_style = renderer.extended_style
 
         # Position table
         if show_position_table:
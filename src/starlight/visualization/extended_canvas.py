@@ -5,23 +5,141 @@ These layers render tabular data outside the main chart wheel,
 requiring an extended canvas with additional space.
 """
 
+from collections.abc import Sequence
 from typing import Any
 
 import svgwrite
 
-from starlight.core.models import Aspect, CalculatedChart, ObjectType
+from starlight.core.models import CalculatedChart, ObjectType
 from starlight.core.registry import CELESTIAL_REGISTRY, get_aspect_info
 
 from .core import ChartRenderer, get_glyph
+from .svg_writer import fmt
+
+# Zodiac sign names in order, indexed by int(longitude // 30)
+_SIGN_NAMES = (
+    "Aries",
+    "Taurus",
+    "Gemini",
+    "Cancer",
+    "Leo",
+    "Virgo",
+    "Libra",
+    "Scorpio",
+    "Sagittarius",
+    "Capricorn",
+    "Aquarius",
+    "Pisces",
+)
+
+
+# Name cell suffix, indexed by CelestialPosition.is_retrograde
+_RETROGRADE_SUFFIX = {False: "", True: " ℞"}
+
+# Position table sort order by object type (unknown types sort last)
+_TYPE_PRIORITY = {
+    ObjectType.PLANET: 0,
+    ObjectType.ASTEROID: 1,
+    ObjectType.NODE: 2,
+    ObjectType.POINT: 3,
+    ObjectType.ANGLE: 4,
+    ObjectType.MIDPOINT: 5,
+    ObjectType.ARABIC_PART: 6,
+    ObjectType.FIXED_STAR: 7,
+}
+
+# Traditional aspectarian order (planets, nodes, then angles) as name -> index
+_OBJECT_ORDER_INDEX = {
+    name: i
+    for i, name in enumerate(
+        (
+            "Sun",
+            "Moon",
+            "Mercury",
+            "Venus",
+            "Mars",
+            "Jupiter",
+            "Saturn",
+            "Uranus",
+            "Neptune",
+            "Pluto",
+            "North Node",
+            "True Node",
+            "Mean Node",
+            "ASC",
+            "AC",
+            "Ascendant",
+            "MC",
+            "Midheaven",
+        )
+    )
+}
+# Object types shown in tables when no object_types are given
+_DEFAULT_INCLUDED_TYPES = frozenset(
+    {
+        ObjectType.PLANET,
+        ObjectType.ASTEROID,
+        ObjectType.POINT,
+        ObjectType.NODE,
+        ObjectType.ANGLE,
+    }
+)
+
+# Node and angle names kept by the table filter (South Node, DSC and IC are
+# implied by their opposites)
+_NORTH_NODE_NAMES = frozenset({"North Node", "True Node", "Mean Node"})
+_TABLE_ANGLE_NAMES = frozenset({"ASC", "AC", "Ascendant", "MC", "Midheaven"})
+
+
+# Per-type table rule: None keeps every object of that type, otherwise the
+# predicate decides
+_TYPE_PREDICATES = {
+    ObjectType.PLANET: None,
+    ObjectType.ASTEROID: None,
+    ObjectType.POINT: None,
+    # North Node only (exclude South Node)
+    ObjectType.NODE: lambda p: p.name in _NORTH_NODE_NAMES,
+    # ASC/AC and MC only (exclude DSC/DC and IC)
+    ObjectType.ANGLE: lambda p: p.name in _TABLE_ANGLE_NAMES,
+    ObjectType.MIDPOINT: None,
+    ObjectType.ARABIC_PART: None,
+    ObjectType.FIXED_STAR: None,
+}
 
 
 def _is_comparison(obj):
     """Check if object is a Comparison (avoid circular import)."""
-    return (
-        hasattr(obj, "comparison_type")
-        and hasattr(obj, "chart1")
-        and hasattr(obj, "chart2")
-    )
+    # Same duck-typed kind flag ChartBuilder uses; one class attribute lookup
+    return getattr(obj, "__starlight_kind__", None) == "comparison"
+
+
+def _format_sign_degree(sign_degree: float) -> str:
+    """Format a degree within a sign as D°MM' (minutes truncated)."""
+    degrees = int(sign_degree)
+    minutes = int((sign_degree % 1) * 60)
+    return f"{degrees}°{minutes:02d}'"
+
+
+def _cusp_sign_degrees(cusps) -> list[tuple[str, str]]:
+    """Split house cusp longitudes into (sign name, degree text) rows."""
+    return [
+        (_SIGN_NAMES[int(cusp // 30) % 12], _format_sign_degree(cusp % 30))
+        for cusp in cusps
+    ]
+
+
+def _planet_label(name: str) -> str:
+    """Position table name cell: unicode glyph and name, or the name alone."""
+    glyph_info = get_glyph(name)
+    if glyph_info["type"] == "unicode":
+        return f"{glyph_info['value']} {name}"
+    return name
+
+
+def _header_glyph(name: str) -> str:
+    """Aspectarian header text: the unicode glyph, or the first two letters."""
+    glyph_info = get_glyph(name)
+    return glyph_info["value"] if glyph_info["type"] == "unicode" else name[:2]
 
 
 def _filter_objects_for_tables(positions, object_types=None):
@@ -51,13 +169,7 @@ def _filter_objects_for_tables(positions, object_types=None):
     # Convert object_types to a set of ObjectType enums for fast lookup
     if object_types is None:
         # Default: include planet, asteroid, point, node, angle
-        included_types = {
-            ObjectType.PLANET,
-            ObjectType.ASTEROID,
-            ObjectType.POINT,
-            ObjectType.NODE,
-            ObjectType.ANGLE,
-        }
+        included_types = _DEFAULT_INCLUDED_TYPES
     else:
         # Convert strings to ObjectType enums
         included_types = set()
@@ -72,53 +184,118 @@ def _filter_objects_for_tables(positions, object_types=None):
             elif isinstance(obj_type, ObjectType):
                 included_types.add(obj_type)
 
-    filtered = []
-    for p in positions:
-        # Skip Earth
-        if p.name == "Earth":
-            continue
-
-        # Check if object type is in included types
-        if p.object_type not in included_types:
-            continue
-
-        # For planets: include all except Earth (already checked)
-        if p.object_type == ObjectType.PLANET:
-            filtered.append(p)
-            continue
-
-        # For asteroids: include all
-        if p.object_type == ObjectType.ASTEROID:
-            filtered.append(p)
-            continue
-
-        # For nodes: include North Node only (exclude South Node)
-        if p.object_type == ObjectType.NODE:
-            if p.name in ("North Node", "True Node", "Mean Node"):
-                filtered.append(p)
-            continue
-
-        # For points: include all
-        if p.object_type == ObjectType.POINT:
-            filtered.append(p)
-            continue
-
-        # For angles: include only ASC/AC and MC (exclude DSC/DC and IC)
-        if p.object_type == ObjectType.ANGLE:
-            if p.name in ("ASC", "AC", "Ascendant", "MC", "Midheaven"):
-                filtered.append(p)
-            continue
-
-        # For midpoints and arabic parts: include all if type is in included_types
-        if p.object_type in (
-            ObjectType.MIDPOINT,
-            ObjectType.ARABIC_PART,
-            ObjectType.FIXED_STAR,
-        ):
-            filtered.append(p)
-            continue
-
-    return filtered
+    # Only types with a table rule can appear
+    included_types = _TYPE_PREDICATES.keys() & included_types
+
+    # Earth is never listed; everything else must be an included type that
+    # passes its rule
+    rules = _TYPE_PREDICATES
+    return [
+        p
+        for p in positions
+        if p.name != "Earth"
+        and p.object_type in included_types
+        and ((keep := rules[p.object_type]) is None or keep(p))
+    ]
+
+
+def _table_objects(
+    chart: CalculatedChart,
+    object_types: list[str | ObjectType] | None,
+    order: str,
+) -> tuple:
+    """
+    Filtered and sorted table objects for one chart, cached on the chart.
+
+    Position tables ("table" order) sort by object type, then registry order;
+    the aspectarian ("aspectarian" order) uses the traditional planet order.
+    Charts are immutable, so each (object_types, order) result is computed
+    once and kept in the instance __dict__ (like the drawable positions in
+    drawing.py), shared by every layer and redraw of the chart.
+    """
+    cache = chart.__dict__.setdefault("_table_objects", {})
+    key = (None if object_types is None else tuple(object_types), order)
+    cached = cache.get(key)
+    if cached is None:
+        objects = _filter_objects_for_tables(chart.positions, object_types)
+        if order == "table":
+            name_priority = {name: i for i, name in enumerate(CELESTIAL_REGISTRY)}
+            objects.sort(
+                key=lambda p: (
+                    _TYPE_PRIORITY.get(p.object_type, 99),
+                    name_priority.get(p.name, 999),
+                )
+            )
+        else:
+            objects.sort(key=lambda p: _OBJECT_ORDER_INDEX.get(p.name, 99))
+        cached = cache[key] = tuple(objects)
+    return cached
+
+
+def _aspect_glyph_and_color(name: str, default_color: str) -> tuple[str, str]:
+    """Registry glyph and color for an aspect, falling back to its initial."""
+    info = get_aspect_info(name)
+    glyph = info.glyph if info and info.glyph else name[:1]
+    color = info.color if info and info.color else default_color
+    return glyph, color
+
+
+def _aspect_cells(
+    aspects,
+    row_names: Sequence[str],
+    col_names: Sequence[str],
+    default_color: str,
+    symmetric: bool = False,
+) -> list[tuple[str, str] | None]:
+    """
+    Lay aspects out as a flat, row-major grid of aspectarian cells.
+
+    Cell ``row * len(col_names) + col`` holds the aspect's (glyph, color), or
+    None when that pair has no aspect. Symmetric (natal) aspects fill both
+    cells of their pair. Glyph and color are resolved once per aspect name.
+    """
+    rows = {name: i for i, name in enumerate(row_names)}
+    cols = {name: i for i, name in enumerate(col_names)}
+    n_cols = len(col_names)
+    glyphs = {
+        name: _aspect_glyph_and_color(name, default_color)
+        for name in {a.aspect_name for a in aspects}
+    }
+    cells: list[tuple[str, str] | None] = [None] * (len(row_names) * n_cols)
+    for aspect in aspects:
+        name1 = aspect.object1.name
+        name2 = aspect.object2.name
+        cell = glyphs[aspect.aspect_name]
+        if name1 in rows and name2 in cols:
+            cells[rows[name1] * n_cols + cols[name2]] = cell
+        if symmetric and name2 in rows and name1 in cols:
+            cells[rows[name2] * n_cols + cols[name1]] = cell
+    return cells
+
+
+def _table_text_attrs(
+    style: dict[str, Any], renderer: ChartRenderer
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """
+    Build the shared header and row <g> attributes for a table layer.
+
+    Only inherited properties go on the groups; dominant-baseline is not
+    inherited in SVG 1.1, so each <text> keeps its own.
+    """
+    header_attrs = {
+        "text_anchor": "start",
+        "font_size": style["header_size"],
+        "fill": style["header_color"],
+        "font_family": renderer.style["font_family_text"],
+        "font_weight": style["header_weight"],
+    }
+    row_attrs = {
+        **header_attrs,
+        "font_size": style["text_size"],
+        "fill": style["text_color"],
+        "font_weight": style["font_weight"],
+    }
+    return header_attrs, row_attrs
 
 
 class PositionTableLayer:
@@ -174,202 +351,139 @@ class PositionTableLayer:
         # Check if this is a Comparison object
         is_comparison = _is_comparison(chart)
 
+        # Rows are laid out relative to the table origin; one translate on
+        # the group positions the whole table
+        group = dwg.g(transform=f"translate({self.x_offset}, {self.y_offset})")
+
         if is_comparison:
             # Render two separate tables side by side
-            self._render_comparison_tables(renderer, dwg, chart)
+            self._render_comparison_tables(renderer, dwg, group, chart)
         else:
             # Render standard single table
-            self._render_single_table(renderer, dwg, chart)
+            self._render_single_table(renderer, dwg, group, chart)
+
+        # An empty selection leaves the group empty; skip the bare <g>
+        if group.elements:
+            dwg.add(group)
 
     def _render_single_table(
-        self, renderer: ChartRenderer, dwg: svgwrite.Drawing, chart
+        self,
+        renderer: ChartRenderer,
+        dwg: svgwrite.Drawing,
+        group: svgwrite.container.Group,
+        chart,
     ) -> None:
         """Render a single position table for a standard chart."""
         # Standard CalculatedChart - use filter function to include angles
-        chart_positions = _filter_objects_for_tables(chart.positions, self.object_types)
-
-        # Get defined names from registry
-        name_priority = {name: i for i, name in enumerate(CELESTIAL_REGISTRY.keys())}
-        # Sort by object type priority, then registry order
-        type_priority = {
-            ObjectType.PLANET: 0,
-            ObjectType.ASTEROID: 1,
-            ObjectType.NODE: 2,
-            ObjectType.POINT: 3,
-            ObjectType.ANGLE: 4,
-            ObjectType.MIDPOINT: 5,
-            ObjectType.ARABIC_PART: 6,
-            ObjectType.FIXED_STAR: 7,
-        }
-        chart_positions.sort(
-            key=lambda p: (
-                type_priority.get(p.object_type, 99),
-                name_priority.get(p.name, 999),
-            )
-        )
+        chart_positions = _table_objects(chart, self.object_types, "table")
+        if not chart_positions:
+            return
 
-        # Build table
-        x_start = self.x_offset
-        y_start = self.y_offset
+        # Build table (in table-local coordinates, see render())
+        x_start = 0
+        y_start = 0
+
+        # Header and data row texts share their font attributes via two groups
+        header_attrs, row_attrs = _table_text_attrs(self.style, renderer)
+        headers_group = group.add(dwg.g(**header_attrs))
+        rows = group.add(dwg.g(**row_attrs))
 
         # Header row
+        show_house = self.style["show_house"]
+        show_speed = self.style["show_speed"]
         headers = ["Planet", "Sign", "Degree"]
-        if self.style["show_house"]:
+        if show_house:
             headers.append("House")
-        if self.style["show_speed"]:
+        if show_speed:
             headers.append("Speed")
 
+        # Column x positions and row pitch are fixed for the whole table
+        col_spacing = self.style["col_spacing"]
+        line_height = self.style["line_height"]
+        col_xs = tuple(x_start + i * col_spacing for i in range(len(headers)))
+
         # Render headers
-        for i, header in enumerate(headers):
-            x = x_start + (i * self.style["col_spacing"])
-            dwg.add(
+        for x, header in zip(col_xs, headers, strict=True):
+            headers_group.add(
                 dwg.text(
                     header,
                     insert=(x, y_start),
-                    text_anchor="start",
                     dominant_baseline="hanging",
-                    font_size=self.style["header_size"],
-                    fill=self.style["header_color"],
-                    font_family=renderer.style["font_family_text"],
-                    font_weight=self.style["header_weight"],
                 )
             )
 
         # Render data rows
         for row_idx, pos in enumerate(chart_positions):
-            y = y_start + ((row_idx + 1) * self.style["line_height"])
+            y = y_start + (row_idx + 1) * line_height
 
-            # Column 0: Planet name + glyph
-            glyph_info = get_glyph(pos.name)
-            if glyph_info["type"] == "unicode":
-                planet_text = f"{glyph_info['value']} {pos.name}"
-            else:
-                planet_text = pos.name
+            # Column 0: Planet name + glyph, plus retrograde symbol if applicable
+            suffix = _RETROGRADE_SUFFIX[pos.is_retrograde]
+            planet_text = f"{_planet_label(pos.name)}{suffix}"
 
-            # Add retrograde symbol if applicable
-            if pos.is_retrograde:
-                planet_text += " ℞"
-
-            dwg.add(
+            rows.add(
                 dwg.text(
                     planet_text,
                     insert=(x_start, y),
-                    text_anchor="start",
                     dominant_baseline="hanging",
-                    font_size=self.style["text_size"],
-                    fill=self.style["text_color"],
-                    font_family=renderer.style["font_family_text"],
-                    font_weight=self.style["font_weight"],
                 )
             )
 
             # Column 1: Sign
-            x_sign = x_start + self.style["col_spacing"]
-            dwg.add(
+            rows.add(
                 dwg.text(
                     pos.sign,
-                    insert=(x_sign, y),
-                    text_anchor="start",
+                    insert=(col_xs[1], y),
                     dominant_baseline="hanging",
-                    font_size=self.style["text_size"],
-                    fill=self.style["text_color"],
-                    font_family=renderer.style["font_family_text"],
-                    font_weight=self.style["font_weight"],
                 )
             )
 
             # Column 2: Degree
-            degrees = int(pos.sign_degree)
-            minutes = int((pos.sign_degree % 1) * 60)
-            degree_text = f"{degrees}°{minutes:02d}'"
-            x_degree = x_start + (2 * self.style["col_spacing"])
-            dwg.add(
+            degree_text = _format_sign_degree(pos.sign_degree)
+            rows.add(
                 dwg.text(
                     degree_text,
-                    insert=(x_degree, y),
-                    text_anchor="start",
+                    insert=(col_xs[2], y),
                     dominant_baseline="hanging",
-                    font_size=self.style["text_size"],
-                    fill=self.style["text_color"],
-                    font_family=renderer.style["font_family_text"],
-                    font_weight=self.style["font_weight"],
                 )
             )
 
             # Column 3: House (if enabled)
             col_offset = 3
-            if self.style["show_house"]:
+            if show_house:
                 house = self._get_house_placement(chart, pos)
-                x_house = x_start + (col_offset * self.style["col_spacing"])
-                dwg.add(
+                rows.add(
                     dwg.text(
                         str(house) if house else "-",
-                        insert=(x_house, y),
-                        text_anchor="start",
+                        insert=(col_xs[col_offset], y),
                         dominant_baseline="hanging",
-                        font_size=self.style["text_size"],
-                        fill=self.style["text_color"],
-                        font_family=renderer.style["font_family_text"],
-                        font_weight=self.style["font_weight"],
                     )
                 )
                 col_offset += 1
 
             # Column 4: Speed (if enabled)
-            if self.style["show_speed"]:
+            if show_speed:
                 speed_text = f"{pos.speed_longitude:.2f}"
-                x_speed = x_start + (col_offset * self.style["col_spacing"])
-                dwg.add(
+                rows.add(
                     dwg.text(
                         speed_text,
-                        insert=(x_speed, y),
-                        text_anchor="start",
+                        insert=(col_xs[col_offset], y),
                         dominant_baseline="hanging",
-                        font_size=self.style["text_size"],
-                        fill=self.style["text_color"],
-                        font_family=renderer.style["font_family_text"],
-                        font_weight=self.style["font_weight"],
                     )
                 )
 
     def _render_comparison_tables(
-        self, renderer: ChartRenderer, dwg: svgwrite.Drawing, comparison
+        self,
+        renderer: ChartRenderer,
+        dwg: svgwrite.Drawing,
+        group: svgwrite.container.Group,
+        comparison,
     ) -> None:
         """Render two separate side-by-side tables for comparison charts."""
         # Get positions from both charts
-        chart1_positions = _filter_objects_for_tables(
-            comparison.chart1.positions, self.object_types
-        )
-        chart2_positions = _filter_objects_for_tables(
-            comparison.chart2.positions, self.object_types
-        )
-
-        # Get defined names from registry
-        name_priority = {name: i for i, name in enumerate(CELESTIAL_REGISTRY.keys())}
-
-        # Sort both lists
-        type_priority = {
-            ObjectType.PLANET: 0,
-            ObjectType.ASTEROID: 1,
-            ObjectType.NODE: 2,
-            ObjectType.POINT: 3,
-            ObjectType.ANGLE: 4,
-            ObjectType.MIDPOINT: 5,
-            ObjectType.ARABIC_PART: 6,
-            ObjectType.FIXED_STAR: 7,
-        }
-        chart1_positions.sort(
-            key=lambda p: (
-                type_priority.get(p.object_type, 99),
-                name_priority.get(p.name, 999),
-            )
-        )
-        chart2_positions.sort(
-            key=lambda p: (
-                type_priority.get(p.object_type, 99),
-                name_priority.get(p.name, 999),
-            )
-        )
+        chart1_positions = _table_objects(comparison.chart1, self.object_types, "table")
+        chart2_positions = _table_objects(comparison.chart2, self.object_types, "table")
+        if not chart1_positions and not chart2_positions:
+            return
 
         # Calculate table width
         num_cols = 3  # Planet, Sign, Degree
@@ -380,12 +494,12 @@ class PositionTableLayer:
         table_width = num_cols * self.style["col_spacing"]
 
         # Render Chart 1 table (left)
-        x_chart1 = self.x_offset
-        y_start = self.y_offset
+        x_chart1 = 0
+        y_start = 0
 
         # Chart 1 title
         title_text = f"{comparison.chart1_label or 'Chart 1'} (Inner Wheel)"
-        dwg.add(
+        group.add(
             dwg.text(
                 title_text,
                 insert=(x_chart1, y_start),
@@ -400,7 +514,13 @@ class PositionTableLayer:
 
         # Render chart 1 table (offset by title height)
         self._render_table_for_chart(
-            renderer, dwg, comparison.chart1, chart1_positions, x_chart1, y_start + 20
+            renderer,
+            dwg,
+            group,
+            comparison.chart1,
+            chart1_positions,
+            x_chart1,
+            y_start + 20,
         )
 
         # Render Chart 2 table (right, with spacing)
@@ -408,7 +528,7 @@ class PositionTableLayer:
 
         # Chart 2 title
         title_text = f"{comparison.chart2_label or 'Chart 2'} (Outer Wheel)"
-        dwg.add(
+        group.add(
             dwg.text(
                 title_text,
                 insert=(x_chart2, y_start),
@@ -423,13 +543,20 @@ class PositionTableLayer:
 
         # Render chart 2 table (offset by title height)
         self._render_table_for_chart(
-            renderer, dwg, comparison.chart2, chart2_positions, x_chart2, y_start + 20
+            renderer,
+            dwg,
+            group,
+            comparison.chart2,
+            chart2_positions,
+            x_chart2,
+            y_start + 20,
         )
 
     def _render_table_for_chart(
         self,
         renderer: ChartRenderer,
         dwg: svgwrite.Drawing,
+        group: svgwrite.container.Group,
         chart,
         positions,
         x_offset,
@@ -439,123 +566,91 @@ class PositionTableLayer:
         x_start = x_offset
         y_start = y_offset
 
+        # Header and data row texts share their font attributes via two groups
+        header_attrs, row_attrs = _table_text_attrs(self.style, renderer)
+        headers_group = group.add(dwg.g(**header_attrs))
+        rows = group.add(dwg.g(**row_attrs))
+
         # Header row
+        show_house = self.style["show_house"]
+        show_speed = self.style["show_speed"]
         headers = ["Planet", "Sign", "Degree"]
-        if self.style["show_house"]:
+        if show_house:
             headers.append("House")
-        if self.style["show_speed"]:
+        if show_speed:
             headers.append("Speed")
 
+        # Column x positions and row pitch are fixed for the whole table
+        col_spacing = self.style["col_spacing"]
+        line_height = self.style["line_height"]
+        col_xs = tuple(x_start + i * col_spacing for i in range(len(headers)))
+
         # Render headers
-        for i, header in enumerate(headers):
-            x = x_start + (i * self.style["col_spacing"])
-            dwg.add(
+        for x, header in zip(col_xs, headers, strict=True):
+            headers_group.add(
                 dwg.text(
                     header,
                     insert=(x, y_start),
-                    text_anchor="start",
                     dominant_baseline="hanging",
-                    font_size=self.style["header_size"],
-                    fill=self.style["header_color"],
-                    font_family=renderer.style["font_family_text"],
-                    font_weight=self.style["header_weight"],
                 )
             )
 
         # Render data rows
         for row_idx, pos in enumerate(positions):
-            y = y_start + ((row_idx + 1) * self.style["line_height"])
+            y = y_start + (row_idx + 1) * line_height
 
-            # Column 0: Planet name + glyph
-            glyph_info = get_glyph(pos.name)
-            if glyph_info["type"] == "unicode":
-                planet_text = f"{glyph_info['value']} {pos.name}"
-            else:
-                planet_text = pos.name
+            # Column 0: Planet name + glyph, plus retrograde symbol if applicable
+            suffix = _RETROGRADE_SUFFIX[pos.is_retrograde]
+            planet_text = f"{_planet_label(pos.name)}{suffix}"
 
-            # Add retrograde symbol if applicable
-            if pos.is_retrograde:
-                planet_text += " ℞"
-
-            dwg.add(
+            rows.add(
                 dwg.text(
                     planet_text,
                     insert=(x_start, y),
-                    text_anchor="start",
                     dominant_baseline="hanging",
-                    font_size=self.style["text_size"],
-                    fill=self.style["text_color"],
-                    font_family=renderer.style["font_family_text"],
-                    font_weight=self.style["font_weight"],
                 )
             )
 
             # Column 1: Sign
-            x_sign = x_start + self.style["col_spacing"]
-            dwg.add(
+            rows.add(
                 dwg.text(
                     pos.sign,
-                    insert=(x_sign, y),
-                    text_anchor="start",
+                    insert=(col_xs[1], y),
                     dominant_baseline="hanging",
-                    font_size=self.style["text_size"],
-                    fill=self.style["text_color"],
-                    font_family=renderer.style["font_family_text"],
-                    font_weight=self.style["font_weight"],
                 )
             )
 
             # Column 2: Degree
-            degrees = int(pos.sign_degree)
-            minutes = int((pos.sign_degree % 1) * 60)
-            degree_text = f"{degrees}°{minutes:02d}'"
-            x_degree = x_start + (2 * self.style["col_spacing"])
-            dwg.add(
+            degree_text = _format_sign_degree(pos.sign_degree)
+            rows.add(
                 dwg.text(
                     degree_text,
-                    insert=(x_degree, y),
-                    text_anchor="start",
+                    insert=(col_xs[2], y),
                     dominant_baseline="hanging",
-                    font_size=self.style["text_size"],
-                    fill=self.style["text_color"],
-                    font_family=renderer.style["font_family_text"],
-                    font_weight=self.style["font_weight"],
                 )
             )
 
             # Column 3: House (if enabled)
             col_offset = 3
-            if self.style["show_house"]:
+            if show_house:
                 house = self._get_house_placement(chart, pos)
-                x_house = x_start + (col_offset * self.style["col_spacing"])
-                dwg.add(
+                rows.add(
                     dwg.text(
                         str(house) if house else "-",
-                        insert=(x_house, y),
-                        text_anchor="start",
+                        insert=(col_xs[col_offset], y),
                         dominant_baseline="hanging",
-                        font_size=self.style["text_size"],
-                        fill=self.style["text_color"],
-                        font_family=renderer.style["font_family_text"],
-                        font_weight=self.style["font_weight"],
                     )
                 )
                 col_offset += 1
 
             # Column 4: Speed (if enabled)
-            if self.style["show_speed"]:
+            if show_speed:
                 speed_text = f"{pos.speed_longitude:.2f}"
-                x_speed = x_start + (col_offset * self.style["col_spacing"])
-                dwg.add(
+                rows.add(
                     dwg.text(
                         speed_text,
-                        insert=(x_speed, y),
-                        text_anchor="start",
+                        insert=(col_xs[col_offset], y),
                         dominant_baseline="hanging",
-                        font_size=self.style["text_size"],
-                        fill=self.style["text_color"],
-                        font_family=renderer.style["font_family_text"],
-                        font_weight=self.style["font_weight"],
                     )
                 )
 
@@ -614,15 +709,27 @@ class HouseCuspTableLayer:
         # Check if this is a Comparison object
         is_comparison = _is_comparison(chart)
 
+        # Rows are laid out relative to the table origin; one translate on
+        # the group positions the whole table
+        group = dwg.g(transform=f"translate({self.x_offset}, {self.y_offset})")
+
         if is_comparison:
             # Render two separate house cusp tables side by side
-            self._render_comparison_house_tables(renderer, dwg, chart)
+            self._render_comparison_house_tables(renderer, dwg, group, chart)
         else:
             # Render standard single table
-            self._render_single_house_table(renderer, dwg, chart)
+            self._render_single_house_table(renderer, dwg, group, chart)
+
+        # An empty selection leaves the group empty; skip the bare <g>
+        if group.elements:
+            dwg.add(group)
 
     def _render_single_house_table(
-        self, renderer: ChartRenderer, dwg: svgwrite.Drawing, chart
+        self,
+        renderer: ChartRenderer,
+        dwg: svgwrite.Drawing,
+        group: svgwrite.container.Group,
+        chart,
     ) -> None:
         """Render a single house cusp table for a standard chart."""
         # Get house cusps from default house system
@@ -630,108 +737,75 @@ class HouseCuspTableLayer:
             return
 
         houses = chart.get_houses(chart.default_house_system)
-        if not houses:
+        if not houses or len(houses.cusps) != 12:
             return
 
-        # Build table
-        x_start = self.x_offset
-        y_start = self.y_offset
+        # Build table (in table-local coordinates, see render())
+        x_start = 0
+        y_start = 0
+
+        # Header and data row texts share their font attributes via two groups
+        header_attrs, row_attrs = _table_text_attrs(self.style, renderer)
+        headers_group = group.add(dwg.g(**header_attrs))
+        rows = group.add(dwg.g(**row_attrs))
 
         # Header row
         headers = ["House", "Sign", "Degree"]
 
+        # Column x positions and row pitch are fixed for the whole table
+        col_spacing = self.style["col_spacing"]
+        line_height = self.style["line_height"]
+        col_xs = tuple(x_start + i * col_spacing for i in range(len(headers)))
+
         # Render headers
-        for i, header in enumerate(headers):
-            x = x_start + (i * self.style["col_spacing"])
-            dwg.add(
+        for x, header in zip(col_xs, headers, strict=True):
+            headers_group.add(
                 dwg.text(
                     header,
                     insert=(x, y_start),
-                    text_anchor="start",
                     dominant_baseline="hanging",
-                    font_size=self.style["header_size"],
-                    fill=self.style["header_color"],
-                    font_family=renderer.style["font_family_text"],
-                    font_weight=self.style["header_weight"],
                 )
             )
 
         # Render data rows for all 12 houses
-        for house_num in range(1, 13):
-            y = y_start + (house_num * self.style["line_height"])
-
-            # Get cusp longitude
-            cusp_longitude = houses.cusps[house_num - 1]
-
-            # Calculate sign and degree
-            sign_index = int(cusp_longitude / 30)
-            sign_names = [
-                "Aries",
-                "Taurus",
-                "Gemini",
-                "Cancer",
-                "Leo",
-                "Virgo",
-                "Libra",
-                "Scorpio",
-                "Sagittarius",
-                "Capricorn",
-                "Aquarius",
-                "Pisces",
-            ]
-            sign_name = sign_names[sign_index % 12]
-            degree_in_sign = cusp_longitude % 30
+        cusp_rows = _cusp_sign_degrees(houses.cusps)
+        for house_num, (sign_name, degree_text) in enumerate(cusp_rows, start=1):
+            y = y_start + house_num * line_height
 
             # Column 0: House number
             house_text = f"{house_num}"
-            dwg.add(
+            rows.add(
                 dwg.text(
                     house_text,
                     insert=(x_start, y),
-                    text_anchor="start",
                     dominant_baseline="hanging",
-                    font_size=self.style["text_size"],
-                    fill=self.style["text_color"],
-                    font_family=renderer.style["font_family_text"],
-                    font_weight=self.style["font_weight"],
                 )
             )
 
             # Column 1: Sign
-            x_sign = x_start + self.style["col_spacing"]
-            dwg.add(
+            rows.add(
                 dwg.text(
                     sign_name,
-                    insert=(x_sign, y),
-                    text_anchor="start",
+                    insert=(col_xs[1], y),
                     dominant_baseline="hanging",
-                    font_size=self.style["text_size"],
-                    fill=self.style["text_color"],
-                    font_family=renderer.style["font_family_text"],
-                    font_weight=self.style["font_weight"],
                 )
             )
 
             # Column 2: Degree
-            degrees = int(degree_in_sign)
-            minutes = int((degree_in_sign % 1) * 60)
-            degree_text = f"{degrees}°{minutes:02d}'"
-            x_degree = x_start + (2 * self.style["col_spacing"])
-            dwg.add(
+            rows.add(
                 dwg.text(
                     degree_text,
-                    insert=(x_degree, y),
-                    text_anchor="start",
+                    insert=(col_xs[2], y),
                     dominant_baseline="hanging",
-                    font_size=self.style["text_size"],
-                    fill=self.style["text_color"],
-                    font_family=renderer.style["font_family_text"],
-                    font_weight=self.style["font_weight"],
                 )
             )
 
     def _render_comparison_house_tables(
-        self, renderer: ChartRenderer, dwg: svgwrite.Drawing, comparison
+        self,
+        renderer: ChartRenderer,
+        dwg: svgwrite.Drawing,
+        group: svgwrite.container.Group,
+        comparison,
     ) -> None:
         """Render two separate side-by-side house cusp tables for comparison charts."""
         # Get house cusps from both charts
@@ -745,17 +819,19 @@ class HouseCuspTableLayer:
 
         if not houses1 or not houses2:
             return
+        if len(houses1.cusps) != 12 or len(houses2.cusps) != 12:
+            return
 
         # Calculate table width (3 columns: House, Sign, Degree)
         table_width = 3 * self.style["col_spacing"]
 
         # Render Chart 1 house table (left)
-        x_chart1 = self.x_offset
-        y_start = self.y_offset
+        x_chart1 = 0
+        y_start = 0
 
         # Chart 1 title
         title_text = f"{comparison.chart1_label or 'Chart 1'} Houses"
-        dwg.add(
+        group.add(
             dwg.text(
                 title_text,
                 insert=(x_chart1, y_start),
@@ -770,7 +846,7 @@ class HouseCuspTableLayer:
 
         # Render chart 1 house table (offset by title height)
         self._render_house_table_for_chart(
-            renderer, dwg, houses1, x_chart1, y_start + 20
+            renderer, dwg, group, houses1, x_chart1, y_start + 20
         )
 
         # Render Chart 2 house table (right, with spacing)
@@ -780,7 +856,7 @@ class HouseCuspTableLayer:
 
         # Chart 2 title
         title_text = f"{comparison.chart2_label or 'Chart 2'} Houses"
-        dwg.add(
+        group.add(
             dwg.text(
                 title_text,
                 insert=(x_chart2, y_start),
@@ -795,106 +871,75 @@ class HouseCuspTableLayer:
 
         # Render chart 2 house table (offset by title height)
         self._render_house_table_for_chart(
-            renderer, dwg, houses2, x_chart2, y_start + 20
+            renderer, dwg, group, houses2, x_chart2, y_start + 20
         )
 
     def _render_house_table_for_chart(
-        self, renderer: ChartRenderer, dwg: svgwrite.Drawing, houses, x_offset, y_offset
+        self,
+        renderer: ChartRenderer,
+        dwg: svgwrite.Drawing,
+        group: svgwrite.container.Group,
+        houses,
+        x_offset,
+        y_offset,
     ) -> None:
         """Render a house cusp table for a specific chart."""
         x_start = x_offset
         y_start = y_offset
 
+        # Header and data row texts share their font attributes via two groups
+        header_attrs, row_attrs = _table_text_attrs(self.style, renderer)
+        headers_group = group.add(dwg.g(**header_attrs))
+        rows = group.add(dwg.g(**row_attrs))
+
         # Header row
         headers = ["House", "Sign", "Degree"]
 
+        # Column x positions and row pitch are fixed for the whole table
+        col_spacing = self.style["col_spacing"]
+        line_height = self.style["line_height"]
+        col_xs = tuple(x_start + i * col_spacing for i in range(len(headers)))
+
         # Render headers
-        for i, header in enumerate(headers):
-            x = x_start + (i * self.style["col_spacing"])
-            dwg.add(
+        for x, header in zip(col_xs, headers, strict=True):
+            headers_group.add(
                 dwg.text(
                     header,
                     insert=(x, y_start),
-                    text_anchor="start",
                     dominant_baseline="hanging",
-                    font_size=self.style["header_size"],
-                    fill=self.style["header_color"],
-                    font_family=renderer.style["font_family_text"],
-                    font_weight=self.style["header_weight"],
                 )
             )
 
         # Render data rows for all 12 houses
-        for house_num in range(1, 13):
-            y = y_start + (house_num * self.style["line_height"])
-
-            # Get cusp longitude
-            cusp_longitude = houses.cusps[house_num - 1]
-
-            # Calculate sign and degree
-            sign_index = int(cusp_longitude / 30)
-            sign_names = [
-                "Aries",
-                "Taurus",
-                "Gemini",
-                "Cancer",
-                "Leo",
-                "Virgo",
-                "Libra",
-                "Scorpio",
-                "Sagittarius",
-                "Capricorn",
-                "Aquarius",
-                "Pisces",
-            ]
-            sign_name = sign_names[sign_index % 12]
-            degree_in_sign = cusp_longitude % 30
+        cusp_rows = _cusp_sign_degrees(houses.cusps)
+        for house_num, (sign_name, degree_text) in enumerate(cusp_rows, start=1):
+            y = y_start + house_num * line_height
 
             # Column 0: House number
             house_text = f"{house_num}"
-            dwg.add(
+            rows.add(
                 dwg.text(
                     house_text,
                     insert=(x_start, y),
-                    text_anchor="start",
                     dominant_baseline="hanging",
-                    font_size=self.style["text_size"],
-                    fill=self.style["text_color"],
-                    font_family=renderer.style["font_family_text"],
-                    font_weight=self.style["font_weight"],
                 )
             )
 
             # Column 1: Sign
-            x_sign = x_start + self.style["col_spacing"]
-            dwg.add(
+            rows.add(
                 dwg.text(
                     sign_name,
-                    insert=(x_sign, y),
-                    text_anchor="start",
+                    insert=(col_xs[1], y),
                     dominant_baseline="hanging",
-                    font_size=self.style["text_size"],
-                    fill=self.style["text_color"],
-                    font_family=renderer.style["font_family_text"],
-                    font_weight=self.style["font_weight"],
                 )
             )
 
             # Column 2: Degree
-            degrees = int(degree_in_sign)
-            minutes = int((degree_in_sign % 1) * 60)
-            degree_text = f"{degrees}°{minutes:02d}'"
-            x_degree = x_start + (2 * self.style["col_spacing"])
-            dwg.add(
+            rows.add(
                 dwg.text(
                     degree_text,
-                    insert=(x_degree, y),
-                    text_anchor="start",
+                    insert=(col_xs[2], y),
                     dominant_baseline="hanging",
-                    font_size=self.style["text_size"],
-                    fill=self.style["text_color"],
-                    font_family=renderer.style["font_family_text"],
-                    font_weight=self.style["font_weight"],
                 )
             )
 
@@ -950,205 +995,154 @@ class AspectarianLayer:
         """
         # Check if this is a Comparison object
         is_comparison = _is_comparison(chart)
-        cell_size = self.style["cell_size"]
-        padding = self.style.get("label_padding", 4)
+        style = self.style
+        cell_size = style["cell_size"]
+        half_cell = cell_size / 2
+        padding = style.get("label_padding", 4)
 
         if is_comparison:
-            # For comparisons: get all celestial objects using filter function
+            # For comparisons: get all celestial objects using filter function,
+            # in traditional order (planets first, nodes, points, then angles)
             # Chart1 objects (rows - inner wheel)
-            chart1_objects = _filter_objects_for_tables(
-                chart.chart1.positions, self.object_types
+            chart1_objects = _table_objects(
+                chart.chart1, self.object_types, "aspectarian"
             )
 
             # Chart2 objects (columns - outer wheel)
-            chart2_objects = _filter_objects_for_tables(
-                chart.chart2.positions, self.object_types
-            )
-
-            # Sort by traditional order (planets first, nodes, points, then angles)
-            object_order = [
-                "Sun",
-                "Moon",
-                "Mercury",
-                "Venus",
-                "Mars",
-                "Jupiter",
-                "Saturn",
-                "Uranus",
-                "Neptune",
-                "Pluto",
-                "North Node",
-                "True Node",
-                "Mean Node",
-                "ASC",
-                "AC",
-                "Ascendant",
-                "MC",
-                "Midheaven",
-            ]
-
-            chart1_objects.sort(
-                key=lambda p: object_order.index(p.name)
-                if p.name in object_order
-                else 99
-            )
-            chart2_objects.sort(
-                key=lambda p: object_order.index(p.name)
-                if p.name in object_order
-                else 99
+            chart2_objects = _table_objects(
+                chart.chart2, self.object_types, "aspectarian"
             )
 
-            # Build aspect lookup from cross_aspects
-            aspect_lookup = {}
-            for aspect in chart.cross_aspects:
-                # Key format: (chart1_obj_name, chart2_obj_name)
-                key = (aspect.object1.name, aspect.object2.name)
-                aspect_lookup[key] = aspect
-
             # Use chart1_objects for rows, chart2_objects for columns
             row_objects = chart1_objects
             col_objects = chart2_objects
 
-        else:
-            # Standard CalculatedChart - use filter function to include angles and nodes
-            planets = _filter_objects_for_tables(chart.positions, self.object_types)
-
-            # Sort by traditional order (planets, nodes, points, angles)
-            planet_order = [
-                "Sun",
-                "Moon",
-                "Mercury",
-                "Venus",
-                "Mars",
-                "Jupiter",
-                "Saturn",
-                "Uranus",
-                "Neptune",
-                "Pluto",
-                "North Node",
-                "True Node",
-                "Mean Node",
-                "ASC",
-                "AC",
-                "Ascendant",
-                "MC",
-                "Midheaven",
-            ]
-            planets.sort(
-                key=lambda p: planet_order.index(p.name)
-                if p.name in planet_order
-                else 99
+            # Lay out cross_aspects (directional: chart1 object is the row)
+            aspect_cells = _aspect_cells(
+                chart.cross_aspects,
+                [obj.name for obj in row_objects],
+                [obj.name for obj in col_objects],
+                style["text_color"],
             )
 
-            # Build aspect lookup
-            aspect_lookup = {}
-            for aspect in chart.aspects:
-                key1 = (aspect.object1.name, aspect.object2.name)
-                key2 = (aspect.object2.name, aspect.object1.name)
-                aspect_lookup[key1] = aspect
-                aspect_lookup[key2] = aspect
+        else:
+            # Standard CalculatedChart - use filter function to include angles and
+            # nodes, in traditional order (planets, nodes, points, angles)
+            planets = _table_objects(chart, self.object_types, "aspectarian")
 
             # Use planets for both rows and columns (traditional triangle grid)
             row_objects = planets
             col_objects = planets
 
-        # Render grid
-        cell_size = self.style["cell_size"]
-        x_start = self.x_offset
-        y_start = self.y_offset
+            # Lay out aspects; natal aspects have no direction, so each one
+            # fills both cells of its pair
+            names = [obj.name for obj in planets]
+            aspect_cells = _aspect_cells(
+                chart.aspects, names, names, style["text_color"], symmetric=True
+            )
+
+        # Nothing to tabulate (e.g. object_types matched no positions)
+        if not row_objects or not col_objects:
+            return
+
+        # Render grid relative to its origin; one translate on the group
+        # positions the whole aspectarian
+        # Each object heads both a row and a column; resolve its glyph once
+        glyphs = {
+            obj.name: _header_glyph(obj.name) for obj in (*row_objects, *col_objects)
+        }
+        x_start = 0
+        y_start = 0
+        group = dwg.g(transform=f"translate({self.x_offset}, {self.y_offset})")
+        # Header glyphs and aspect glyphs share their font attributes via
+        # their parents; row headers and aspect cells are each one <text>
+        # whose positioned <tspan>s inherit anchor and baseline
+        glyph_font = renderer.style["font_family_glyphs"]
+        header_glyphs = group.add(
+            dwg.g(
+                font_size=style["header_size"],
+                fill=style["header_color"],
+                font_family=glyph_font,
+                font_weight=style["header_weight"],
+            )
+        )
+        row_headers = header_glyphs.add(
+            dwg.text("", text_anchor="end", dominant_baseline="middle")
+        )
+        cells = group.add(
+            dwg.text(
+                "",
+                text_anchor="middle",
+                dominant_baseline="middle",
+                font_size=style["text_size"],
+                font_family=glyph_font,
+                font_weight=style["font_weight"],
+            )
+        )
+        show_grid = style["show_grid"]
+        # Row headers are right-aligned against the grid edge
+        x_text = x_start + cell_size - padding
 
         if is_comparison:
             # For comparisons: full rectangular grid (chart1 rows × chart2 columns)
             # Column headers (chart2 objects - outer wheel) - aligned at left edge of column
             for col_idx, obj in enumerate(col_objects):
-                glyph_info = get_glyph(obj.name)
-                glyph = (
-                    glyph_info["value"]
-                    if glyph_info["type"] == "unicode"
-                    else obj.name[:2]
-                )
+                glyph = glyphs[obj.name]
 
                 # Add ② indicator for chart2
                 glyph = f"{glyph}₂"
 
                 # Center of the column
-                x = x_start + (col_idx * cell_size) + (cell_size / 2)
+                x = x_start + (col_idx * cell_size) + half_cell
 
                 # Bottom of the text sits just above the first row (y_start + cell_size)
                 # We subtract the padding from the top of the grid
                 y = y_start + cell_size - padding
 
-                dwg.add(
+                header_glyphs.add(
                     dwg.text(
                         glyph,
                         insert=(x, y),
                         text_anchor="middle",  # Center aligned
                         # dominant_baseline="hanging",
-                        font_size=self.style["header_size"],
-                        fill=self.style["header_color"],
-                        font_family=renderer.style["font_family_glyphs"],
-                        font_weight=self.style["header_weight"],
                     )
                 )
 
+            # Column left edges and centers are shared by every row
+            n_cols = len(col_objects)
+            lefts = tuple(
+                x_start + cell_size + (col_idx * cell_size)
+                for col_idx in range(len(col_objects))
+            )
+            centers = tuple(left + half_cell for left in lefts)
+            # Grid outlines: (row top, cell left edges); every row spans all columns
+            grid_rows = tuple(
+                (fmt(y_start + ((row_idx + 1) * cell_size)), lefts)
+                for row_idx in range(len(row_objects))
+            )
+
             # Row headers (chart1 objects - inner wheel) and grid cells
             for row_idx, obj_row in enumerate(row_objects):
-                glyph_info = get_glyph(obj_row.name)
-                glyph = (
-                    glyph_info["value"]
-                    if glyph_info["type"] == "unicode"
-                    else obj_row.name[:2]
-                )
+                glyph = glyphs[obj_row.name]
 
                 # Add ① indicator for chart1
                 glyph = f"{glyph}₁"
 
                 # Center of the row vertically
-                y_row_center = y_start + ((row_idx + 1) * cell_size) + (cell_size / 2)
+                y_row_center = y_start + ((row_idx + 1) * cell_size) + half_cell
 
-                # Right-align text against the grid edge (x_start + cell_size)
-                x_text = x_start + cell_size - padding
-
-                # Row header
-                dwg.add(
-                    dwg.text(
-                        glyph,
-                        insert=(x_text, y_row_center),
-                        text_anchor="end",  # Right aligned (tight to grid)
-                        dominant_baseline="middle",
-                        font_size=self.style["header_size"],
-                        fill=self.style["header_color"],
-                        font_family=renderer.style["font_family_glyphs"],
-                        font_weight=self.style["header_weight"],
-                    )
-                )
+                # Row header, right aligned (tight to grid)
+                row_headers.add(dwg.tspan(glyph, insert=(x_text, y_row_center)))
 
                 # Grid cells (all columns for rectangular grid)
-                for col_idx, obj_col in enumerate(col_objects):
-                    cell_x_left = x_start + cell_size + (col_idx * cell_size)
-                    cell_x_center = cell_x_left + (cell_size / 2)
-
-                    # Draw grid lines if enabled
-                    if self.style["show_grid"]:
-                        cell_y = y_start + ((row_idx + 1) * cell_size)
-
-                        dwg.add(
-                            dwg.rect(
-                                insert=(cell_x_left, cell_y),
-                                size=(cell_size, cell_size),
-                                fill="none",
-                                stroke=self.style["grid_color"],
-                                stroke_width=0.5,
-                            )
-                        )
-
-                    # Aspects
-                    aspect_key = (obj_row.name, obj_col.name)
-                    if aspect_key in aspect_lookup:
+                row_start = row_idx * n_cols
+                row_cells = aspect_cells[row_start : row_start + n_cols]
+                for cell, cell_x_center in zip(row_cells, centers, strict=True):
+                    if cell is not None:
                         self._render_aspect_glyph(
                             dwg,
-                            renderer,
-                            aspect_lookup[aspect_key],
+                            cells,
+                            *cell,
                             cell_x_center,
                             y_row_center,
                         )
@@ -1160,125 +1154,92 @@ class AspectarianLayer:
             # Only go up to len - 1 because the last planet never heads a column in a triangle
             for col_idx in range(len(row_objects) - 1):
                 obj = row_objects[col_idx]
-                glyph_info = get_glyph(obj.name)
-                glyph = (
-                    glyph_info["value"]
-                    if glyph_info["type"] == "unicode"
-                    else obj.name[:2]
-                )
+                glyph = glyphs[obj.name]
 
                 # Center of the column
-                x = x_start + ((col_idx + 1) * cell_size) + (cell_size / 2)
+                x = x_start + ((col_idx + 1) * cell_size) + half_cell
                 # STAIR STEP CALCULATION:
                 # The column for planet index `i` starts at row index `i + 1`.
                 # We want the label to sit on top of that first box.
                 # Top of first box = y_start + ((col_idx + 1) * cell_size)
                 y = y_start + ((col_idx + 1) * cell_size) - padding
 
-                dwg.add(
+                header_glyphs.add(
                     dwg.text(
                         glyph,
                         insert=(x, y),
                         text_anchor="middle",  # Center aligned
                         # dominant_baseline="hanging",
-                        font_size=self.style["header_size"],
-                        fill=self.style["header_color"],
-                        font_family=renderer.style["font_family_glyphs"],
-                        font_weight=self.style["header_weight"],
                     )
                 )
 
+            # Left edges and centers of the n - 1 triangle columns; row i only
+            # spans the first i of them
+            n_cols = len(row_objects)
+            lefts = tuple(
+                x_start + cell_size + (col_idx * cell_size)
+                for col_idx in range(len(row_objects) - 1)
+            )
+            centers = tuple(left + half_cell for left in lefts)
+            # Grid outlines: (row top, cell left edges) for the lower triangle
+            grid_rows = tuple(
+                (fmt(y_start + (row_idx * cell_size)), lefts[:row_idx])
+                for row_idx in range(1, len(row_objects))
+            )
+
             # Row headers (left) and grid cells (lower triangle only)
             for row_idx in range(1, len(row_objects)):
                 obj_row = row_objects[row_idx]
-                glyph_info = get_glyph(obj_row.name)
-                glyph = (
-                    glyph_info["value"]
-                    if glyph_info["type"] == "unicode"
-                    else obj_row.name[:2]
-                )
-
-                y_row_center = y_start + (row_idx * cell_size) + (cell_size / 2)
+                glyph = glyphs[obj_row.name]
 
-                # Right-align text against the grid edge
-                x_text = x_start + cell_size - padding
+                cell_y = y_start + (row_idx * cell_size)
+                y_row_center = cell_y + half_cell
 
-                # Row header
-                dwg.add(
-                    dwg.text(
-                        glyph,
-                        insert=(x_text, y_row_center),
-                        text_anchor="end",  # Right aligned
-                        dominant_baseline="middle",
-                        font_size=self.style["header_size"],
-                        fill=self.style["header_color"],
-                        font_family=renderer.style["font_family_glyphs"],
-                        font_weight=self.style["header_weight"],
-                    )
-                )
+                # Row header, right aligned
+                row_headers.add(dwg.tspan(glyph, insert=(x_text, y_row_center)))
 
                 # Grid cells (only lower triangle)
-                for col_idx in range(row_idx):
-                    obj_col = row_objects[col_idx]
-                    cell_x_left = x_start + cell_size + (col_idx * cell_size)
-                    cell_x_center = cell_x_left + (cell_size / 2)
-
-                    # Draw grid lines if enabled
-                    if self.style["show_grid"]:
-                        # Cell border
-                        cell_y = y_start + (row_idx * cell_size)
-
-                        dwg.add(
-                            dwg.rect(
-                                insert=(cell_x_left, cell_y),
-                                size=(cell_size, cell_size),
-                                fill="none",
-                                stroke=self.style["grid_color"],
-                                stroke_width=0.5,
-                            )
-                        )
-
-                    # Check for aspect
-                    aspect_key = (obj_row.name, obj_col.name)
-                    if aspect_key in aspect_lookup:
+                row_start = row_idx * n_cols
+                row_cells = aspect_cells[row_start : row_start + row_idx]
+                for cell, cell_x_center in zip(
+                    row_cells, centers[:row_idx], strict=True
+                ):
+                    if cell is not None:
                         self._render_aspect_glyph(
                             dwg,
-                            renderer,
-                            aspect_lookup[aspect_key],
+                            cells,
+                            *cell,
                             cell_x_center,
                             y_row_center,
                         )
 
+        # All cell outlines share one stroke, so draw them as a single path;
+        # the grid setting is checked once here rather than per cell
+        if show_grid and grid_rows:
+            side = fmt(cell_size)
+            group.add(
+                dwg.path(
+                    d="".join(
+                        f"M{fmt(x)} {row_top}h{side}v{side}h-{side}z"
+                        for row_top, row_lefts in grid_rows
+                        for x in row_lefts
+                    ),
+                    fill="none",
+                    stroke=style["grid_color"],
+                    stroke_width=0.5,
+                )
+            )
+
+        dwg.add(group)
+
     def _render_aspect_glyph(
         self,
         dwg: svgwrite.Drawing,
-        renderer: ChartRenderer,
-        aspect: Aspect,
+        cells: svgwrite.text.Text,
+        aspect_glyph: str,
+        text_color: str,
         x: float,
         y: float,
     ):
-        """Helper to render the aspect glyph in a cell."""
-        aspect_info = get_aspect_info(aspect.aspect_name)
-
-        if aspect_info and aspect_info.glyph:
-            aspect_glyph = aspect_info.glyph
-        else:
-            aspect_glyph = aspect.aspect_name[:1]
-
-        if aspect_info and aspect_info.color:
-            text_color = aspect_info.color
-        else:
-            text_color = self.style["text_color"]
-
-        dwg.add(
-            dwg.text(
-                aspect_glyph,
-                insert=(x, y),
-                text_anchor="middle",
-                dominant_baseline="middle",
-                font_size=self.style["text_size"],
-                fill=text_color,
-                font_family=renderer.style["font_family_glyphs"],
-                font_weight=self.style["font_weight"],
-            )
-        )
+        """Helper to render the aspect glyph in a cell (fonts come from cells)."""
+        cells.add(dwg.tspan(aspect_glyph, insert=(x, y), fill=text_color))
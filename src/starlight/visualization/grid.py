@@ -7,15 +7,15 @@ Similar to matplotlib's subplot functionality but for astrology charts.
 
 from typing import Any
 
-import svgwrite
-
-from starlight.core.models import CalculatedChart, ObjectType
+from starlight.core.models import CalculatedChart
 
 from .core import ChartRenderer
+from .drawing import drawable_positions, resolve_theme_defaults, to_palette_str
 from .layers import AngleLayer, AspectLayer, HouseCuspLayer, PlanetLayer, ZodiacLayer
 from .moon_phase import MoonPhaseLayer
 from .palettes import ZodiacPalette
-from .themes import ChartTheme, get_theme_default_palette
+from .svg_writer import FastSVGWriter
+from .themes import ChartTheme
 
 
 def draw_chart_grid(
@@ -107,7 +107,7 @@ def draw_chart_grid(
     total_height = rows * (chart_size + label_height) + (rows + 1) * padding
 
     # Create main SVG
-    dwg = svgwrite.Drawing(
+    dwg = FastSVGWriter(
         filename=filename,
         size=(f"{total_width}px", f"{total_height}px"),
         viewBox=f"0 0 {total_width} {total_height}",
@@ -142,20 +142,12 @@ def draw_chart_grid(
         planet_glyph_palette = get_item(planet_glyph_palettes, i)
         label = get_item(labels, i)
 
-        # Determine theme and palette
-        if theme:
-            theme_enum = ChartTheme(theme) if isinstance(theme, str) else theme
-            if zodiac_palette is None:
-                zodiac_palette = get_theme_default_palette(theme_enum)
-        else:
-            if zodiac_palette is None:
-                zodiac_palette = ZodiacPalette.GREY
-
-        # Convert zodiac_palette to string
-        if hasattr(zodiac_palette, "value"):
-            zodiac_palette_str = zodiac_palette.value
-        else:
-            zodiac_palette_str = zodiac_palette
+        # Determine theme and palette (theme defaults are cached per theme)
+        if zodiac_palette is None:
+            zodiac_palette = (
+                resolve_theme_defaults(theme)[0] if theme else ZodiacPalette.GREY
+            )
+        zodiac_palette_str = to_palette_str(zodiac_palette)
 
         # Get rotation angle
         asc_object = chart.get_object("ASC")
@@ -173,15 +165,9 @@ def draw_chart_grid(
             color_zodiac_glyphs=color_zodiac_glyphs,
         )
 
-        # Create a group for this chart
-        chart_group = dwg.g(transform=f"translate({x},{y})")
-
-        # Create chart elements (we'll render them into a temporary drawing
-        # then copy the elements into our group)
-        # This is a bit of a workaround since we can't directly share drawings
-
-        # Create a mini-SVG for this chart
-        mini_dwg = svgwrite.Drawing(size=(chart_size, chart_size))
+        # Render the chart into its own writer, then wrap the serialized
+        # elements in a translated group (layers can't share a drawing)
+        mini_dwg = FastSVGWriter(size=(chart_size, chart_size))
 
         # Add background and borders (from renderer.create_svg_drawing logic)
         mini_dwg.add(
@@ -211,12 +197,7 @@ def draw_chart_grid(
         )
 
         # Get planets to draw
-        planets_to_draw = [
-            p
-            for p in chart.positions
-            if p.object_type
-            in (ObjectType.PLANET, ObjectType.ASTEROID, ObjectType.NODE, ObjectType.POINT)
-        ]
+        planets_to_draw = drawable_positions(chart)
 
         # Assemble layers
         layers = [
@@ -234,12 +215,8 @@ def draw_chart_grid(
         for layer in layers:
             layer.render(renderer, mini_dwg, chart)
 
-        # Copy all elements from mini_dwg to chart_group
-        for element in mini_dwg.elements:
-            chart_group.add(element)
-
-        # Add chart group to main drawing
-        dwg.add(chart_group)
+        # Add the chart as a group to the main drawing
+        dwg.write(f'<g transform="translate({x},{y})">{mini_dwg.body()}</g>')
 
         # Add label if provided
         if label:
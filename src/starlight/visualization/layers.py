@@ -31,6 +31,7 @@ from .palettes import (
     get_planet_glyph_color,
     get_sign_info_color,
 )
+from .svg_writer import fmt
 
 
 class ZodiacLayer:
@@ -97,10 +98,13 @@ class ZodiacLayer:
 
             # Create path: outer arc + line + inner arc (reverse) + line back
             # All signs are 30° so never need large arc flag
-            path_data = f"M {x_outer_start},{y_outer_start} "
-            path_data += f"A {renderer.radii['zodiac_ring_outer']},{renderer.radii['zodiac_ring_outer']} 0 0,0 {x_outer_end},{y_outer_end} "
-            path_data += f"L {x_inner_end},{y_inner_end} "
-            path_data += f"A {renderer.radii['zodiac_ring_inner']},{renderer.radii['zodiac_ring_inner']} 0 0,1 {x_inner_start},{y_inner_start} "
+            # (coordinates capped at COORD_PRECISION decimals)
+            r_outer = fmt(renderer.radii["zodiac_ring_outer"])
+            r_inner = fmt(renderer.radii["zodiac_ring_inner"])
+            path_data = f"M {fmt(x_outer_start)},{fmt(y_outer_start)} "
+            path_data += f"A {r_outer},{r_outer} 0 0,0 {fmt(x_outer_end)},{fmt(y_outer_end)} "
+            path_data += f"L {fmt(x_inner_end)},{fmt(y_inner_end)} "
+            path_data += f"A {r_inner},{r_inner} 0 0,1 {fmt(x_inner_start)},{fmt(y_inner_start)} "
             path_data += "Z"
 
             dwg.add(
@@ -261,10 +265,13 @@ class HouseCuspLayer:
                 large_arc = 1 if angle_diff > 180 else 0
 
                 # Create path: outer arc + line + inner arc + line back
-                path_data = f"M {x_outer_start},{y_outer_start} "
-                path_data += f"A {renderer.radii['zodiac_ring_inner']},{renderer.radii['zodiac_ring_inner']} 0 {large_arc},0 {x_outer_end},{y_outer_end} "
-                path_data += f"L {x_end},{y_end} "
-                path_data += f"A {renderer.radii['aspect_ring_inner']},{renderer.radii['aspect_ring_inner']} 0 {large_arc},1 {x_start},{y_start} "
+                # (coordinates capped at COORD_PRECISION decimals)
+                r_outer = fmt(renderer.radii["zodiac_ring_inner"])
+                r_inner = fmt(renderer.radii["aspect_ring_inner"])
+                path_data = f"M {fmt(x_outer_start)},{fmt(y_outer_start)} "
+                path_data += f"A {r_outer},{r_outer} 0 {large_arc},0 {fmt(x_outer_end)},{fmt(y_outer_end)} "
+                path_data += f"L {fmt(x_end)},{fmt(y_end)} "
+                path_data += f"A {r_inner},{r_inner} 0 {large_arc},1 {fmt(x_start)},{fmt(y_start)} "
                 path_data += "Z"
 
                 dwg.add(
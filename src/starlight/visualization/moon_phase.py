@@ -17,6 +17,7 @@ from starlight.core.models import (
 )
 
 from .core import ChartRenderer
+from .svg_writer import fmt
 
 
 class MoonPhaseLayer:
@@ -425,13 +426,13 @@ class MoonPhaseLayer:
             # Crescent on right side
             path = f"M 0 {-radius} "
             path += f"A {radius} {radius} 0 0 1 0 {radius} "
-            path += f"A {terminator_width} {radius} 0 0 0 0 {-radius} "
+            path += f"A {fmt(terminator_width)} {radius} 0 0 0 0 {-radius} "
             path += "Z"
         else:
             # Crescent on left side
             path = f"M 0 {-radius} "
             path += f"A {radius} {radius} 0 0 0 0 {radius} "
-            path += f"A {terminator_width} {radius} 0 0 1 0 {-radius} "
+            path += f"A {fmt(terminator_width)} {radius} 0 0 1 0 {-radius} "
             path += "Z"
 
         return path
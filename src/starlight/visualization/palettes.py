@@ -43,310 +43,356 @@ class ZodiacPalette(str, Enum):
     SPECTRAL = "spectral"
 
 
-# Zodiac sign properties for palette mapping
-SIGN_ELEMENTS = {
-    0: "fire",  # Aries
-    1: "earth",  # Taurus
-    2: "air",  # Gemini
-    3: "water",  # Cancer
-    4: "fire",  # Leo
-    5: "earth",  # Virgo
-    6: "air",  # Libra
-    7: "water",  # Scorpio
-    8: "fire",  # Sagittarius
-    9: "earth",  # Capricorn
-    10: "air",  # Aquarius
-    11: "water",  # Pisces
-}
-
-SIGN_MODALITIES = {
-    0: "cardinal",  # Aries
-    1: "fixed",  # Taurus
-    2: "mutable",  # Gemini
-    3: "cardinal",  # Cancer
-    4: "fixed",  # Leo
-    5: "mutable",  # Virgo
-    6: "cardinal",  # Libra
-    7: "fixed",  # Scorpio
-    8: "mutable",  # Sagittarius
-    9: "cardinal",  # Capricorn
-    10: "fixed",  # Aquarius
-    11: "mutable",  # Pisces
-}
-
-
-@lru_cache(maxsize=128)
-def get_palette_colors(palette: ZodiacPalette | str) -> list[str]:
-    """
-    Get the color list for a zodiac wheel palette.
-
-    Returns a list of 12 colors (one per sign, starting with Aries).
-    Results are cached in memory for performance.
-
-    Special case: If palette is a string starting with "single_color:",
-    extracts the hex color and returns 12 copies of it for a monochrome wheel.
-
-    Args:
-        palette: The palette to use (ZodiacPalette enum or "single_color:#RRGGBB" string)
-
-    Returns:
-        List of 12 hex color strings
-    """
-    # Handle dynamic single-color palettes
-    if isinstance(palette, str) and palette.startswith("single_color:"):
-        # Extract hex color from "single_color:#RRGGBB"
-        color = palette.split(":", 1)[1]
-        return [color] * 12
-
-    # Convert string to enum if needed (for backwards compatibility)
-    if isinstance(palette, str):
-        palette = ZodiacPalette(palette)
-
-    if palette == ZodiacPalette.GREY:
-        # All signs same color (classic grey)
-        return ["#EEEEEE"] * 12
-
-    elif palette == ZodiacPalette.RAINBOW:
-        # Tasteful rainbow: soft, desaturated colors progressing through hue wheel
-        # Starting with Aries (red) and progressing through the spectrum
-        return [
-            "#E8B4B8",  # Aries - soft red
-            "#E8C4B8",  # Taurus - soft orange
-            "#E8D8B8",  # Gemini - soft yellow-orange
-            "#E8E8B8",  # Cancer - soft yellow
-            "#D8E8B8",  # Leo - soft yellow-green
-            "#C4E8B8",  # Virgo - soft green
-            "#B8E8C4",  # Libra - soft cyan-green
-            "#B8E8D8",  # Scorpio - soft cyan
-            "#B8D8E8",  # Sagittarius - soft blue
-            "#B8C4E8",  # Capricorn - soft indigo
-            "#C4B8E8",  # Aquarius - soft violet
-            "#D8B8E8",  # Pisces - soft magenta
-        ]
-
-    elif palette == ZodiacPalette.ELEMENTAL:
-        # 4-color elemental palette
-        element_colors = {
+# Zodiac sign properties for palette mapping, indexed by sign (0 = Aries)
+SIGN_ELEMENTS: tuple[str, ...] = (
+    "fire",  # Aries
+    "earth",  # Taurus
+    "air",  # Gemini
+    "water",  # Cancer
+    "fire",  # Leo
+    "earth",  # Virgo
+    "air",  # Libra
+    "water",  # Scorpio
+    "fire",  # Sagittarius
+    "earth",  # Capricorn
+    "air",  # Aquarius
+    "water",  # Pisces
+)
+
+SIGN_MODALITIES: tuple[str, ...] = (
+    "cardinal",  # Aries
+    "fixed",  # Taurus
+    "mutable",  # Gemini
+    "cardinal",  # Cancer
+    "fixed",  # Leo
+    "mutable",  # Virgo
+    "cardinal",  # Libra
+    "fixed",  # Scorpio
+    "mutable",  # Sagittarius
+    "cardinal",  # Capricorn
+    "fixed",  # Aquarius
+    "mutable",  # Pisces
+)
+
+
+def _by_element(element_colors: dict[str, str]) -> tuple[str, ...]:
+    """Expand per-element colors to 12 sign colors."""
+    return tuple(element_colors[element] for element in SIGN_ELEMENTS)
+
+
+def _by_modality(modality_colors: dict[str, str]) -> tuple[str, ...]:
+    """Expand per-modality colors to 12 sign colors."""
+    return tuple(modality_colors[modality] for modality in SIGN_MODALITIES)
+
+
+# Sign colors for each palette (12 per palette, starting with Aries), built
+# once at import
+_PALETTE_TABLES: dict[ZodiacPalette, tuple[str, ...]] = {
+    # All signs same color (classic grey)
+    ZodiacPalette.GREY: ("#EEEEEE",) * 12,
+
+    # Tasteful rainbow: soft, desaturated colors progressing through hue wheel
+    # Starting with Aries (red) and progressing through the spectrum
+    ZodiacPalette.RAINBOW: (
+        "#E8B4B8",  # Aries - soft red
+        "#E8C4B8",  # Taurus - soft orange
+        "#E8D8B8",  # Gemini - soft yellow-orange
+        "#E8E8B8",  # Cancer - soft yellow
+        "#D8E8B8",  # Leo - soft yellow-green
+        "#C4E8B8",  # Virgo - soft green
+        "#B8E8C4",  # Libra - soft cyan-green
+        "#B8E8D8",  # Scorpio - soft cyan
+        "#B8D8E8",  # Sagittarius - soft blue
+        "#B8C4E8",  # Capricorn - soft indigo
+        "#C4B8E8",  # Aquarius - soft violet
+        "#D8B8E8",  # Pisces - soft magenta
+    ),
+
+    # 4-color elemental palette
+    ZodiacPalette.ELEMENTAL: _by_element(
+        {
             "fire": "#F4D4D4",  # Soft warm red
             "earth": "#D4E4D4",  # Soft green
             "air": "#D4E4F4",  # Soft blue
             "water": "#E4D4F4",  # Soft purple
         }
-        return [element_colors[SIGN_ELEMENTS[i]] for i in range(12)]
+    ),
 
-    elif palette == ZodiacPalette.CARDINALITY:
-        # 3-color cardinality/modality palette
-        modality_colors = {
+    # 3-color cardinality/modality palette
+    ZodiacPalette.CARDINALITY: _by_modality(
+        {
             "cardinal": "#F4E4D4",  # Soft peach (initiating)
             "fixed": "#D4E4E4",  # Soft teal (sustaining)
             "mutable": "#E4D4E4",  # Soft lavender (adapting)
         }
-        return [modality_colors[SIGN_MODALITIES[i]] for i in range(12)]
+    ),
 
     # ========================================================================
     # Theme-coordinated rainbow variants
     # ========================================================================
 
-    elif palette == ZodiacPalette.RAINBOW_DARK:
-        # Dark theme: Muted, darker rainbow colors
-        return [
-            "#B88B8F",  # Aries - muted red
-            "#B89B8F",  # Taurus - muted orange
-            "#B8AB8F",  # Gemini - muted yellow-orange
-            "#B8B88F",  # Cancer - muted yellow
-            "#ABB88F",  # Leo - muted yellow-green
-            "#9BB88F",  # Virgo - muted green
-            "#8FB89B",  # Libra - muted cyan-green
-            "#8FB8AB",  # Scorpio - muted cyan
-            "#8FABB8",  # Sagittarius - muted blue
-            "#8F9BB8",  # Capricorn - muted indigo
-            "#9B8FB8",  # Aquarius - muted violet
-            "#AB8FB8",  # Pisces - muted magenta
-        ]
-
-    elif palette == ZodiacPalette.RAINBOW_MIDNIGHT:
-        # Midnight theme: Cool, deep blues and purples
-        return [
-            "#4A5A7C",  # Aries - deep blue-grey
-            "#3A6A8C",  # Taurus - deep cyan-blue
-            "#3A7A9C",  # Gemini - deep cyan
-            "#3A8AAC",  # Cancer - deep sky blue
-            "#3A8A9C",  # Leo - deep teal
-            "#3A9A8C",  # Virgo - deep blue-green
-            "#3A9A7C",  # Libra - deep sea green
-            "#3A8A6C",  # Scorpio - deep forest green
-            "#4A6A7C",  # Sagittarius - deep blue
-            "#5A5A8C",  # Capricorn - deep indigo
-            "#6A4A8C",  # Aquarius - deep purple
-            "#7A3A8C",  # Pisces - deep magenta
-        ]
-
-    elif palette == ZodiacPalette.RAINBOW_NEON:
-        # Neon theme: Super bright, saturated neon colors
-        return [
-            "#FF00AA",  # Aries - hot pink
-            "#FF3300",  # Taurus - neon orange-red
-            "#FF6600",  # Gemini - neon orange
-            "#FFFF00",  # Cancer - electric yellow
-            "#AAFF00",  # Leo - neon lime
-            "#00FF00",  # Virgo - electric green
-            "#00FFAA",  # Libra - neon cyan-green
-            "#00FFFF",  # Scorpio - electric cyan
-            "#0088FF",  # Sagittarius - neon blue
-            "#0000FF",  # Capricorn - electric blue
-            "#AA00FF",  # Aquarius - neon violet
-            "#FF00FF",  # Pisces - electric magenta
-        ]
-
-    elif palette == ZodiacPalette.RAINBOW_SEPIA:
-        # Sepia theme: Warm browns, oranges, and earth tones
-        return [
-            "#C4A090",  # Aries - terracotta
-            "#C4AA90",  # Taurus - warm tan
-            "#C4B490",  # Gemini - sandy brown
-            "#C4BE90",  # Cancer - wheat
-            "#B4C490",  # Leo - sage
-            "#AAC490",  # Virgo - olive
-            "#90C4AA",  # Libra - sea foam brown
-            "#90C4B4",  # Scorpio - sage blue
-            "#90B4C4",  # Sagittarius - dusty blue
-            "#90AAC4",  # Capricorn - slate blue
-            "#A090C4",  # Aquarius - dusty purple
-            "#AA90C4",  # Pisces - mauve
-        ]
-
-    elif palette == ZodiacPalette.RAINBOW_CELESTIAL:
-        # Celestial theme: Deep cosmic purples, blues, and golds
-        return [
-            "#9B4FA3",  # Aries - cosmic purple
-            "#8B5FAF",  # Taurus - deep lavender
-            "#7B6FAF",  # Gemini - periwinkle
-            "#6B7FAF",  # Cancer - cosmic blue
-            "#5B8FAF",  # Leo - stellar blue
-            "#4B9FAF",  # Virgo - galaxy cyan
-            "#4BAFAF",  # Libra - nebula teal
-            "#4BAFAF",  # Scorpio - deep teal
-            "#5B9FAF",  # Sagittarius - space blue
-            "#6B8FAF",  # Capricorn - cosmic indigo
-            "#7B7FAF",  # Aquarius - deep violet
-            "#8B6FAF",  # Pisces - stellar purple
-        ]
+    # Dark theme: Muted, darker rainbow colors
+    ZodiacPalette.RAINBOW_DARK: (
+        "#B88B8F",  # Aries - muted red
+        "#B89B8F",  # Taurus - muted orange
+        "#B8AB8F",  # Gemini - muted yellow-orange
+        "#B8B88F",  # Cancer - muted yellow
+        "#ABB88F",  # Leo - muted yellow-green
+        "#9BB88F",  # Virgo - muted green
+        "#8FB89B",  # Libra - muted cyan-green
+        "#8FB8AB",  # Scorpio - muted cyan
+        "#8FABB8",  # Sagittarius - muted blue
+        "#8F9BB8",  # Capricorn - muted indigo
+        "#9B8FB8",  # Aquarius - muted violet
+        "#AB8FB8",  # Pisces - muted magenta
+    ),
+
+    # Midnight theme: Cool, deep blues and purples
+    ZodiacPalette.RAINBOW_MIDNIGHT: (
+        "#4A5A7C",  # Aries - deep blue-grey
+        "#3A6A8C",  # Taurus - deep cyan-blue
+        "#3A7A9C",  # Gemini - deep cyan
+        "#3A8AAC",  # Cancer - deep sky blue
+        "#3A8A9C",  # Leo - deep teal
+        "#3A9A8C",  # Virgo - deep blue-green
+        "#3A9A7C",  # Libra - deep sea green
+        "#3A8A6C",  # Scorpio - deep forest green
+        "#4A6A7C",  # Sagittarius - deep blue
+        "#5A5A8C",  # Capricorn - deep indigo
+        "#6A4A8C",  # Aquarius - deep purple
+        "#7A3A8C",  # Pisces - deep magenta
+    ),
+
+    # Neon theme: Super bright, saturated neon colors
+    ZodiacPalette.RAINBOW_NEON: (
+        "#FF00AA",  # Aries - hot pink
+        "#FF3300",  # Taurus - neon orange-red
+        "#FF6600",  # Gemini - neon orange
+        "#FFFF00",  # Cancer - electric yellow
+        "#AAFF00",  # Leo - neon lime
+        "#00FF00",  # Virgo - electric green
+        "#00FFAA",  # Libra - neon cyan-green
+        "#00FFFF",  # Scorpio - electric cyan
+        "#0088FF",  # Sagittarius - neon blue
+        "#0000FF",  # Capricorn - electric blue
+        "#AA00FF",  # Aquarius - neon violet
+        "#FF00FF",  # Pisces - electric magenta
+    ),
+
+    # Sepia theme: Warm browns, oranges, and earth tones
+    ZodiacPalette.RAINBOW_SEPIA: (
+        "#C4A090",  # Aries - terracotta
+        "#C4AA90",  # Taurus - warm tan
+        "#C4B490",  # Gemini - sandy brown
+        "#C4BE90",  # Cancer - wheat
+        "#B4C490",  # Leo - sage
+        "#AAC490",  # Virgo - olive
+        "#90C4AA",  # Libra - sea foam brown
+        "#90C4B4",  # Scorpio - sage blue
+        "#90B4C4",  # Sagittarius - dusty blue
+        "#90AAC4",  # Capricorn - slate blue
+        "#A090C4",  # Aquarius - dusty purple
+        "#AA90C4",  # Pisces - mauve
+    ),
+
+    # Celestial theme: Deep cosmic purples, blues, and golds
+    ZodiacPalette.RAINBOW_CELESTIAL: (
+        "#9B4FA3",  # Aries - cosmic purple
+        "#8B5FAF",  # Taurus - deep lavender
+        "#7B6FAF",  # Gemini - periwinkle
+        "#6B7FAF",  # Cancer - cosmic blue
+        "#5B8FAF",  # Leo - stellar blue
+        "#4B9FAF",  # Virgo - galaxy cyan
+        "#4BAFAF",  # Libra - nebula teal
+        "#4BAFAF",  # Scorpio - deep teal
+        "#5B9FAF",  # Sagittarius - space blue
+        "#6B8FAF",  # Capricorn - cosmic indigo
+        "#7B7FAF",  # Aquarius - deep violet
+        "#8B6FAF",  # Pisces - stellar purple
+    ),
 
     # ========================================================================
     # Theme-coordinated elemental variants
     # ========================================================================
 
-    elif palette == ZodiacPalette.ELEMENTAL_DARK:
-        # Dark theme: Darker, muted elemental colors
-        element_colors = {
+    # Dark theme: Darker, muted elemental colors
+    ZodiacPalette.ELEMENTAL_DARK: _by_element(
+        {
             "fire": "#B88080",  # Darker warm red
             "earth": "#80A880",  # Darker green
             "air": "#8080B8",  # Darker blue
             "water": "#A880B8",  # Darker purple
         }
-        return [element_colors[SIGN_ELEMENTS[i]] for i in range(12)]
+    ),
 
-    elif palette == ZodiacPalette.ELEMENTAL_MIDNIGHT:
-        # Midnight theme: Cool-toned elements
-        element_colors = {
+    # Midnight theme: Cool-toned elements
+    ZodiacPalette.ELEMENTAL_MIDNIGHT: _by_element(
+        {
             "fire": "#5A6A8C",  # Cool blue-grey (fire as starlight)
             "earth": "#4A7A7C",  # Deep teal (earth as ocean)
             "air": "#6A7AAC",  # Deep sky blue
             "water": "#5A5A8C",  # Deep indigo
         }
-        return [element_colors[SIGN_ELEMENTS[i]] for i in range(12)]
+    ),
 
-    elif palette == ZodiacPalette.ELEMENTAL_NEON:
-        # Neon theme: Electric bright elements
-        element_colors = {
+    # Neon theme: Electric bright elements
+    ZodiacPalette.ELEMENTAL_NEON: _by_element(
+        {
             "fire": "#FF0066",  # Electric magenta
             "earth": "#00FF66",  # Neon green
             "air": "#00CCFF",  # Electric cyan
             "water": "#CC00FF",  # Neon purple
         }
-        return [element_colors[SIGN_ELEMENTS[i]] for i in range(12)]
+    ),
 
-    elif palette == ZodiacPalette.ELEMENTAL_SEPIA:
-        # Sepia theme: Warm-toned elements
-        element_colors = {
+    # Sepia theme: Warm-toned elements
+    ZodiacPalette.ELEMENTAL_SEPIA: _by_element(
+        {
             "fire": "#C49080",  # Terracotta
             "earth": "#A0B490",  # Olive
             "air": "#90A8C4",  # Dusty blue
             "water": "#A490B4",  # Dusty purple
         }
-        return [element_colors[SIGN_ELEMENTS[i]] for i in range(12)]
+    ),
 
     # ========================================================================
     # Data Science Palettes (12-color samples from matplotlib colormaps)
     # ========================================================================
 
-    elif palette == ZodiacPalette.VIRIDIS:
-        # Viridis: perceptually uniform, colorblind-friendly (purple → green → yellow)
-        return [
-            "#440154", "#482475", "#414487", "#355F8D",
-            "#2A788E", "#21918C", "#22A884", "#42BE71",
-            "#7AD151", "#BBDF27", "#FDE724", "#FDE724"
-        ]
+    # Viridis: perceptually uniform, colorblind-friendly (purple → green → yellow)
+    ZodiacPalette.VIRIDIS: (
+        "#440154", "#482475", "#414487", "#355F8D",
+        "#2A788E", "#21918C", "#22A884", "#42BE71",
+        "#7AD151", "#BBDF27", "#FDE724", "#FDE724"
+    ),
+
+    # Plasma: vibrant (dark blue → purple → orange → yellow)
+    ZodiacPalette.PLASMA: (
+        "#0D0887", "#41049D", "#6A00A8", "#8F0DA4",
+        "#B12A90", "#CC4778", "#E16462", "#F1844B",
+        "#FCA636", "#FCCE25", "#F0F921", "#F0F921"
+    ),
+
+    # Inferno: dramatic (black → red → orange → yellow → white)
+    ZodiacPalette.INFERNO: (
+        "#000004", "#1B0C41", "#4A0C6B", "#781C6D",
+        "#A52C60", "#CF4446", "#ED6925", "#FB9A06",
+        "#F7D03C", "#FCFFA4", "#FCFFA4", "#FCFFA4"
+    ),
+
+    # Magma: subtle (black → purple → pink → yellow → white)
+    ZodiacPalette.MAGMA: (
+        "#000004", "#0B0924", "#231151", "#410F75",
+        "#5F187F", "#7B2382", "#982D80", "#B73779",
+        "#D3436E", "#EB5760", "#F8765C", "#FCFDBF"
+    ),
+
+    # Cividis: optimized for color vision deficiency (blue → yellow)
+    ZodiacPalette.CIVIDIS: (
+        "#00204C", "#00306E", "#00447A", "#25567B",
+        "#4E6B7C", "#73807D", "#9B9680", "#C5AC83",
+        "#E5C482", "#FDDC7D", "#FEE883", "#FFEA46"
+    ),
+
+    # Turbo: Google's improved rainbow (blue → cyan → green → yellow → red)
+    ZodiacPalette.TURBO: (
+        "#30123B", "#4662D7", "#1FAAD2", "#1AE4B6",
+        "#72FE5E", "#C8EF34", "#FABA39", "#F66B19",
+        "#CA2A04", "#7A0403", "#7A0403", "#7A0403"
+    ),
+
+    # Coolwarm: diverging (blue → white → red)
+    ZodiacPalette.COOLWARM: (
+        "#3B4CC0", "#5E6EC5", "#7F91CB", "#A1B4D0",
+        "#C3D7D6", "#E5E5E5", "#F1D4D0", "#F3B6AF",
+        "#EC8C88", "#DD5C5C", "#C73333", "#B40426"
+    ),
+
+    # Spectral: diverging (red → yellow → green → blue → purple)
+    ZodiacPalette.SPECTRAL: (
+        "#9E0142", "#D53E4F", "#F46D43", "#FDAE61",
+        "#FEE08B", "#FFFFBF", "#E6F598", "#ABDDA4",
+        "#66C2A5", "#3288BD", "#5E4FA2", "#5E4FA2"
+    ),
+}
 
-    elif palette == ZodiacPalette.PLASMA:
-        # Plasma: vibrant (dark blue → purple → orange → yellow)
-        return [
-            "#0D0887", "#41049D", "#6A00A8", "#8F0DA4",
-            "#B12A90", "#CC4778", "#E16462", "#F1844B",
-            "#FCA636", "#FCCE25", "#F0F921", "#F0F921"
-        ]
 
-    elif palette == ZodiacPalette.INFERNO:
-        # Inferno: dramatic (black → red → orange → yellow → white)
-        return [
-            "#000004", "#1B0C41", "#4A0C6B", "#781C6D",
-            "#A52C60", "#CF4446", "#ED6925", "#FB9A06",
-            "#F7D03C", "#FCFFA4", "#FCFFA4", "#FCFFA4"
-        ]
+@lru_cache(maxsize=128)
+def get_palette_colors(palette: ZodiacPalette | str) -> tuple[str, ...]:
+    """
+    Get the colors for a zodiac wheel palette.
 
-    elif palette == ZodiacPalette.MAGMA:
-        # Magma: subtle (black → purple → pink → yellow → white)
-        return [
-            "#000004", "#0B0924", "#231151", "#410F75",
-            "#5F187F", "#7B2382", "#982D80", "#B73779",
-            "#D3436E", "#EB5760", "#F8765C", "#FCFDBF"
-        ]
+    Returns a tuple of 12 colors (one per sign, starting with Aries).
+    Results are cached in memory for performance; the tuple is shared
+    between callers, so it is immutable.
 
-    elif palette == ZodiacPalette.CIVIDIS:
-        # Cividis: optimized for color vision deficiency (blue → yellow)
-        return [
-            "#00204C", "#00306E", "#00447A", "#25567B",
-            "#4E6B7C", "#73807D", "#9B9680", "#C5AC83",
-            "#E5C482", "#FDDC7D", "#FEE883", "#FFEA46"
-        ]
+    Special case: If palette is a string starting with "single_color:",
+    extracts the hex color and returns 12 copies of it for a monochrome wheel.
 
-    elif palette == ZodiacPalette.TURBO:
-        # Turbo: Google's improved rainbow (blue → cyan → green → yellow → red)
-        return [
-            "#30123B", "#4662D7", "#1FAAD2", "#1AE4B6",
-            "#72FE5E", "#C8EF34", "#FABA39", "#F66B19",
-            "#CA2A04", "#7A0403", "#7A0403", "#7A0403"
-        ]
+    Args:
+        palette: The palette to use (ZodiacPalette enum or "single_color:#RRGGBB" string)
 
-    elif palette == ZodiacPalette.COOLWARM:
-        # Coolwarm: diverging (blue → white → red)
-        return [
-            "#3B4CC0", "#5E6EC5", "#7F91CB", "#A1B4D0",
-            "#C3D7D6", "#E5E5E5", "#F1D4D0", "#F3B6AF",
-            "#EC8C88", "#DD5C5C", "#C73333", "#B40426"
-        ]
+    Returns:
+        Tuple of 12 hex color strings
+    """
+    # Handle dynamic single-color palettes
+    if isinstance(palette, str) and palette.startswith("single_color:"):
+        # Extract hex color from "single_color:#RRGGBB"
+        color = palette.split(":", 1)[1]
+        return (color,) * 12
 
-    elif palette == ZodiacPalette.SPECTRAL:
-        # Spectral: diverging (red → yellow → green → blue → purple)
-        return [
-            "#9E0142", "#D53E4F", "#F46D43", "#FDAE61",
-            "#FEE08B", "#FFFFBF", "#E6F598", "#ABDDA4",
-            "#66C2A5", "#3288BD", "#5E4FA2", "#5E4FA2"
-        ]
+    # Plain strings match their ZodiacPalette members (str enum), so they can
+    # be looked up directly; unknown palettes fall back to grey
+    return _PALETTE_TABLES.get(palette, _PALETTE_TABLES[ZodiacPalette.GREY])
 
-    else:
-        # Fallback to grey
-        return ["#EEEEEE"] * 12
+
+@lru_cache(maxsize=128)
+def get_palette_colors_rgb(
+    palette: ZodiacPalette | str,
+) -> tuple[tuple[int, int, int], ...]:
+    """
+    Get the colors for a zodiac wheel palette as RGB tuples.
+
+    Same colors and order as get_palette_colors(), parsed from hex once per
+    palette for callers that blend or compare colors numerically.
+
+    Args:
+        palette: The palette to use (ZodiacPalette enum or "single_color:#RRGGBB" string)
+
+    Returns:
+        Tuple of 12 (r, g, b) tuples with values 0-255
+    """
+    return tuple(hex_to_rgb(color) for color in get_palette_colors(palette))
+
+
+# Human-readable palette descriptions
+_PALETTE_DESCRIPTIONS = {
+    # Base palettes
+    ZodiacPalette.GREY: "Classic grey wheel (no color)",
+    ZodiacPalette.RAINBOW: "Rainbow spectrum (12 soft colors)",
+    ZodiacPalette.ELEMENTAL: "4-color elemental (Fire/Earth/Air/Water)",
+    ZodiacPalette.CARDINALITY: "3-color modality (Cardinal/Fixed/Mutable)",
+    # Rainbow variants
+    ZodiacPalette.RAINBOW_DARK: "Dark rainbow (muted, darker spectrum)",
+    ZodiacPalette.RAINBOW_MIDNIGHT: "Midnight rainbow (cool blues and purples)",
+    ZodiacPalette.RAINBOW_NEON: "Neon rainbow (super bright electric colors)",
+    ZodiacPalette.RAINBOW_SEPIA: "Sepia rainbow (warm browns and earth tones)",
+    ZodiacPalette.RAINBOW_CELESTIAL: "Celestial rainbow (cosmic purples and blues)",
+    # Elemental variants
+    ZodiacPalette.ELEMENTAL_DARK: "Dark elemental (muted element colors)",
+    ZodiacPalette.ELEMENTAL_MIDNIGHT: "Midnight elemental (cool-toned elements)",
+    ZodiacPalette.ELEMENTAL_NEON: "Neon elemental (electric element colors)",
+    ZodiacPalette.ELEMENTAL_SEPIA: "Sepia elemental (warm-toned elements)",
+    # Data science palettes
+    ZodiacPalette.VIRIDIS: "Viridis (purple→green→yellow, colorblind-friendly)",
+    ZodiacPalette.PLASMA: "Plasma (blue→purple→orange→yellow, vibrant)",
+    ZodiacPalette.INFERNO: "Inferno (black→red→orange→yellow, dramatic)",
+    ZodiacPalette.MAGMA: "Magma (black→purple→pink→yellow, subtle)",
+    ZodiacPalette.CIVIDIS: "Cividis (blue→yellow, CVD-optimized)",
+    ZodiacPalette.TURBO: "Turbo (rainbow, improved Google palette)",
+    ZodiacPalette.COOLWARM: "Coolwarm (blue→white→red, diverging)",
+    ZodiacPalette.SPECTRAL: "Spectral (red→yellow→green→blue, diverging)",
+}
 
 
 def get_palette_description(palette: ZodiacPalette) -> str:
@@ -359,34 +405,7 @@ def get_palette_description(palette: ZodiacPalette) -> str:
     Returns:
         Description string
     """
-    descriptions = {
-        # Base palettes
-        ZodiacPalette.GREY: "Classic grey wheel (no color)",
-        ZodiacPalette.RAINBOW: "Rainbow spectrum (12 soft colors)",
-        ZodiacPalette.ELEMENTAL: "4-color elemental (Fire/Earth/Air/Water)",
-        ZodiacPalette.CARDINALITY: "3-color modality (Cardinal/Fixed/Mutable)",
-        # Rainbow variants
-        ZodiacPalette.RAINBOW_DARK: "Dark rainbow (muted, darker spectrum)",
-        ZodiacPalette.RAINBOW_MIDNIGHT: "Midnight rainbow (cool blues and purples)",
-        ZodiacPalette.RAINBOW_NEON: "Neon rainbow (super bright electric colors)",
-        ZodiacPalette.RAINBOW_SEPIA: "Sepia rainbow (warm browns and earth tones)",
-        ZodiacPalette.RAINBOW_CELESTIAL: "Celestial rainbow (cosmic purples and blues)",
-        # Elemental variants
-        ZodiacPalette.ELEMENTAL_DARK: "Dark elemental (muted element colors)",
-        ZodiacPalette.ELEMENTAL_MIDNIGHT: "Midnight elemental (cool-toned elements)",
-        ZodiacPalette.ELEMENTAL_NEON: "Neon elemental (electric element colors)",
-        ZodiacPalette.ELEMENTAL_SEPIA: "Sepia elemental (warm-toned elements)",
-        # Data science palettes
-        ZodiacPalette.VIRIDIS: "Viridis (purple→green→yellow, colorblind-friendly)",
-        ZodiacPalette.PLASMA: "Plasma (blue→purple→orange→yellow, vibrant)",
-        ZodiacPalette.INFERNO: "Inferno (black→red→orange→yellow, dramatic)",
-        ZodiacPalette.MAGMA: "Magma (black→purple→pink→yellow, subtle)",
-        ZodiacPalette.CIVIDIS: "Cividis (blue→yellow, CVD-optimized)",
-        ZodiacPalette.TURBO: "Turbo (rainbow, improved Google palette)",
-        ZodiacPalette.COOLWARM: "Coolwarm (blue→white→red, diverging)",
-        ZodiacPalette.SPECTRAL: "Spectral (red→yellow→green→blue, diverging)",
-    }
-    return descriptions.get(palette, "Unknown palette")
+    return _PALETTE_DESCRIPTIONS.get(palette, "Unknown palette")
 
 
 # ============================================================================
@@ -0,0 +1,275 @@
+"""
+Lightweight SVG Writer (starlight.visualization.svg_writer)
+
+A drop-in replacement for the subset of ``svgwrite.Drawing`` that the chart
+layers use (``add``, ``circle``, ``rect``, ``line``, ``path``, ``text``,
+``tspan``, ``image``, ``g`` and ``save``).
+
+svgwrite builds a full element tree, validates every attribute and then
+round-trips it through ElementTree to serialize. Chart rendering only ever
+appends elements, so FastSVGWriter formats attributes when an element is
+created, serializes the document when it is read or saved, and streams the
+pieces to disk. The output uses the same attribute naming, ordering and
+escaping as svgwrite, except that float attribute values are rounded to
+COORD_PRECISION decimal places.
+
+Layers don't care which one they get: anything that works with an
+svgwrite.Drawing works with a FastSVGWriter.
+"""
+
+from collections.abc import Iterator
+from typing import Any
+
+# Decimal places kept for float attribute values (coordinates, radii, ...).
+# Sub-pixel digits beyond this only inflate file size; set before rendering
+# to tune.
+COORD_PRECISION = 2
+
+_SVG_NAMESPACES = {
+    "xmlns": "http://www.w3.org/2000/svg",
+    "xmlns:ev": "http://www.w3.org/2001/xml-events",
+    "xmlns:xlink": "http://www.w3.org/1999/xlink",
+}
+
+_XML_HEADER = '<?xml version="1.0" encoding="utf-8" ?>\n'
+
+# File buffer for save(); a typical chart is 50-150 KB, so most documents
+# reach the OS in one or two writes
+_WRITE_BUFFER_SIZE = 65536
+
+# Same escaping ElementTree applies when svgwrite serializes
+_TEXT_ESCAPES = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+_ATTR_ESCAPES = str.maketrans(
+    {
+        "&": "&amp;",
+        "<": "&lt;",
+        ">": "&gt;",
+        '"': "&quot;",
+        "\n": "&#10;",
+        "\r": "&#13;",
+        "\t": "&#09;",
+    }
+)
+
+
+def fmt(value: float) -> str:
+    """
+    Format a number with COORD_PRECISION decimals, trimming trailing zeros.
+
+    >>> fmt(300.0), fmt(288.123456), fmt(0.5)
+    ('300', '288.12', '0.5')
+    """
+    text = f"{value:.{COORD_PRECISION}f}"
+    if "." in text:
+        text = text.rstrip("0").rstrip(".")
+    return "0" if text == "-0" else text
+
+
+def attr_value(value: Any) -> str:
+    """Serialize one attribute value the way FastSVGWriter writes it."""
+    text = fmt(value) if type(value) is float else str(value)
+    return text.translate(_ATTR_ESCAPES)
+
+
+def circle_path(cx: float, cy: float, r: float) -> str:
+    """
+    Path data for a full circle, drawn as two half arcs.
+
+    Lets several circles that share a stroke go into one <path> element.
+    """
+    return (
+        f"M {fmt(cx - r)},{fmt(cy)} "
+        f"a {fmt(r)},{fmt(r)} 0 1,0 {fmt(2 * r)},0 "
+        f"a {fmt(r)},{fmt(r)} 0 1,0 {fmt(-2 * r)},0 Z"
+    )
+
+
+def _attr_name(key: str) -> str:
+    """Map a Python keyword to an SVG attribute name (svgwrite rules)."""
+    # "class_" -> "class", "stroke_width" -> "stroke-width"
+    return key.rstrip("_").replace("_", "-")
+
+
+def _format_attrs(attribs: dict[str, Any]) -> str:
+    """Serialize attributes sorted by name, skipping None and empty values."""
+    parts = []
+    for name, value in sorted(attribs.items()):
+        if value is None:
+            continue
+        value = attr_value(value)
+        if value:
+            parts.append(f' {name}="{value}"')
+    return "".join(parts)
+
+
+class SVGElement:
+    """
+    A single SVG element (optionally with text content and children).
+
+    Attributes are rendered to text when the element is created; children
+    added to groups are serialized with their parent.
+    """
+
+    __slots__ = ("tag", "attrs", "content", "elements")
+
+    def __init__(self, tag: str, content: str | None = None, **extra: Any) -> None:
+        self.tag = tag
+        self.attrs = _format_attrs({_attr_name(k): v for k, v in extra.items()})
+        self.content = content
+        self.elements: list[SVGElement] = []
+
+    def add(self, element: "SVGElement") -> "SVGElement":
+        """Append a child element and return it (mirrors svgwrite)."""
+        self.elements.append(element)
+        return element
+
+    def tostring(self) -> str:
+        """Serialize this element and all of its children."""
+        if not self.content and not self.elements:
+            return f"<{self.tag}{self.attrs} />"
+
+        inner = "".join(element.tostring() for element in self.elements)
+        if self.content:
+            inner = self.content.translate(_TEXT_ESCAPES) + inner
+        return f"<{self.tag}{self.attrs}>{inner}</{self.tag}>"
+
+
+class FastSVGWriter:
+    """
+    Streaming SVG document with an svgwrite.Drawing-compatible API.
+
+    Added elements and raw markup are kept in document order and serialized
+    by body(), tostring() and save(), so children added to a group after the
+    group itself still end up in the output (as with svgwrite). save() streams
+    the pieces to disk through one buffered file handle.
+    """
+
+    def __init__(
+        self,
+        filename: str = "noname.svg",
+        size: tuple[Any, Any] = ("100%", "100%"),
+        **extra: Any,
+    ) -> None:
+        """
+        Initialize the writer.
+
+        Args:
+            filename: Output filename used by save()
+            size: (width, height) of the document
+            **extra: Additional root attributes (e.g. viewBox). "profile" is
+                accepted for svgwrite compatibility and written as baseProfile.
+        """
+        self.filename = filename
+        profile = extra.pop("profile", "full")
+        width, height = size
+        attribs = {
+            "baseProfile": profile,
+            "version": "1.1",
+            "width": width,
+            "height": height,
+            **{_attr_name(k): v for k, v in extra.items()},
+            **_SVG_NAMESPACES,
+        }
+        self._root_open = f"<svg{_format_attrs(attribs)}><defs />"
+        self._parts: list[str | SVGElement] = []
+
+    def write(self, svg: str) -> None:
+        """Append raw, already-serialized SVG markup."""
+        self._parts.append(svg)
+
+    def add(self, element: SVGElement) -> SVGElement:
+        """Append an element to the document and return it."""
+        self._parts.append(element)
+        return element
+
+    # --- Element factories (same signatures as svgwrite.Drawing) ---
+
+    def circle(
+        self, center: tuple[float, float] = (0, 0), r: float = 1, **extra: Any
+    ) -> SVGElement:
+        return SVGElement("circle", cx=center[0], cy=center[1], r=r, **extra)
+
+    def rect(
+        self,
+        insert: tuple[float, float] = (0, 0),
+        size: tuple[Any, Any] = (1, 1),
+        **extra: Any,
+    ) -> SVGElement:
+        return SVGElement(
+            "rect", x=insert[0], y=insert[1], width=size[0], height=size[1], **extra
+        )
+
+    def line(
+        self,
+        start: tuple[float, float] = (0, 0),
+        end: tuple[float, float] = (0, 0),
+        **extra: Any,
+    ) -> SVGElement:
+        return SVGElement(
+            "line", x1=start[0], y1=start[1], x2=end[0], y2=end[1], **extra
+        )
+
+    def path(self, d: str | list[str] | None = None, **extra: Any) -> SVGElement:
+        if isinstance(d, list | tuple):
+            d = " ".join(str(command) for command in d)
+        return SVGElement("path", d=d, **extra)
+
+    def text(
+        self, text: str, insert: tuple[float, float] | None = None, **extra: Any
+    ) -> SVGElement:
+        if insert is not None:
+            extra["x"], extra["y"] = insert
+        return SVGElement("text", content=text, **extra)
+
+    def tspan(
+        self, text: str, insert: tuple[float, float] | None = None, **extra: Any
+    ) -> SVGElement:
+        if insert is not None:
+            extra["x"], extra["y"] = insert
+        return SVGElement("tspan", content=text, **extra)
+
+    def image(
+        self,
+        href: str,
+        insert: tuple[float, float] | None = None,
+        size: tuple[Any, Any] | None = None,
+        **extra: Any,
+    ) -> SVGElement:
+        if insert is not None:
+            extra["x"], extra["y"] = insert
+        if size is not None:
+            extra["width"], extra["height"] = size
+        return SVGElement("image", **{"xlink:href": href}, **extra)
+
+    def g(self, **extra: Any) -> SVGElement:
+        return SVGElement("g", **extra)
+
+    # --- Output ---
+
+    def _serialized(self) -> Iterator[str]:
+        """Yield the document's pieces as markup, in the order they were added."""
+        for part in self._parts:
+            yield part if type(part) is str else part.tostring()
+
+    def body(self) -> str:
+        """Return the serialized elements without the enclosing <svg> tag."""
+        return "".join(self._serialized())
+
+    def tostring(self) -> str:
+        """Return the full SVG document (without the XML declaration)."""
+        return "".join((self._root_open, *self._serialized(), "</svg>"))
+
+    def save(self) -> None:
+        """
+        Write the document to self.filename.
+
+        The serialized pieces are streamed through a buffered file handle
+        rather than joined into one document-sized string first.
+        """
+        with open(
+            self.filename, "w", buffering=_WRITE_BUFFER_SIZE, encoding="utf-8"
+        ) as f:
+            f.write(_XML_HEADER)
+            f.write(self._root_open)
+            f.writelines(self._serialized())
+            f.write("</svg>")
@@ -5,7 +5,10 @@ Defines complete visual themes for chart rendering, including colors,
 line styles, and default zodiac palettes.
 """
 
+from collections.abc import Callable, Mapping
 from enum import Enum
+from functools import lru_cache, wraps
+from types import MappingProxyType
 from typing import Any
 
 from starlight.core.registry import ASPECT_REGISTRY
@@ -38,59 +41,68 @@ class ChartTheme(str, Enum):
     TURBO = "turbo"
 
 
+# Theme default palettes are read-only views, so a caller cannot change the
+# defaults for every chart drawn afterwards
+
 # Default zodiac palette for each theme
-THEME_DEFAULT_PALETTES = {
-    ChartTheme.CLASSIC: ZodiacPalette.GREY,
-    ChartTheme.DARK: ZodiacPalette.GREY,
-    ChartTheme.MIDNIGHT: ZodiacPalette.RAINBOW_MIDNIGHT,
-    ChartTheme.NEON: ZodiacPalette.RAINBOW_NEON,
-    ChartTheme.SEPIA: ZodiacPalette.RAINBOW_SEPIA,
-    ChartTheme.PASTEL: ZodiacPalette.RAINBOW,
-    ChartTheme.CELESTIAL: ZodiacPalette.RAINBOW_CELESTIAL,
-    # Data science themes
-    ChartTheme.VIRIDIS: ZodiacPalette.VIRIDIS,
-    ChartTheme.PLASMA: ZodiacPalette.PLASMA,
-    ChartTheme.INFERNO: ZodiacPalette.INFERNO,
-    ChartTheme.MAGMA: ZodiacPalette.MAGMA,
-    ChartTheme.CIVIDIS: ZodiacPalette.CIVIDIS,
-    ChartTheme.TURBO: ZodiacPalette.TURBO,
-}
+THEME_DEFAULT_PALETTES = MappingProxyType(
+    {
+        ChartTheme.CLASSIC: ZodiacPalette.GREY,
+        ChartTheme.DARK: ZodiacPalette.GREY,
+        ChartTheme.MIDNIGHT: ZodiacPalette.RAINBOW_MIDNIGHT,
+        ChartTheme.NEON: ZodiacPalette.RAINBOW_NEON,
+        ChartTheme.SEPIA: ZodiacPalette.RAINBOW_SEPIA,
+        ChartTheme.PASTEL: ZodiacPalette.RAINBOW,
+        ChartTheme.CELESTIAL: ZodiacPalette.RAINBOW_CELESTIAL,
+        # Data science themes
+        ChartTheme.VIRIDIS: ZodiacPalette.VIRIDIS,
+        ChartTheme.PLASMA: ZodiacPalette.PLASMA,
+        ChartTheme.INFERNO: ZodiacPalette.INFERNO,
+        ChartTheme.MAGMA: ZodiacPalette.MAGMA,
+        ChartTheme.CIVIDIS: ZodiacPalette.CIVIDIS,
+        ChartTheme.TURBO: ZodiacPalette.TURBO,
+    }
+)
 
 # Default aspect palette for each theme
-THEME_DEFAULT_ASPECT_PALETTES = {
-    ChartTheme.CLASSIC: AspectPalette.CLASSIC,
-    ChartTheme.DARK: AspectPalette.DARK,
-    ChartTheme.MIDNIGHT: AspectPalette.MIDNIGHT,
-    ChartTheme.NEON: AspectPalette.NEON,
-    ChartTheme.SEPIA: AspectPalette.SEPIA,
-    ChartTheme.PASTEL: AspectPalette.PASTEL,
-    ChartTheme.CELESTIAL: AspectPalette.CELESTIAL,
-    # Data science themes
-    ChartTheme.VIRIDIS: AspectPalette.VIRIDIS,
-    ChartTheme.PLASMA: AspectPalette.PLASMA,
-    ChartTheme.INFERNO: AspectPalette.INFERNO,
-    ChartTheme.MAGMA: AspectPalette.MAGMA,
-    ChartTheme.CIVIDIS: AspectPalette.CIVIDIS,
-    ChartTheme.TURBO: AspectPalette.TURBO,
-}
+THEME_DEFAULT_ASPECT_PALETTES = MappingProxyType(
+    {
+        ChartTheme.CLASSIC: AspectPalette.CLASSIC,
+        ChartTheme.DARK: AspectPalette.DARK,
+        ChartTheme.MIDNIGHT: AspectPalette.MIDNIGHT,
+        ChartTheme.NEON: AspectPalette.NEON,
+        ChartTheme.SEPIA: AspectPalette.SEPIA,
+        ChartTheme.PASTEL: AspectPalette.PASTEL,
+        ChartTheme.CELESTIAL: AspectPalette.CELESTIAL,
+        # Data science themes
+        ChartTheme.VIRIDIS: AspectPalette.VIRIDIS,
+        ChartTheme.PLASMA: AspectPalette.PLASMA,
+        ChartTheme.INFERNO: AspectPalette.INFERNO,
+        ChartTheme.MAGMA: AspectPalette.MAGMA,
+        ChartTheme.CIVIDIS: AspectPalette.CIVIDIS,
+        ChartTheme.TURBO: AspectPalette.TURBO,
+    }
+)
 
 # Default planet glyph palette for each theme
-THEME_DEFAULT_PLANET_PALETTES = {
-    ChartTheme.CLASSIC: PlanetGlyphPalette.DEFAULT,
-    ChartTheme.DARK: PlanetGlyphPalette.DEFAULT,
-    ChartTheme.MIDNIGHT: PlanetGlyphPalette.DEFAULT,
-    ChartTheme.NEON: PlanetGlyphPalette.RAINBOW,
-    ChartTheme.SEPIA: PlanetGlyphPalette.DEFAULT,
-    ChartTheme.PASTEL: PlanetGlyphPalette.DEFAULT,
-    ChartTheme.CELESTIAL: PlanetGlyphPalette.DEFAULT,
-    # Data science themes
-    ChartTheme.VIRIDIS: PlanetGlyphPalette.VIRIDIS,
-    ChartTheme.PLASMA: PlanetGlyphPalette.PLASMA,
-    ChartTheme.INFERNO: PlanetGlyphPalette.INFERNO,
-    ChartTheme.MAGMA: PlanetGlyphPalette.INFERNO,  # Magma similar to Inferno
-    ChartTheme.CIVIDIS: PlanetGlyphPalette.VIRIDIS,  # Cividis similar to Viridis
-    ChartTheme.TURBO: PlanetGlyphPalette.TURBO,
-}
+THEME_DEFAULT_PLANET_PALETTES = MappingProxyType(
+    {
+        ChartTheme.CLASSIC: PlanetGlyphPalette.DEFAULT,
+        ChartTheme.DARK: PlanetGlyphPalette.DEFAULT,
+        ChartTheme.MIDNIGHT: PlanetGlyphPalette.DEFAULT,
+        ChartTheme.NEON: PlanetGlyphPalette.RAINBOW,
+        ChartTheme.SEPIA: PlanetGlyphPalette.DEFAULT,
+        ChartTheme.PASTEL: PlanetGlyphPalette.DEFAULT,
+        ChartTheme.CELESTIAL: PlanetGlyphPalette.DEFAULT,
+        # Data science themes
+        ChartTheme.VIRIDIS: PlanetGlyphPalette.VIRIDIS,
+        ChartTheme.PLASMA: PlanetGlyphPalette.PLASMA,
+        ChartTheme.INFERNO: PlanetGlyphPalette.INFERNO,
+        ChartTheme.MAGMA: PlanetGlyphPalette.INFERNO,  # Magma similar to Inferno
+        ChartTheme.CIVIDIS: PlanetGlyphPalette.VIRIDIS,  # Cividis similar to Viridis
+        ChartTheme.TURBO: PlanetGlyphPalette.TURBO,
+    }
+)
 
 
 def get_theme_style(theme: ChartTheme) -> dict[str, Any]:
@@ -101,36 +113,42 @@ def get_theme_style(theme: ChartTheme) -> dict[str, Any]:
         theme: The theme to use
 
     Returns:
-        Complete style dictionary for ChartRenderer
+        Complete style dictionary for ChartRenderer (a fresh copy; safe to
+        modify)
     """
-    if theme == ChartTheme.CLASSIC:
-        return _get_classic_theme()
-    elif theme == ChartTheme.DARK:
-        return _get_dark_theme()
-    elif theme == ChartTheme.MIDNIGHT:
-        return _get_midnight_theme()
-    elif theme == ChartTheme.NEON:
-        return _get_neon_theme()
-    elif theme == ChartTheme.SEPIA:
-        return _get_sepia_theme()
-    elif theme == ChartTheme.PASTEL:
-        return _get_pastel_theme()
-    elif theme == ChartTheme.CELESTIAL:
-        return _get_celestial_theme()
-    elif theme == ChartTheme.VIRIDIS:
-        return _get_viridis_theme()
-    elif theme == ChartTheme.PLASMA:
-        return _get_plasma_theme()
-    elif theme == ChartTheme.INFERNO:
-        return _get_inferno_theme()
-    elif theme == ChartTheme.MAGMA:
-        return _get_magma_theme()
-    elif theme == ChartTheme.CIVIDIS:
-        return _get_cividis_theme()
-    elif theme == ChartTheme.TURBO:
-        return _get_turbo_theme()
-    else:
-        return _get_classic_theme()
+    # Unknown themes fall back to classic
+    return _copy_style(_THEME_BUILDERS.get(theme, _get_classic_theme)())
+
+
+def _copy_style(style: Mapping[str, Any]) -> dict[str, Any]:
+    """Copy a frozen theme into nested dicts; leaf values are shared."""
+    return {
+        key: _copy_style(value) if isinstance(value, Mapping) else value
+        for key, value in style.items()
+    }
+
+
+def _freeze(style: dict[str, Any]) -> Mapping[str, Any]:
+    """Wrap a nested style dict in read-only mappings, all the way down."""
+    return MappingProxyType(
+        {
+            key: _freeze(value) if isinstance(value, dict) else value
+            for key, value in style.items()
+        }
+    )
+
+
+def _frozen_theme(
+    builder: Callable[[], dict[str, Any]],
+) -> Callable[[], Mapping[str, Any]]:
+    """Build a theme once, on first use, and cache it as a frozen mapping."""
+
+    @lru_cache(maxsize=1)
+    @wraps(builder)
+    def cached() -> Mapping[str, Any]:
+        return _freeze(builder())
+
+    return cached
 
 
 def get_theme_default_palette(theme: ChartTheme) -> ZodiacPalette:
@@ -177,14 +195,33 @@ def get_theme_default_planet_palette(theme: ChartTheme) -> PlanetGlyphPalette:
 # ============================================================================
 
 
+# Font stacks shared by the themes (one string object for every theme)
+_FONT_FAMILY_GLYPHS = (
+    '"Symbola", "Noto Sans Symbols", "Apple Symbols", "Segoe UI Symbol", serif'
+)
+_FONT_FAMILY_SANS = '"Arial", "Helvetica", sans-serif'
+
+# Registry line styles for the major and minor aspects, built once at import
+_MAJOR_MINOR_ASPECT_BASE: dict[str, dict[str, Any]] = {
+    aspect_info.name: {
+        "color": aspect_info.color,
+        "width": aspect_info.metadata.get("line_width", 1.5),
+        "dash": aspect_info.metadata.get("dash_pattern", "1,0"),
+    }
+    for aspect_info in ASPECT_REGISTRY.values()
+    if aspect_info.category in {"Major", "Minor"}
+}
+
+
+@_frozen_theme
 def _get_classic_theme() -> dict[str, Any]:
     """Classic theme - current default styling (grey, professional)."""
     return {
         "background_color": "#FFFFFF",
         "border_color": "#999999",
         "border_width": 1,
-        "font_family_glyphs": '"Symbola", "Noto Sans Symbols", "Apple Symbols", "Segoe UI Symbol", serif',
-        "font_family_text": '"Arial", "Helvetica", sans-serif',
+        "font_family_glyphs": _FONT_FAMILY_GLYPHS,
+        "font_family_text": _FONT_FAMILY_SANS,
         "zodiac": {
             "ring_color": "#EEEEEE",
             "line_color": "#BBBBBB",
@@ -215,15 +252,7 @@ def _get_classic_theme() -> dict[str, Any]:
             "outer_wheel_planet_color": "#4A90E2",  # Softer blue for outer wheel
         },
         "aspects": {
-            **{
-                aspect_info.name: {
-                    "color": aspect_info.color,
-                    "width": aspect_info.metadata.get("line_width", 1.5),
-                    "dash": aspect_info.metadata.get("dash_pattern", "1,0"),
-                }
-                for aspect_info in ASPECT_REGISTRY.values()
-                if aspect_info.category in ["Major", "Minor"]
-            },
+            **_MAJOR_MINOR_ASPECT_BASE,
             "default": {"color": "#BDC3C7", "width": 0.5, "dash": "2,2"},
             "line_color": "#BBBBBB",
             "background_color": "#FFFFFF",
@@ -231,14 +260,15 @@ def _get_classic_theme() -> dict[str, Any]:
     }
 
 
+@_frozen_theme
 def _get_dark_theme() -> dict[str, Any]:
     """Dark theme - dark grey background with light text."""
     return {
         "background_color": "#1E1E1E",
         "border_color": "#555555",
         "border_width": 1,
-        "font_family_glyphs": '"Symbola", "Noto Sans Symbols", "Apple Symbols", "Segoe UI Symbol", serif',
-        "font_family_text": '"Arial", "Helvetica", sans-serif',
+        "font_family_glyphs": _FONT_FAMILY_GLYPHS,
+        "font_family_text": _FONT_FAMILY_SANS,
         "zodiac": {
             "ring_color": "#2D2D2D",
             "line_color": "#666666",
@@ -281,14 +311,15 @@ def _get_dark_theme() -> dict[str, Any]:
     }
 
 
+@_frozen_theme
 def _get_midnight_theme() -> dict[str, Any]:
     """Midnight theme - elegant night sky with deep navy and white/gold accents."""
     return {
         "background_color": "#0A1628",
         "border_color": "#3A5A7C",
         "border_width": 1,
-        "font_family_glyphs": '"Symbola", "Noto Sans Symbols", "Apple Symbols", "Segoe UI Symbol", serif',
-        "font_family_text": '"Arial", "Helvetica", sans-serif',
+        "font_family_glyphs": _FONT_FAMILY_GLYPHS,
+        "font_family_text": _FONT_FAMILY_SANS,
         "zodiac": {
             "ring_color": "#0D1F3C",
             "line_color": "#4A6FA5",
@@ -331,14 +362,15 @@ def _get_midnight_theme() -> dict[str, Any]:
     }
 
 
+@_frozen_theme
 def _get_neon_theme() -> dict[str, Any]:
     """Neon theme - cyberpunk aesthetic with black background and bright neon colors."""
     return {
         "background_color": "#0D0D0D",
         "border_color": "#00FFFF",
         "border_width": 1.5,
-        "font_family_glyphs": '"Symbola", "Noto Sans Symbols", "Apple Symbols", "Segoe UI Symbol", serif',
-        "font_family_text": '"Arial", "Helvetica", sans-serif',
+        "font_family_glyphs": _FONT_FAMILY_GLYPHS,
+        "font_family_text": _FONT_FAMILY_SANS,
         "zodiac": {
             "ring_color": "#1A1A1A",
             "line_color": "#00FFFF",
@@ -381,13 +413,14 @@ def _get_neon_theme() -> dict[str, Any]:
     }
 
 
+@_frozen_theme
 def _get_sepia_theme() -> dict[str, Any]:
     """Sepia theme - vintage/aged paper aesthetic with warm browns."""
     return {
         "background_color": "#F4ECD8",
         "border_color": "#8B7355",
         "border_width": 1,
-        "font_family_glyphs": '"Symbola", "Noto Sans Symbols", "Apple Symbols", "Segoe UI Symbol", serif',
+        "font_family_glyphs": _FONT_FAMILY_GLYPHS,
         "font_family_text": '"Georgia", "Times New Roman", serif',
         "zodiac": {
             "ring_color": "#E8DCC4",
@@ -431,14 +464,15 @@ def _get_sepia_theme() -> dict[str, Any]:
     }
 
 
+@_frozen_theme
 def _get_pastel_theme() -> dict[str, Any]:
     """Pastel theme - soft, gentle colors with light and airy feel."""
     return {
         "background_color": "#FAFAFA",
         "border_color": "#C4C4C4",
         "border_width": 1,
-        "font_family_glyphs": '"Symbola", "Noto Sans Symbols", "Apple Symbols", "Segoe UI Symbol", serif',
-        "font_family_text": '"Arial", "Helvetica", sans-serif',
+        "font_family_glyphs": _FONT_FAMILY_GLYPHS,
+        "font_family_text": _FONT_FAMILY_SANS,
         "zodiac": {
             "ring_color": "#F0F0F0",
             "line_color": "#D4D4D4",
@@ -481,14 +515,15 @@ def _get_pastel_theme() -> dict[str, Any]:
     }
 
 
+@_frozen_theme
 def _get_celestial_theme() -> dict[str, Any]:
     """Celestial theme - cosmic/galaxy aesthetic with deep purples and gold stars."""
     return {
         "background_color": "#1A0F2E",
         "border_color": "#6B4FA3",
         "border_width": 1,
-        "font_family_glyphs": '"Symbola", "Noto Sans Symbols", "Apple Symbols", "Segoe UI Symbol", serif',
-        "font_family_text": '"Arial", "Helvetica", sans-serif',
+        "font_family_glyphs": _FONT_FAMILY_GLYPHS,
+        "font_family_text": _FONT_FAMILY_SANS,
         "zodiac": {
             "ring_color": "#2A1A4A",
             "line_color": "#7B5FAF",
@@ -536,6 +571,7 @@ def _get_celestial_theme() -> dict[str, Any]:
 # ============================================================================
 
 
+@_frozen_theme
 def _get_viridis_theme() -> dict[str, Any]:
     """Viridis theme - perceptually uniform purple→green→yellow palette."""
     aspect_colors = get_aspect_palette_colors(AspectPalette.VIRIDIS)
@@ -543,8 +579,8 @@ def _get_viridis_theme() -> dict[str, Any]:
         "background_color": "#1C1C1C",
         "border_color": "#414487",
         "border_width": 1,
-        "font_family_glyphs": '"Symbola", "Noto Sans Symbols", "Apple Symbols", "Segoe UI Symbol", serif',
-        "font_family_text": '"Arial", "Helvetica", sans-serif',
+        "font_family_glyphs": _FONT_FAMILY_GLYPHS,
+        "font_family_text": _FONT_FAMILY_SANS,
         "zodiac": {
             "ring_color": "#262626",
             "line_color": "#414487",
@@ -586,6 +622,7 @@ def _get_viridis_theme() -> dict[str, Any]:
     }
 
 
+@_frozen_theme
 def _get_plasma_theme() -> dict[str, Any]:
     """Plasma theme - vibrant blue→purple→orange→yellow palette."""
     aspect_colors = get_aspect_palette_colors(AspectPalette.PLASMA)
@@ -593,8 +630,8 @@ def _get_plasma_theme() -> dict[str, Any]:
         "background_color": "#0D0887",
         "border_color": "#6A00A8",
         "border_width": 1,
-        "font_family_glyphs": '"Symbola", "Noto Sans Symbols", "Apple Symbols", "Segoe UI Symbol", serif',
-        "font_family_text": '"Arial", "Helvetica", sans-serif',
+        "font_family_glyphs": _FONT_FAMILY_GLYPHS,
+        "font_family_text": _FONT_FAMILY_SANS,
         "zodiac": {
             "ring_color": "#180C4E",
             "line_color": "#B12A90",
@@ -636,6 +673,7 @@ def _get_plasma_theme() -> dict[str, Any]:
     }
 
 
+@_frozen_theme
 def _get_inferno_theme() -> dict[str, Any]:
     """Inferno theme - dramatic black→red→orange→yellow palette."""
     aspect_colors = get_aspect_palette_colors(AspectPalette.INFERNO)
@@ -643,8 +681,8 @@ def _get_inferno_theme() -> dict[str, Any]:
         "background_color": "#000004",
         "border_color": "#781C6D",
         "border_width": 1,
-        "font_family_glyphs": '"Symbola", "Noto Sans Symbols", "Apple Symbols", "Segoe UI Symbol", serif',
-        "font_family_text": '"Arial", "Helvetica", sans-serif',
+        "font_family_glyphs": _FONT_FAMILY_GLYPHS,
+        "font_family_text": _FONT_FAMILY_SANS,
         "zodiac": {
             "ring_color": "#1B0C41",
             "line_color": "#A52C60",
@@ -686,6 +724,7 @@ def _get_inferno_theme() -> dict[str, Any]:
     }
 
 
+@_frozen_theme
 def _get_magma_theme() -> dict[str, Any]:
     """Magma theme - subtle black→purple→pink→yellow palette."""
     aspect_colors = get_aspect_palette_colors(AspectPalette.MAGMA)
@@ -693,8 +732,8 @@ def _get_magma_theme() -> dict[str, Any]:
         "background_color": "#000004",
         "border_color": "#5F187F",
         "border_width": 1,
-        "font_family_glyphs": '"Symbola", "Noto Sans Symbols", "Apple Symbols", "Segoe UI Symbol", serif',
-        "font_family_text": '"Arial", "Helvetica", sans-serif',
+        "font_family_glyphs": _FONT_FAMILY_GLYPHS,
+        "font_family_text": _FONT_FAMILY_SANS,
         "zodiac": {
             "ring_color": "#0B0924",
             "line_color": "#7B2382",
@@ -736,6 +775,7 @@ def _get_magma_theme() -> dict[str, Any]:
     }
 
 
+@_frozen_theme
 def _get_cividis_theme() -> dict[str, Any]:
     """Cividis theme - CVD-optimized blue→yellow palette."""
     aspect_colors = get_aspect_palette_colors(AspectPalette.CIVIDIS)
@@ -743,8 +783,8 @@ def _get_cividis_theme() -> dict[str, Any]:
         "background_color": "#00204C",
         "border_color": "#25567B",
         "border_width": 1,
-        "font_family_glyphs": '"Symbola", "Noto Sans Symbols", "Apple Symbols", "Segoe UI Symbol", serif',
-        "font_family_text": '"Arial", "Helvetica", sans-serif',
+        "font_family_glyphs": _FONT_FAMILY_GLYPHS,
+        "font_family_text": _FONT_FAMILY_SANS,
         "zodiac": {
             "ring_color": "#00306E",
             "line_color": "#4E6B7C",
@@ -786,6 +826,7 @@ def _get_cividis_theme() -> dict[str, Any]:
     }
 
 
+@_frozen_theme
 def _get_turbo_theme() -> dict[str, Any]:
     """Turbo theme - Google's improved rainbow palette."""
     aspect_colors = get_aspect_palette_colors(AspectPalette.TURBO)
@@ -793,8 +834,8 @@ def _get_turbo_theme() -> dict[str, Any]:
         "background_color": "#1A1A2E",
         "border_color": "#4662D7",
         "border_width": 1,
-        "font_family_glyphs": '"Symbola", "Noto Sans Symbols", "Apple Symbols", "Segoe UI Symbol", serif',
-        "font_family_text": '"Arial", "Helvetica", sans-serif',
+        "font_family_glyphs": _FONT_FAMILY_GLYPHS,
+        "font_family_text": _FONT_FAMILY_SANS,
         "zodiac": {
             "ring_color": "#242438",
             "line_color": "#1AE4B6",
@@ -836,6 +877,45 @@ def _get_turbo_theme() -> dict[str, Any]:
     }
 
 
+# Style builder for each theme. Builders are cached and return a shared,
+# read-only mapping; get_theme_style() hands out a copy callers can modify
+_THEME_BUILDERS: dict[ChartTheme, Callable[[], Mapping[str, Any]]] = {
+    ChartTheme.CLASSIC: _get_classic_theme,
+    ChartTheme.DARK: _get_dark_theme,
+    ChartTheme.MIDNIGHT: _get_midnight_theme,
+    ChartTheme.NEON: _get_neon_theme,
+    ChartTheme.SEPIA: _get_sepia_theme,
+    ChartTheme.PASTEL: _get_pastel_theme,
+    ChartTheme.CELESTIAL: _get_celestial_theme,
+    # Data science themes
+    ChartTheme.VIRIDIS: _get_viridis_theme,
+    ChartTheme.PLASMA: _get_plasma_theme,
+    ChartTheme.INFERNO: _get_inferno_theme,
+    ChartTheme.MAGMA: _get_magma_theme,
+    ChartTheme.CIVIDIS: _get_cividis_theme,
+    ChartTheme.TURBO: _get_turbo_theme,
+}
+
+
+# Human-readable theme descriptions
+_THEME_DESCRIPTIONS = {
+    ChartTheme.CLASSIC: "Classic - Professional grey/neutral (default)",
+    ChartTheme.DARK: "Dark - Dark grey background with light text",
+    ChartTheme.MIDNIGHT: "Midnight - Elegant night sky with deep navy and white/gold",
+    ChartTheme.NEON: "Neon - Cyberpunk aesthetic with bright neon colors",
+    ChartTheme.SEPIA: "Sepia - Vintage aged paper with warm browns",
+    ChartTheme.PASTEL: "Pastel - Soft gentle colors, light and airy",
+    ChartTheme.CELESTIAL: "Celestial - Cosmic galaxy with deep purples and gold",
+    # Data science themes
+    ChartTheme.VIRIDIS: "Viridis - Perceptually uniform purple→green→yellow (colorblind-friendly)",
+    ChartTheme.PLASMA: "Plasma - Vibrant blue→purple→orange→yellow gradient",
+    ChartTheme.INFERNO: "Inferno - Dramatic black→red→orange→yellow fire palette",
+    ChartTheme.MAGMA: "Magma - Subtle black→purple→pink→yellow volcanic palette",
+    ChartTheme.CIVIDIS: "Cividis - Blue→yellow palette optimized for color vision deficiency",
+    ChartTheme.TURBO: "Turbo - Google's improved rainbow (high contrast)",
+}
+
+
 def get_theme_description(theme: ChartTheme) -> str:
     """
     Get a human-readable description of a theme.
@@ -846,20 +926,4 @@ def get_theme_description(theme: ChartTheme) -> str:
     Returns:
         Description string
     """
-    descriptions = {
-        ChartTheme.CLASSIC: "Classic - Professional grey/neutral (default)",
-        ChartTheme.DARK: "Dark - Dark grey background with light text",
-        ChartTheme.MIDNIGHT: "Midnight - Elegant night sky with deep navy and white/gold",
-        ChartTheme.NEON: "Neon - Cyberpunk aesthetic with bright neon colors",
-        ChartTheme.SEPIA: "Sepia - Vintage aged paper with warm browns",
-        ChartTheme.PASTEL: "Pastel - Soft gentle colors, light and airy",
-        ChartTheme.CELESTIAL: "Celestial - Cosmic galaxy with deep purples and gold",
-        # Data science themes
-        ChartTheme.VIRIDIS: "Viridis - Perceptually uniform purple→green→yellow (colorblind-friendly)",
-        ChartTheme.PLASMA: "Plasma - Vibrant blue→purple→orange→yellow gradient",
-        ChartTheme.INFERNO: "Inferno - Dramatic black→red→orange→yellow fire palette",
-        ChartTheme.MAGMA: "Magma - Subtle black→purple→pink→yellow volcanic palette",
-        ChartTheme.CIVIDIS: "Cividis - Blue→yellow palette optimized for color vision deficiency",
-        ChartTheme.TURBO: "Turbo - Google's improved rainbow (high contrast)",
-    }
-    return descriptions.get(theme, "Unknown theme")
+    return _THEME_DESCRIPTIONS.get(theme, "Unknown theme")
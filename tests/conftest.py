@@ -63,7 +63,6 @@ import datetime as dt
 from typing import Generator
 
 import pytest
-import pytz
 
 from starlight.core.builder import ChartBuilder
 from starlight.core.models import (
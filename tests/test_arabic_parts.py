@@ -3,7 +3,6 @@
 import datetime as dt
 
 import pytest
-import pytz
 
 from starlight.components.arabic_parts import (
     ARABIC_PARTS_CATALOG,
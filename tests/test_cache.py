@@ -0,0 +1,96 @@
+"""
+Tests for the file-based cache (starlight.utils.cache).
+
+Cache hits and misses are checked by counting calls to the wrapped
+function, so a broken cache fails the suite instead of only showing up as
+slower timings.
+"""
+
+import pytest
+
+from starlight.utils.cache import Cache, cached
+
+
+@pytest.fixture
+def cache(tmp_path) -> Cache:
+    """Create a cache in a temporary directory."""
+    return Cache(cache_dir=str(tmp_path / "cache"))
+
+
+def _counting(cache: Cache):
+    """Build a cached function that records every real call."""
+    calls = []
+
+    @cached(cache_type="general", cache_instance=cache)
+    def square(value):
+        calls.append(value)
+        return value * value
+
+    return square, calls
+
+
+# ============================================================================
+# CACHE HIT / MISS TESTS
+# ============================================================================
+
+
+class TestCachedDecorator:
+    """Tests for the @cached decorator."""
+
+    def test_cache_hit(self, cache):
+        """Test that a repeated call is served from the cache."""
+        square, calls = _counting(cache)
+
+        assert square(12) == 144
+        assert square(12) == 144
+        assert calls == [12]
+
+    def test_cache_miss_for_new_arguments(self, cache):
+        """Test that different arguments are computed and cached separately."""
+        square, calls = _counting(cache)
+
+        square(2)
+        square(3)
+        square(2)
+
+        assert calls == [2, 3]
+        assert cache.size("general") == {"general": 2}
+
+    def test_disabled_cache_always_computes(self, cache):
+        """Test that a disabled cache calls through every time."""
+        cache.enabled = False
+        square, calls = _counting(cache)
+
+        square(5)
+        square(5)
+
+        assert calls == [5, 5]
+        assert cache.size("general") == {"general": 0}
+
+    def test_expired_entry_is_recomputed(self, tmp_path):
+        """Test that entries older than max_age are ignored."""
+        cache = Cache(cache_dir=str(tmp_path / "cache"), max_age_seconds=-1)
+        square, calls = _counting(cache)
+
+        square(7)
+        square(7)
+
+        assert calls == [7, 7]
+
+
+class TestCache:
+    """Tests for the Cache class."""
+
+    def test_clear(self, cache):
+        """Test that clear removes entries and reports how many."""
+        square, calls = _counting(cache)
+        square(1)
+        square(2)
+
+        assert cache.clear("general") == 2
+        square(1)
+        assert calls == [1, 2, 1]
+
+    def test_get_missing_key(self, cache):
+        """Test that an unknown key is a cache miss."""
+        assert cache.get("general", "missing") is None
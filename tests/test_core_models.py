@@ -3,7 +3,6 @@
 import datetime as dt
 
 import pytest
-import pytz
 
 from starlight.core.models import (
     CelestialPosition,
@@ -13,7 +13,6 @@ This test suite covers:
 import datetime as dt
 
 import pytest
-import pytz
 
 from starlight.core.builder import ChartBuilder
 from starlight.core.models import CelestialPosition, ChartDateTime, ChartLocation, ObjectType
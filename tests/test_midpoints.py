@@ -3,7 +3,6 @@
 import datetime as dt
 
 import pytest
-import pytz
 
 from starlight.components.midpoints import MidpointCalculator
 from starlight.core.builder import ChartBuilder
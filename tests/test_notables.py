@@ -7,7 +7,6 @@ OPTIMIZED VERSION - uses dicts with timezone to avoid slow TimezoneFinder lookup
 from datetime import datetime
 
 import pytest
-import pytz
 
 from starlight.core.builder import ChartBuilder
 from starlight.core.models import ChartDateTime, ChartLocation
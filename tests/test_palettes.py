@@ -24,6 +24,7 @@ from starlight.visualization.palettes import (
     get_contrast_ratio,
     get_luminance,
     get_palette_colors,
+    get_palette_colors_rgb,
     get_palette_description,
     get_planet_glyph_color,
     get_planet_glyph_palette_description,
@@ -114,6 +115,15 @@ class TestZodiacPalette:
         # Since it's cached, should be same object
         assert colors1 is colors2
 
+    def test_palette_colors_rgb_match_hex(self):
+        """Test that RGB palette colors match the hex palette in order."""
+        for palette in (ZodiacPalette.RAINBOW, "single_color:#336699"):
+            rgb = get_palette_colors_rgb(palette)
+            assert rgb == tuple(hex_to_rgb(c) for c in get_palette_colors(palette))
+            assert rgb is get_palette_colors_rgb(palette)
+
+        assert get_palette_colors_rgb("single_color:#336699")[0] == (51, 102, 153)
+
     def test_get_palette_description(self):
         """Test palette description strings."""
         desc = get_palette_description(ZodiacPalette.GREY)
@@ -484,7 +494,6 @@ class TestSignAndPlanetMappings:
         """Test that all 12 signs have element mappings."""
         assert len(SIGN_ELEMENTS) == 12
         for i in range(12):
-            assert i in SIGN_ELEMENTS
             assert SIGN_ELEMENTS[i] in ("fire", "earth", "air", "water")
 
     def test_sign_elements_pattern(self):
@@ -498,7 +507,6 @@ class TestSignAndPlanetMappings:
         """Test that all 12 signs have modality mappings."""
         assert len(SIGN_MODALITIES) == 12
         for i in range(12):
-            assert i in SIGN_MODALITIES
             assert SIGN_MODALITIES[i] in ("cardinal", "fixed", "mutable")
 
     def test_sign_modalities_pattern(self):
@@ -563,6 +571,11 @@ class TestPaletteEdgeCases:
         # Should return 12 colors (fallback behavior)
         assert len(colors) == 12
 
+    def test_palette_plain_string_value(self):
+        """Test that a palette's string value finds the same colors as the enum."""
+        for palette in ZodiacPalette:
+            assert get_palette_colors(palette.value) == get_palette_colors(palette)
+
     def test_aspect_palette_fallback(self):
         """Test aspect palette fallback behavior."""
         # Invalid palette should fall back to classic
@@ -29,8 +29,21 @@ from starlight.core.models import (
 )
 from starlight.core.native import Native
 from starlight.engines.houses import PlacidusHouses, WholeSignHouses
+from starlight.visualization.builder import ChartDrawBuilder
 from starlight.visualization.core import ChartRenderer, get_display_name, get_glyph
-from starlight.visualization.drawing import draw_chart
+from starlight.visualization import svg_writer
+from starlight.visualization.drawing import (
+    _create_extended_drawing,
+    draw_chart,
+    draw_chart_with_multiple_houses,
+    draw_charts_batch,
+    make_chart_renderer,
+)
+from starlight.visualization.extended_canvas import (
+    AspectarianLayer,
+    HouseCuspTableLayer,
+    PositionTableLayer,
+)
 from starlight.visualization.layers import (
     AngleLayer,
     AspectCountsLayer,
@@ -43,7 +56,8 @@ from starlight.visualization.layers import (
     ZodiacLayer,
 )
 from starlight.visualization.palettes import ZodiacPalette
-from starlight.visualization.themes import ChartTheme
+from starlight.visualization.svg_writer import FastSVGWriter, circle_path, fmt
+from starlight.visualization.themes import ChartTheme, get_theme_style
 
 
 # ============================================================================
@@ -125,6 +139,17 @@ class TestChartRenderer:
         renderer = ChartRenderer(rotation=90)
         assert renderer.rotation == 90
 
+    def test_apply_padding_scales_radii_in_place(self, renderer):
+        """Test that apply_padding shrinks every radius in the same dict."""
+        radii = renderer.radii
+        original = dict(radii)
+
+        renderer.apply_padding(0.95)
+
+        assert renderer.radii is radii
+        for key, value in original.items():
+            assert radii[key] == pytest.approx(value * 0.95)
+
     def test_radii_calculation(self, renderer):
         """Test that radii are properly calculated."""
         assert "outer_border" in renderer.radii
@@ -174,6 +199,25 @@ class TestChartRenderer:
         assert isinstance(x, float)
         assert isinstance(y, float)
 
+    def test_polar_to_cartesian_reuses_angle_across_radii(self, renderer):
+        """Test that the cached unit vector still honors radius and offsets."""
+        x1, y1 = renderer.polar_to_cartesian(180, 100)
+        renderer.x_offset = 50
+        x2, y2 = renderer.polar_to_cartesian(180, 200)
+
+        assert abs(x1 - (renderer.center + 100)) < 0.1
+        assert abs(x2 - (renderer.center + 250)) < 0.1
+        assert y1 == pytest.approx(y2)
+
+    def test_set_offset_updates_center_xy(self, renderer):
+        """Test that offsets and the precomputed chart center stay in sync."""
+        renderer.set_offset(450, 0)
+        assert renderer.center_xy == (450 + renderer.center, renderer.center)
+
+        renderer.y_offset = 20
+        assert renderer.x_offset == 450
+        assert renderer.center_xy == (450 + renderer.center, 20 + renderer.center)
+
     def test_create_svg_drawing(self, renderer, temp_output_dir):
         """Test SVG drawing creation."""
         filepath = os.path.join(temp_output_dir, "test.svg")
@@ -182,6 +226,16 @@ class TestChartRenderer:
         assert dwg is not None
         assert isinstance(dwg, svgwrite.Drawing)
 
+    def test_create_svg_drawing_without_border(self, temp_output_dir):
+        """Test that a zero border width skips the border circles."""
+        renderer = ChartRenderer(style_config={"border_width": 0})
+        dwg = renderer.create_svg_drawing(
+            os.path.join(temp_output_dir, "test.svg"), FastSVGWriter
+        )
+
+        assert not renderer.has_border()
+        assert "<circle" not in dwg.tostring()
+
     def test_astrological_to_svg_angle(self, renderer):
         """Test astrological to SVG angle conversion."""
         # 0° Aries should map to 180° SVG (9 o'clock)
@@ -195,6 +249,17 @@ class TestChartRenderer:
         # With 90° rotation, 90° astrological should map to 180° SVG
         assert isinstance(svg_angle, (int, float))
 
+    def test_theme_style_is_a_fresh_copy(self):
+        """Test that modifying a renderer's theme style leaves the theme intact."""
+        renderer = ChartRenderer(theme=ChartTheme.DARK)
+        renderer.style["zodiac"]["ring_color"] = "#123456"
+        renderer.style["aspects"].clear()
+
+        style = get_theme_style(ChartTheme.DARK)
+        assert style is not renderer.style
+        assert style["zodiac"]["ring_color"] != "#123456"
+        assert style["aspects"]
+
 
 # ============================================================================
 # HELPER FUNCTION TESTS
@@ -515,6 +580,61 @@ class TestChartShapeLayer:
         assert mock_dwg.add.called
 
 
+# ============================================================================
+# EXTENDED CANVAS LAYER TESTS
+# ============================================================================
+
+
+class TestExtendedCanvasLayers:
+    """Tests for the position table, house cusp table and aspectarian layers."""
+
+    def test_render_into_one_group(self, renderer, test_chart):
+        """Test that each layer adds a single translated group of texts."""
+        for layer in (PositionTableLayer(), HouseCuspTableLayer(), AspectarianLayer()):
+            dwg = FastSVGWriter()
+            layer.render(renderer, dwg, test_chart)
+            body = dwg.body()
+
+            assert body.startswith('<g transform="translate(0, 0)">')
+            assert body.endswith("</g>")
+            assert "<text" in body
+
+    def test_empty_selection_renders_nothing(self, renderer, test_chart):
+        """Test that tables skip rendering when no objects pass the filter."""
+        dwg = FastSVGWriter()
+        for layer in (
+            PositionTableLayer(object_types=["fixed_star"]),
+            AspectarianLayer(object_types=["fixed_star"]),
+        ):
+            layer.render(renderer, dwg, test_chart)
+
+        assert dwg.body() == ""
+
+    def test_aspectarian_one_glyph_per_aspect(self, renderer):
+        """Test that each aspect between selected planets fills one cell."""
+        native = Native(
+            dt.datetime(2000, 1, 1, 12, 0, tzinfo=dt.UTC),
+            ChartLocation(0, 0, "Test", "UTC"),
+        )
+        chart = ChartBuilder.from_native(native).with_aspects().calculate()
+        planets = {
+            p.name for p in chart.positions if p.object_type == ObjectType.PLANET
+        }
+        expected = {
+            frozenset((a.object1.name, a.object2.name))
+            for a in chart.aspects
+            if a.object1.name in planets and a.object2.name in planets
+        }
+
+        dwg = FastSVGWriter()
+        AspectarianLayer(object_types=["planet"]).render(renderer, dwg, chart)
+        # Aspect cells are the <tspan>s of the last <text> in the layer
+        cells = dwg.body().rsplit("<text ", 1)[1]
+
+        assert expected
+        assert cells.count("<tspan") == len(expected)
+
+
 # ============================================================================
 # INTEGRATION TESTS - draw_chart()
 # ============================================================================
@@ -558,6 +678,22 @@ class TestDrawChart:
 
         assert os.path.exists(filepath)
 
+    def test_draw_chart_with_multiple_houses_themed(self, test_chart, temp_output_dir):
+        """Test the multi-house overlay resolves theme palettes."""
+        filepath = os.path.join(temp_output_dir, "test_multi_house.svg")
+        result = draw_chart_with_multiple_houses(
+            test_chart, filename=filepath, theme="midnight"
+        )
+
+        assert result == filepath
+        assert os.path.exists(filepath)
+
+    def test_draw_chart_invalid_extended_canvas(self, test_chart, temp_output_dir):
+        """Test that an unknown extended canvas mode is rejected."""
+        filepath = os.path.join(temp_output_dir, "test_bad_canvas.svg")
+        with pytest.raises(ValueError, match="extended_canvas"):
+            draw_chart(test_chart, filename=filepath, extended_canvas="above")
+
     def test_draw_chart_with_info(self, test_chart, temp_output_dir):
         """Test chart drawing with chart info."""
         filepath = os.path.join(temp_output_dir, "test_info.svg")
@@ -638,6 +774,207 @@ class TestDrawChart:
 
         assert os.path.exists(filepath)
 
+    def test_draw_chart_leaves_chart_equality_intact(self, test_chart, temp_output_dir):
+        """Test that caching drawable positions doesn't change the chart."""
+        before = repr(test_chart)
+        draw_chart(test_chart, filename=os.path.join(temp_output_dir, "a.svg"))
+        draw_chart(test_chart, filename=os.path.join(temp_output_dir, "b.svg"))
+
+        assert repr(test_chart) == before
+        assert test_chart == test_chart
+
+    def test_extended_canvas_tables_reuse_cached_objects(
+        self, test_chart, temp_output_dir
+    ):
+        """Test that table objects are cached per chart and match each redraw."""
+        first = os.path.join(temp_output_dir, "first.svg")
+        second = os.path.join(temp_output_dir, "second.svg")
+        draw_chart(test_chart, filename=first, extended_canvas="right")
+        cache = dict(test_chart.__dict__["_table_objects"])
+        draw_chart(test_chart, filename=second, extended_canvas="right")
+
+        assert test_chart.__dict__["_table_objects"] == cache
+        with open(first) as f1, open(second) as f2:
+            assert f1.read() == f2.read()
+
+    def test_extended_chrome_follows_coord_precision(self, monkeypatch):
+        """Test that the cached canvas chrome is re-serialized per precision."""
+        renderer = Mock(
+            radii={"outer_border": 288.123456},
+            style={
+                "background_color": "#FFFFFF",
+                "border_color": "#000000",
+                "border_width": 1,
+            },
+            center_xy=(300.123456, 300.0),
+        )
+        renderer.has_border.return_value = True
+
+        body = _create_extended_drawing(renderer, "a.svg", 800, 600).body()
+        assert 'cx="300.12"' in body
+
+        monkeypatch.setattr(svg_writer, "COORD_PRECISION", 4)
+        body = _create_extended_drawing(renderer, "a.svg", 800, 600).body()
+        assert 'cx="300.1235"' in body
+        assert 'r="288.1235"' in body
+
+    def test_aspectarian_grid_is_one_path(self, test_chart, temp_output_dir):
+        """Test that aspectarian cell outlines are drawn as a single path."""
+        filepath = os.path.join(temp_output_dir, "aspectarian.svg")
+        draw_chart(test_chart, filename=filepath, extended_canvas="right")
+
+        with open(filepath) as f:
+            svg = f.read()
+
+        assert 'stroke-width="0.5" width="24"' not in svg
+        assert svg.count('stroke-width="0.5" />') >= 1
+        assert "h24v24h-24z" in svg
+
+    def test_draw_chart_missing_house_system(self, test_chart, temp_output_dir, capsys):
+        """Test that unknown house systems are skipped with a warning."""
+        filepath = os.path.join(temp_output_dir, "test_missing_houses.svg")
+        draw_chart(test_chart, filename=filepath, house_systems="Koch")
+
+        assert os.path.exists(filepath)
+        assert "House system 'Koch' not found" in capsys.readouterr().out
+
+
+class TestMakeChartRenderer:
+    """Tests for make_chart_renderer batch helper."""
+
+    def test_renders_with_bound_options(self, test_chart, temp_output_dir):
+        """Test that the bound renderer draws charts with fixed options."""
+        render = make_chart_renderer(theme="dark", chart_info=True)
+        filepath = os.path.join(temp_output_dir, "batch.svg")
+
+        assert render(test_chart, filepath) == filepath
+        assert os.path.exists(filepath)
+
+    def test_rejects_bad_options_up_front(self):
+        """Test that invalid options fail before any chart is drawn."""
+        with pytest.raises(TypeError, match="not_an_option"):
+            make_chart_renderer(not_an_option=True)
+        with pytest.raises(ValueError, match="extended_canvas"):
+            make_chart_renderer(extended_canvas="above")
+
+
+class TestDrawChartsBatch:
+    """Tests for draw_charts_batch."""
+
+    def test_draws_every_chart(self, test_chart, temp_output_dir):
+        """Test that each chart is written to its own file, in order."""
+        filenames = [os.path.join(temp_output_dir, f"batch_{i}.svg") for i in range(2)]
+
+        result = draw_charts_batch(
+            [test_chart, test_chart], filenames, max_workers=1, theme="dark"
+        )
+
+        assert result == filenames
+        assert all(os.path.exists(f) for f in filenames)
+
+    def test_rejects_mismatched_lengths(self, test_chart):
+        """Test that charts and filenames must line up."""
+        with pytest.raises(ValueError, match="filenames"):
+            draw_charts_batch([test_chart], ["a.svg", "b.svg"])
+
+
+class TestChartDrawBuilder:
+    """Tests for the fluent ChartDrawBuilder API."""
+
+    def test_spec_round_trip(self, test_chart):
+        """Test that to_spec/from_spec reproduce the same draw options."""
+        import json
+
+        builder = (
+            test_chart.draw("spec.svg")
+            .preset_detailed()
+            .with_zodiac_palette()
+            .with_house_systems(["Placidus"])
+        )
+        spec = json.loads(json.dumps(builder.to_spec()))
+
+        restored = ChartDrawBuilder.from_spec(test_chart, spec)
+
+        assert restored._build_options() == builder._build_options()
+
+    def test_from_spec_rejects_unknown_options(self, test_chart):
+        """Test that from_spec refuses options the builder doesn't know."""
+        with pytest.raises(ValueError, match="not_an_option"):
+            ChartDrawBuilder.from_spec(test_chart, {"not_an_option": 1})
+
+    def test_cache_key_ignores_filename(self, test_chart):
+        """Test that cache keys depend on options but not the output file."""
+        key_a = test_chart.draw("a.svg").preset_standard().cache_key()
+        key_b = test_chart.draw("b.svg").preset_standard().cache_key()
+        key_c = test_chart.draw("c.svg").preset_minimal().cache_key()
+
+        assert key_a == key_b
+        assert key_a != key_c
+        hash(key_a)
+
+
+class TestFastSVGWriter:
+    """Tests for the streaming svgwrite-compatible writer."""
+
+    @staticmethod
+    def _draw(dwg):
+        """Exercise every element type the chart layers use."""
+        dwg.add(dwg.rect(insert=(0, 0), size=("100px", "100px"), fill="#FFFFFF"))
+        dwg.add(dwg.circle(center=(50, 50), r=40.5, fill="none", stroke_width=1))
+        dwg.add(dwg.line(start=(1.5, 2), end=(3, 4.25), stroke_dasharray="3,3"))
+        dwg.add(dwg.path(d="M 1,2 L 3,4 Z", fill="red", opacity=0.95))
+        dwg.add(dwg.image(href="data:image/svg+xml;a&b", insert=(1, 2), size=(8, 8)))
+        dwg.add(dwg.text('Sun & "Moon" <℞>', insert=(5, 6), text_anchor="middle"))
+        spans = dwg.text("", dominant_baseline="middle")
+        spans.add(dwg.tspan("☉", insert=(7, 8.5), fill="#000000"))
+        dwg.add(spans)
+        group = dwg.g(transform="translate(10, 10)")
+        group.add(dwg.circle(center=(0, 0), r=5))
+        dwg.add(group)
+        # Children added after the group itself still belong to it
+        late = dwg.add(dwg.g(fill="blue"))
+        late.add(dwg.rect(insert=(2, 2), size=(4, 4)))
+
+    def test_matches_svgwrite_output(self):
+        """Test that the writer serializes like svgwrite (short floats)."""
+        options = {
+            "size": ("100px", "100px"),
+            "viewBox": "0 0 100 100",
+            "profile": "full",
+        }
+        expected = svgwrite.Drawing("a.svg", **options)
+        actual = FastSVGWriter("a.svg", **options)
+        self._draw(expected)
+        self._draw(actual)
+
+        assert actual.tostring() == expected.tostring()
+
+    def test_float_attributes_are_rounded(self):
+        """Test that float coordinates are capped at COORD_PRECISION."""
+        dwg = FastSVGWriter("a.svg")
+        circle = dwg.circle(center=(300.0, 123.456789), r=288.0000001)
+
+        assert circle.tostring() == '<circle cx="300" cy="123.46" r="288" />'
+        assert fmt(-0.001) == "0"
+        assert fmt(2) == "2"
+
+    def test_circle_path(self):
+        """Test that circle_path draws a closed circle from two half arcs."""
+        assert circle_path(50, 40, 10.5) == (
+            "M 39.5,40 a 10.5,10.5 0 1,0 21,0 a 10.5,10.5 0 1,0 -21,0 Z"
+        )
+
+    def test_save_writes_file(self, temp_output_dir):
+        """Test that save() writes a complete SVG document."""
+        filepath = os.path.join(temp_output_dir, "fast.svg")
+        dwg = FastSVGWriter(filepath, size=("10px", "10px"))
+        dwg.add(dwg.circle(center=(5, 5), r=4))
+        dwg.save()
+
+        content = Path(filepath).read_text(encoding="utf-8")
+        assert content.startswith("<?xml")
+        assert content.endswith("</svg>")
+
 
 # ============================================================================
 # EDGE CASE TESTS